@@ -0,0 +1,138 @@
+"""
+DFA compilado a partir da função de transição do PDA (DeltaFinal)
+
+O PDA de palavras-chave nunca consulta a pilha, então suas transições
+formam um autômato finito determinístico. Aqui ele é minimizado (Moore),
+os estados viram inteiros e cada estado ganha uma linha de 256 entradas,
+de modo que reconhecer uma palavra custa uma indexação de lista por caractere.
+"""
+
+REJEITA = -1
+TAMANHO_LINHA = 256
+
+
+class DFA:
+    """Autômato finito determinístico com tabela de transição densa"""
+
+    def __init__(self, tabela, saidas, nomes, inicial):
+        # tabela[linha + ord(c)] = início da linha do próximo estado (ou REJEITA)
+        self.tabela = tabela
+        self.saidas = saidas          # estado -> tipo de token (None se não aceita)
+        self.nomes = nomes            # estado -> nome de um estado original do PDA
+        self.inicial = inicial
+
+    def executar(self, palavra):
+        """
+        Executa o DFA sobre a palavra
+
+        Returns:
+            Estado final (inteiro) se a palavra for aceita, senão REJEITA
+        """
+        tabela = self.tabela
+        linha = self.inicial * TAMANHO_LINHA
+        for char in palavra:
+            codigo = ord(char)
+            if codigo >= TAMANHO_LINHA:
+                return REJEITA
+            linha = tabela[linha + codigo]
+            if linha < 0:
+                return REJEITA
+        estado = linha // TAMANHO_LINHA
+        return estado if self.saidas[estado] is not None else REJEITA
+
+    def token(self, palavra):
+        """Retorna o tipo de token reconhecido ou None"""
+        estado = self.executar(palavra)
+        return None if estado == REJEITA else self.saidas[estado]
+
+    def __len__(self):
+        return len(self.saidas)
+
+    def __repr__(self):
+        return f"DFA({len(self.saidas)} estados)"
+
+
+def compilar_dfa(delta, inicial, finais, saida_por_estado, alfabeto=None):
+    """
+    Compila a função de transição do PDA em um DFA mínimo
+
+    Args:
+        delta: Dicionário (estado, símbolo, topo) -> (novo_estado, empilhado)
+        inicial: Estado inicial do PDA
+        finais: Estados de aceitação
+        saida_por_estado: Estado final -> tipo de token
+        alfabeto: Símbolos de entrada aceitos (None = todos os de delta)
+
+    Returns:
+        DFA
+    """
+    # Transições determinísticas, ignorando a pilha
+    transicoes = {}
+    for (estado, simbolo, _), (destino, _) in delta.items():
+        if simbolo is None or (alfabeto is not None and simbolo not in alfabeto):
+            continue
+        if not isinstance(simbolo, str) or len(simbolo) != 1 or ord(simbolo) >= TAMANHO_LINHA:
+            continue
+        transicoes.setdefault(estado, {})[simbolo] = destino
+
+    finais = set(finais)
+
+    def saida(estado):
+        return saida_por_estado.get(estado) if estado in finais else None
+
+    # Estados alcançáveis a partir do inicial
+    alcancaveis = [inicial]
+    vistos = {inicial}
+    for estado in alcancaveis:
+        for destino in transicoes.get(estado, {}).values():
+            if destino not in vistos:
+                vistos.add(destino)
+                alcancaveis.append(destino)
+
+    # Remove estados que nunca chegam a aceitar (ex.: o sumidouro 'Z')
+    uteis = {e for e in alcancaveis if saida(e) is not None}
+    mudou = True
+    while mudou:
+        mudou = False
+        for estado in alcancaveis:
+            if estado not in uteis and any(d in uteis for d in transicoes.get(estado, {}).values()):
+                uteis.add(estado)
+                mudou = True
+    estados = [e for e in alcancaveis if e in uteis or e == inicial]
+    simbolos = sorted({s for e in estados for s in transicoes.get(e, {})})
+
+    # Minimização de Moore: partição inicial pela saída (tipo de token)
+    bloco = {e: saida(e) for e in estados}
+    while True:
+        assinaturas = {}
+        novo = {}
+        for e in estados:
+            trans = transicoes.get(e, {})
+            assinatura = (bloco[e],) + tuple(
+                bloco[trans[s]] if trans.get(s) in bloco else REJEITA for s in simbolos
+            )
+            novo[e] = assinaturas.setdefault(assinatura, len(assinaturas))
+        if len(set(novo.values())) == len(set(bloco.values())):
+            bloco = novo
+            break
+        bloco = novo
+
+    # Renumera na ordem de descoberta (o estado inicial é o primeiro, logo 0)
+    ordem = {}
+    for e in estados:
+        ordem.setdefault(bloco[e], len(ordem))
+    n = len(ordem)
+
+    tabela = [REJEITA] * (n * TAMANHO_LINHA)
+    saidas = [None] * n
+    nomes = [None] * n
+    for e in estados:
+        i = ordem[bloco[e]]
+        saidas[i] = saida(e)
+        if nomes[i] is None or e in finais:
+            nomes[i] = e
+        for simbolo, destino in transicoes.get(e, {}).items():
+            if destino in bloco:
+                tabela[i * TAMANHO_LINHA + ord(simbolo)] = ordem[bloco[destino]] * TAMANHO_LINHA
+
+    return DFA(tabela, saidas, nomes, 0)
@@ -0,0 +1,408 @@
+"""
+Árvore Sintática Abstrata (AST)
+Nós produzidos pelas ações semânticas do parser SLR
+
+Comandos (CMD): Sequence, Declaration, Assignment, If, While, For,
+InputOutput, Return, Module
+Expressões (EXPR/TERM/FACTOR/UNARY): BinaryOp, Not, Number, Variable, Member
+Alvos de atribuição (LHS): Variable, Member
+
+Todos os nós usam __slots__; Arena oferece uma codificação compacta da árvore
+em colunas array('q'), útil para guardar muitas árvores em memória (os
+endereços depth/slot resolvidos pela análise semântica não são codificados).
+"""
+
+from array import array
+
+
+class Node:
+    """Nó base da AST"""
+    __slots__ = ("line",)
+    _fields = ()                  # Campos filhos, na ordem do construtor
+    _types = ()                   # Tipo de cada campo: 'node', 'nodes', 'str' ou 'int'
+
+    def children(self):
+        """Gera os nós filhos diretos"""
+        for field, kind in zip(self._fields, self._types):
+            value = getattr(self, field)
+            if kind == "node":
+                yield value
+            elif kind == "nodes":
+                yield from value
+
+    def __eq__(self, other):
+        # Comparação iterativa: cadeias longas de BinaryOp não esgotam a pilha
+        pending = [(self, other)]
+        while pending:
+            a, b = pending.pop()
+            if type(a) is not type(b) or a.line != b.line:
+                return False
+            for field, kind in zip(a._fields, a._types):
+                x, y = getattr(a, field), getattr(b, field)
+                if kind == "node":
+                    pending.append((x, y))
+                elif kind == "nodes":
+                    if len(x) != len(y):
+                        return False
+                    pending.extend(zip(x, y))
+                elif x != y:
+                    return False
+        return True
+
+    __hash__ = None
+
+    def __repr__(self):
+        campos = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({campos}, line={self.line})"
+
+
+# ============================================================================
+# EXPRESSÕES
+# ============================================================================
+
+class Expression(Node):
+    """Base das expressões: str() gera a forma textual totalmente parentizada"""
+    __slots__ = ()
+
+    def _parts(self):
+        """Pedaços do texto em ordem: strings e subexpressões"""
+        return ()
+
+    def __str__(self):
+        # Iterativo, pelo mesmo motivo de __eq__
+        out = []
+        pending = [self]
+        while pending:
+            item = pending.pop()
+            if type(item) is str:
+                out.append(item)
+            else:
+                pending.extend(reversed(item._parts()))
+        return "".join(out)
+
+
+class Number(Expression):
+    """FACTOR -> num"""
+    __slots__ = ("value",)
+    _fields = ("value",)
+    _types = ("int",)
+
+    def __init__(self, value, line=0):
+        self.value = value
+        self.line = line
+
+    def _parts(self):
+        return (str(self.value),)
+
+
+class Variable(Expression):
+    """FACTOR -> id e LHS -> assign id"""
+    __slots__ = ("name", "depth", "slot")
+    _fields = ("name",)
+    _types = ("str",)
+
+    def __init__(self, name, line=0, depth=None, slot=None):
+        self.name = name
+        self.line = line
+        self.depth = depth        # Endereço resolvido pela análise semântica:
+        self.slot = slot          # profundidade do escopo e índice do símbolo nele
+
+    def _parts(self):
+        return (self.name,)
+
+
+class Member(Expression):
+    """FACTOR -> HIM . id e LHS -> HIM . id"""
+    __slots__ = ("name", "depth", "slot")
+    _fields = ("name",)
+    _types = ("str",)
+
+    def __init__(self, name, line=0, depth=None, slot=None):
+        self.name = name
+        self.line = line
+        self.depth = depth        # Endereço resolvido pela análise semântica:
+        self.slot = slot          # profundidade do escopo e índice do símbolo nele
+
+    def _parts(self):
+        return (f"HIM.{self.name}",)
+
+
+class BinaryOp(Expression):
+    """EXPR -> TERM EXPR' (operadores +, -, ANRK, AAN, KO; associativos à esquerda)"""
+    __slots__ = ("op", "left", "right")
+    _fields = ("op", "left", "right")
+    _types = ("str", "node", "node")
+
+    def __init__(self, op, left, right, line=0):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+
+    def _parts(self):
+        return ("(", self.left, f" {self.op} ", self.right, ")")
+
+
+class Not(Expression):
+    """UNARY -> NUST TERM"""
+    __slots__ = ("operand",)
+    _fields = ("operand",)
+    _types = ("node",)
+
+    def __init__(self, operand, line=0):
+        self.operand = operand
+        self.line = line
+
+    def _parts(self):
+        return ("(NOT ", self.operand, ")")
+
+
+# ============================================================================
+# COMANDOS
+# ============================================================================
+
+class Sequence(Node):
+    """S -> CMD ; S | CMD"""
+    __slots__ = ("commands",)
+    _fields = ("commands",)
+    _types = ("nodes",)
+
+    def __init__(self, commands, line=0):
+        self.commands = commands
+        self.line = line
+
+
+class Declaration(Node):
+    """CMD -> FUS id := EXPR"""
+    __slots__ = ("name", "value", "depth", "slot")
+    _fields = ("name", "value")
+    _types = ("str", "node")
+
+    def __init__(self, name, value, line=0, depth=None, slot=None):
+        self.name = name
+        self.value = value
+        self.line = line
+        self.depth = depth        # Endereço do símbolo declarado (ver Variable)
+        self.slot = slot
+
+
+class Assignment(Node):
+    """CMD -> LHS := EXPR"""
+    __slots__ = ("target", "value")
+    _fields = ("target", "value")
+    _types = ("node", "node")
+
+    def __init__(self, target, value, line=0):
+        self.target = target      # Variable ou Member
+        self.value = value
+        self.line = line
+
+
+class If(Node):
+    """CMD -> LOS EXPR CMD"""
+    __slots__ = ("condition", "body")
+    _fields = ("condition", "body")
+    _types = ("node", "node")
+
+    def __init__(self, condition, body, line=0):
+        self.condition = condition
+        self.body = body
+        self.line = line
+
+
+class While(Node):
+    """CMD -> FOD CMD FAH EXPR"""
+    __slots__ = ("body", "condition")
+    _fields = ("body", "condition")
+    _types = ("node", "node")
+
+    def __init__(self, body, condition, line=0):
+        self.body = body
+        self.condition = condition
+        self.line = line
+
+
+class For(Node):
+    """CMD -> FAH CMD FAH EXPR"""
+    __slots__ = ("body", "condition")
+    _fields = ("body", "condition")
+    _types = ("node", "node")
+
+    def __init__(self, body, condition, line=0):
+        self.body = body
+        self.condition = condition
+        self.line = line
+
+
+class InputOutput(Node):
+    """CMD -> IO id (op é 'HON' para entrada ou 'print' para saída)"""
+    __slots__ = ("op", "name", "depth", "slot")
+    _fields = ("op", "name")
+    _types = ("str", "str")
+
+    def __init__(self, op, name, line=0, depth=None, slot=None):
+        self.op = op
+        self.name = name
+        self.line = line
+        self.depth = depth        # Endereço do símbolo lido/escrito (ver Variable)
+        self.slot = slot
+
+
+class Return(Node):
+    """CMD -> JUN EXPR"""
+    __slots__ = ("value",)
+    _fields = ("value",)
+    _types = ("node",)
+
+    def __init__(self, value, line=0):
+        self.value = value
+        self.line = line
+
+
+class Module(Node):
+    """CMD -> KEL id CMD"""
+    __slots__ = ("name", "body", "size", "scope")
+    _fields = ("name", "body")
+    _types = ("str", "node")
+
+    def __init__(self, name, body, line=0, size=0, scope=None):
+        self.name = name
+        self.body = body
+        self.line = line
+        self.size = size          # Quantidade de símbolos do escopo do módulo
+        self.scope = scope        # Scope aberto por enter_module (não codificado)
+
+
+# Código de cada classe na Arena
+NODE_TYPES = (Number, Variable, Member, BinaryOp, Not, Sequence, Declaration,
+              Assignment, If, While, For, InputOutput, Return, Module)
+NODE_KINDS = {cls: kind for kind, cls in enumerate(NODE_TYPES)}
+
+
+# Operando que marca um inteiro fora de 64 bits: vem seguido do índice dele
+# em Arena.integers (o próprio -2**63 também é guardado assim)
+_INTEIRO_GRANDE = -2 ** 63
+
+
+class Arena:
+    """
+    Codificação compacta da AST (struct-of-arrays)
+
+    Cada nó é uma linha em kinds/lines/starts; seus operandos ficam em
+    operands a partir de starts[i]: índice do nó filho, id da string em
+    strings ou o próprio inteiro. Campos 'nodes' guardam a quantidade
+    seguida dos índices; inteiros que não cabem em 64 bits ficam em integers
+    (ver _INTEIRO_GRANDE). Os filhos sempre precedem o pai (pós-ordem).
+    """
+
+    def __init__(self):
+        self.kinds = array('b')       # Código do tipo do nó (NODE_KINDS)
+        self.lines = array('i')       # Linha no código fonte
+        self.starts = array('i')      # Início dos operandos do nó em operands
+        self.operands = array('q')
+        self.strings = []             # Nomes e operadores internados
+        self.integers = []            # Literais fora do intervalo de array('q')
+        self._string_ids = {}
+
+    def _string_id(self, text):
+        sid = self._string_ids.get(text)
+        if sid is None:
+            sid = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return sid
+
+    def encode(self, root):
+        """Acrescenta a árvore à arena e retorna o índice da raiz"""
+        # Pós-ordem iterativa: árvores profundas não esgotam a pilha do Python
+        pending = [(root, False)]
+        index = {}
+        while pending:
+            node, visited = pending.pop()
+            if not visited:
+                pending.append((node, True))
+                pending.extend((child, False) for child in node.children())
+                continue
+
+            ops = []
+            for field, kind in zip(node._fields, node._types):
+                value = getattr(node, field)
+                if kind == "node":
+                    ops.append(index[id(value)])
+                elif kind == "nodes":
+                    ops.append(len(value))
+                    ops.extend(index[id(child)] for child in value)
+                elif kind == "str":
+                    ops.append(self._string_id(value))
+                elif _INTEIRO_GRANDE < value < -_INTEIRO_GRANDE:
+                    ops.append(value)
+                else:
+                    ops.append(_INTEIRO_GRANDE)
+                    ops.append(len(self.integers))
+                    self.integers.append(value)
+
+            index[id(node)] = len(self.kinds)
+            self.kinds.append(NODE_KINDS[type(node)])
+            self.lines.append(node.line)
+            self.starts.append(len(self.operands))
+            self.operands.extend(ops)
+        return index[id(root)]
+
+    def _campos(self, j):
+        """Classe do nó j e o valor bruto de cada campo (índices de filhos)"""
+        cls = NODE_TYPES[self.kinds[j]]
+        operands = self.operands
+        pos = self.starts[j]
+        campos = []
+        for kind in cls._types:
+            value = operands[pos]
+            pos += 1
+            if kind == "nodes":
+                value, pos = operands[pos:pos + value].tolist(), pos + value
+            elif kind == "str":
+                value = self.strings[value]
+            elif kind == "int" and value == _INTEIRO_GRANDE:
+                value, pos = self.integers[operands[pos]], pos + 1
+            campos.append(value)
+        return cls, campos
+
+    def decode(self, i):
+        """
+        Reconstrói o nó i e sua subárvore como objetos Node
+
+        Só os nós da subárvore são visitados (pós-ordem iterativa a partir de
+        i), então o custo não depende da posição de i na arena.
+        """
+        decoded = {}
+        pending = [(i, None, None)]
+        while pending:
+            j, cls, campos = pending.pop()
+            if cls is None:
+                cls, campos = self._campos(j)
+                pending.append((j, cls, campos))
+                for kind, value in zip(cls._types, campos):
+                    if kind == "node":
+                        pending.append((value, None, None))
+                    elif kind == "nodes":
+                        pending.extend((k, None, None) for k in value)
+                continue
+
+            args = []
+            for kind, value in zip(cls._types, campos):
+                if kind == "node":
+                    value = decoded[value]
+                elif kind == "nodes":
+                    value = [decoded[k] for k in value]
+                args.append(value)
+            decoded[j] = cls(*args, line=self.lines[j])
+        return decoded[i]
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def nbytes(self):
+        """Memória ocupada pelas colunas (sem contar as strings)"""
+        return sum(col.itemsize * len(col) for col in
+                   (self.kinds, self.lines, self.starts, self.operands))
+
+    def __repr__(self):
+        return f"Arena({len(self)} nós, {self.nbytes()} bytes)"
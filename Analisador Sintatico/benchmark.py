@@ -0,0 +1,430 @@
+"""
+Benchmarks do Analisador
+Mede léxico, parser e tabela de símbolos sobre programas sintéticos
+
+GeradorProgramas deriva programas aleatórios das produções de
+regrasSintáticas.txt (lidas por gerador_slr.ler_producoes), com perfis que
+forçam os casos caros de cada fase:
+
+    misto   todos os comandos, aninhamento e expressões moderados
+    kel     cadeias profundas de KEL id KEL id ... CMD (escopos aninhados)
+    expr    expressões longas (cadeias EXPR' -> OP TERM EXPR')
+    fus     só declarações FUS (tabela de símbolos e avisos de não uso)
+
+Os programas só usam variáveis globais já declaradas, então são aceitos sem
+erros e o tempo medido é o do caminho normal. Os lexemas são separados por
+espaços e os comandos por ';' e quebra de linha, o que serve tanto ao
+lexer.Lexer quanto ao main.PDALexerAdapter.
+
+Cada caso é executado algumas vezes (vale o melhor tempo) e mais uma vez sob
+tracemalloc para o pico de memória, que não entra na cronometragem. Os
+resultados podem ser gravados em JSON e comparados com uma execução anterior:
+
+    python benchmark.py --salvar base.json
+    python benchmark.py --comparar base.json      # sai com 1 se houver regressão
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from gerador_slr import GRAMATICA_PADRAO, ler_producoes
+from lexer import Lexer
+from main import PDALexerAdapter
+from parser_integrated import SLRParserWithSemantics, ParseContext
+from symbol_table import SymbolTable
+
+OPERADORES = ("+", "-", "ANRK", "AAN", "KO")
+COMANDOS = ("FUS", "assign", "LOS", "FOD", "FAH", "IO", "JUN", "KEL")
+
+# Perfil -> parâmetros de GeradorProgramas
+PERFIS = {
+    "misto": {"profundidade_kel": 4, "tamanho_expr": 4},
+    "kel": {"profundidade_kel": 16, "pesos": {"KEL": 1}},
+    "expr": {"tamanho_expr": 16, "pesos": {"FUS": 1, "assign": 1}},
+    "fus": {"pesos": {"FUS": 1}},
+}
+
+TAMANHOS = (100, 1000, 10000)     # Comandos por programa (símbolos no caso da tabela)
+
+
+class GeradorProgramas:
+    """
+    Deriva programas aleatórios (e válidos) das produções da gramática
+
+    A derivação é mais à esquerda, com uma pilha explícita (10 mil comandos
+    encadeados em S -> CMD ; S não esgotam a recursão). Em cada não-terminal
+    _escolher sorteia uma das suas produções lidas por gerador_slr; os
+    parâmetros só limitam o sorteio (quantos comandos, KEL encadeados,
+    termos numa expressão), e os terminais id e num recebem nomes e valores
+    que mantêm o programa semanticamente correto.
+    """
+
+    def __init__(self, seed=0, profundidade_kel=4, tamanho_expr=4, pesos=None,
+                 aninhamento=3, gramatica=GRAMATICA_PADRAO):
+        """
+        Args:
+            seed: Semente do gerador (mesma semente, mesmo programa)
+            profundidade_kel: Máximo de KEL encadeados num comando
+            tamanho_expr: Máximo de termos numa expressão
+            pesos: Comando -> peso no sorteio (padrão: todos iguais);
+                comandos de COMANDOS ausentes nunca são sorteados
+            aninhamento: Máximo de LOS/FOD/FAH encaixados
+            gramatica: Arquivo da gramática em BNF
+        """
+        with open(gramatica, encoding="utf-8") as f:
+            producoes = ler_producoes(f.read())
+        self.producoes = {}           # Não-terminal -> lados direitos, na ordem do arquivo
+        for lhs, rhs in producoes:
+            self.producoes.setdefault(lhs, []).append(rhs)
+        # Comando -> produção de CMD que começa por ele (LHS := EXPR é o assign)
+        self.por_comando = {("assign" if rhs[0] == "LHS" else rhs[0]): rhs
+                            for rhs in self.producoes["CMD"]}
+
+        self.random = random.Random(seed)
+        self.profundidade_kel = profundidade_kel
+        self.tamanho_expr = tamanho_expr
+        self.aninhamento = aninhamento
+        pesos = dict.fromkeys(COMANDOS, 1) if pesos is None else pesos
+        self.comandos = [c for c in COMANDOS if pesos.get(c)]
+        self.pesos = [pesos[c] for c in self.comandos]
+        self.globais = []             # Variáveis globais já declaradas
+        self.n_nomes = 0
+
+        # Estado da derivação em curso
+        self.restantes = 0            # Comandos de nível superior ainda a derivar
+        self.nivel = 0                # Encaixe em LOS/FOD/FAH (aninhamento: nenhum)
+        self.em_modulo = False        # Declarações no corpo de um KEL não são globais
+        self.kel_restantes = 0        # KEL ainda a encadear no comando atual
+        self.termos = []              # Termos restantes de cada EXPR aberta
+        self.tamanho_subexpr = None   # Termos da próxima EXPR (entre parênteses)
+        self.declarada = None         # Nome da variável do FUS em curso
+
+    def programa(self, n_comandos):
+        """Código fonte com n_comandos comandos de nível superior (S -> CMD ; S)"""
+        self.restantes = n_comandos
+        return self.derivar("S").replace(" ; ", " ;\n")
+
+    def derivar(self, simbolo):
+        """Lexemas de uma derivação de simbolo, separados por espaços"""
+        producoes = self.producoes
+        saida = []
+        pilha = [simbolo]
+        while pilha:
+            item = pilha.pop()
+            if type(item) is tuple:
+                self._fechar(*item)
+            elif item in producoes:
+                rhs, fim = self._escolher(item)
+                if fim is not None:
+                    pilha.append(fim)
+                pilha.extend(reversed(rhs))
+            else:
+                saida.append(self._lexema(item, saida[-1] if saida else None))
+        return " ".join(saida)
+
+    def _nome(self, prefixo):
+        self.n_nomes += 1
+        return f"{prefixo}{self.n_nomes}"
+
+    def _escolher(self, lhs):
+        """
+        Produção sorteada para lhs e a marca que fecha seu contexto (ou None),
+        desempilhada depois de todo o lado direito
+        """
+        alternativas = self.producoes[lhs]
+        sorteio = self.random.random()
+
+        if lhs == "S":
+            self.restantes -= 1
+            return max(alternativas, key=len) if self.restantes > 0 else min(alternativas, key=len), None
+        if lhs == "CMD":
+            return self._comando()
+        if lhs == "EXPR":
+            tamanho = self.tamanho_subexpr or self.random.randint(1, self.tamanho_expr)
+            self.tamanho_subexpr = None
+            self.termos.append(tamanho - 1)
+            return alternativas[0], None
+        if lhs == "EXPR'":
+            # OP TERM EXPR' enquanto houver termos; senão ε fecha a EXPR
+            if self.termos[-1]:
+                self.termos[-1] -= 1
+                return max(alternativas, key=len), None
+            self.termos.pop()
+            return min(alternativas, key=len), None
+        if lhs == "LHS":
+            return next(rhs for rhs in alternativas if rhs[0] == "assign"), None
+        if lhs == "TERM":
+            return next(rhs for rhs in alternativas if (rhs[0] == "UNARY") == (sorteio < 0.1)), None
+        if lhs == "FACTOR":
+            # HIM . id só vale dentro de módulos e fica de fora
+            if sorteio < 0.05:
+                self.tamanho_subexpr = self.random.randint(1, 3)
+                primeiro = "("
+            elif self.globais and sorteio < 0.55:
+                primeiro = "id"
+            else:
+                primeiro = "num"
+            return next(rhs for rhs in alternativas if rhs[0] == primeiro), None
+        return self.random.choice(alternativas), None
+
+    def _comando(self):
+        """CMD sorteado pelos pesos, respeitando aninhamento e cadeias de KEL"""
+        fim = None
+        if self.kel_restantes:
+            self.kel_restantes -= 1
+            tipo = "KEL"
+        else:
+            tipo = self.random.choices(self.comandos, self.pesos)[0]
+            if tipo in ("LOS", "FOD", "FAH", "KEL") and self.nivel >= self.aninhamento:
+                tipo = "FUS"
+            if tipo in ("assign", "IO") and not self.globais:
+                tipo = "FUS"
+
+            if tipo in ("LOS", "FOD", "FAH"):
+                fim = (self.nivel, self.em_modulo)
+                self.nivel += 1
+            elif tipo == "KEL":
+                # KEL id KEL id ... CMD: o corpo declara só no escopo do módulo
+                fim = (self.nivel, self.em_modulo)
+                self.kel_restantes = self.random.randint(1, self.profundidade_kel) - 1
+                self.nivel = self.aninhamento
+                self.em_modulo = True
+
+        if tipo == "FUS":
+            # O valor não enxerga a própria variável: ela entra em globais no fim
+            self.declarada = self._nome("v")
+            if not self.em_modulo:
+                fim = (self.nivel, self.em_modulo, self.declarada)
+        return self.por_comando[tipo], fim
+
+    def _fechar(self, nivel, em_modulo, declarada=None):
+        """Fim do lado direito de um CMD: restaura o contexto anterior a ele"""
+        self.nivel = nivel
+        self.em_modulo = em_modulo
+        if declarada is not None:
+            self.globais.append(declarada)
+
+    def _lexema(self, terminal, anterior):
+        """Lexema de um terminal; anterior é o último lexema gerado"""
+        if terminal == "num":
+            return str(self.random.randint(0, 999))
+        if terminal != "id":
+            return terminal
+        if anterior == "FUS":
+            return self.declarada
+        if anterior == "KEL":
+            return self._nome("m")
+        return self.random.choice(self.globais)
+
+
+def carga_tabela(n_simbolos, profundidade=8):
+    """
+    Operações típicas da análise sobre uma SymbolTable
+
+    A cada profundidade símbolos, um é declarado no escopo global e os
+    demais em escopos aninhados um dentro do outro; cada declaração é
+    seguida de buscas pelo próprio nome, pelo global do bloco e pelo
+    primeiro global. No fim, check_unused_symbols percorre todos os escopos.
+
+    Returns:
+        Quantidade de operações executadas
+    """
+    tabela = SymbolTable()
+    operacoes = 0
+    bloco = "v0"
+    for i in range(n_simbolos):
+        nome = f"v{i}"
+        if i % profundidade == 0:
+            while tabela.current_scope is not tabela.global_scope:
+                tabela.exit_scope()
+                operacoes += 1
+            bloco = nome
+        else:
+            tabela.enter_scope(f"m{i}")
+            operacoes += 1
+        tabela.declare(nome, line=i)
+        tabela.lookup(nome, line=i)
+        tabela.lookup(bloco, line=i)
+        tabela.lookup("v0", line=i)
+        operacoes += 4
+    tabela.check_unused_symbols()
+    return operacoes + 1
+
+
+# ============================================================================
+# MEDIÇÃO
+# ============================================================================
+
+def medir(funcao, repeticoes=3):
+    """
+    Melhor tempo de funcao() em repeticoes execuções e pico de memória
+    alocada numa execução extra sob tracemalloc
+
+    Como em timeit, o coletor de lixo fica desligado durante a cronometragem
+    (as coletas dependem do que restou de execuções anteriores e só
+    acrescentariam ruído).
+
+    Returns:
+        (segundos, pico_bytes, retorno da última execução)
+    """
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        gc.collect()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            retorno = funcao()
+            melhor = min(melhor, time.perf_counter() - inicio)
+        finally:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return melhor, pico, retorno
+
+
+def _resultado(caso, tamanho, itens, segundos, pico):
+    return {"caso": caso, "tamanho": tamanho, "itens": itens, "segundos": segundos,
+            "itens_por_s": itens / segundos if segundos else 0.0, "pico_bytes": pico}
+
+
+def executar(tamanhos=TAMANHOS, perfis=tuple(PERFIS), repeticoes=3, seed=0, casos=None):
+    """
+    Roda os benchmarks e retorna a lista de resultados
+
+    Para cada perfil e tamanho: lexer (Lexer.tokenize), pda
+    (PDALexerAdapter.tokenize) e parser (SLRParserWithSemantics.parse sobre
+    os tokens do Lexer), com itens = tokens. O caso tabela roda carga_tabela
+    com itens = operações.
+
+    Args:
+        casos: Prefixos de caso a executar (ex: ['parser/kel']); None: todos
+    """
+    def escolhido(caso):
+        return casos is None or any(caso.startswith(prefixo) for prefixo in casos)
+
+    adaptador = PDALexerAdapter()
+    parser = SLRParserWithSemantics(verbose=False)
+    resultados = []
+
+    for perfil in perfis:
+        if not any(escolhido(f"{fase}/{perfil}") for fase in ("lexer", "pda", "parser")):
+            continue
+        for tamanho in tamanhos:
+            fonte = GeradorProgramas(seed, **PERFIS[perfil]).programa(tamanho)
+            tokens = Lexer(fonte).tokenize()
+            medidas = (
+                ("lexer", lambda: Lexer(fonte).tokenize()),
+                ("pda", lambda: adaptador.tokenize(fonte)),
+                ("parser", lambda: parser.parse(tokens, ParseContext())),
+            )
+            for fase, funcao in medidas:
+                caso = f"{fase}/{perfil}"
+                if escolhido(caso):
+                    segundos, pico, _ = medir(funcao, repeticoes)
+                    resultados.append(_resultado(caso, tamanho, len(tokens), segundos, pico))
+
+    if escolhido("tabela"):
+        for tamanho in tamanhos:
+            segundos, pico, operacoes = medir(lambda: carga_tabela(tamanho), repeticoes)
+            resultados.append(_resultado("tabela", tamanho, operacoes, segundos, pico))
+    return resultados
+
+
+# ============================================================================
+# RELATÓRIOS
+# ============================================================================
+
+def imprimir(resultados):
+    """Tabela de resultados no console"""
+    print(f"{'Caso':<16} {'Tamanho':>8} {'Itens':>10} {'Tempo (s)':>10} "
+          f"{'Itens/s':>12} {'Pico (KiB)':>11}")
+    print("-" * 72)
+    for r in resultados:
+        print(f"{r['caso']:<16} {r['tamanho']:>8} {r['itens']:>10} {r['segundos']:>10.4f} "
+              f"{r['itens_por_s']:>12,.0f} {r['pico_bytes'] / 1024:>11,.0f}")
+
+
+def salvar(resultados, caminho, seed=0):
+    """Grava os resultados em JSON, com a versão do Python e a plataforma"""
+    dados = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": seed,
+        "resultados": resultados,
+    }
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+
+
+def comparar(resultados, caminho, tolerancia=0.10):
+    """
+    Compara a vazão (itens/s) com a de uma execução gravada por salvar()
+
+    Casos com vazão menor que (1 - tolerancia) vezes a anterior são
+    marcados como regressão.
+
+    Returns:
+        Lista de (caso, tamanho) com regressão
+    """
+    with open(caminho, encoding="utf-8") as arquivo:
+        anteriores = {(r["caso"], r["tamanho"]): r for r in json.load(arquivo)["resultados"]}
+
+    print(f"{'Caso':<16} {'Tamanho':>8} {'Antes/s':>12} {'Agora/s':>12} {'Variação':>9}")
+    print("-" * 61)
+    regressoes = []
+    for r in resultados:
+        chave = (r["caso"], r["tamanho"])
+        anterior = anteriores.get(chave)
+        if anterior is None or not anterior["itens_por_s"]:
+            continue
+        razao = r["itens_por_s"] / anterior["itens_por_s"]
+        marca = ""
+        if razao < 1 - tolerancia:
+            regressoes.append(chave)
+            marca = "  REGRESSÃO"
+        print(f"{r['caso']:<16} {r['tamanho']:>8} {anterior['itens_por_s']:>12,.0f} "
+              f"{r['itens_por_s']:>12,.0f} {razao - 1:>+9.1%}{marca}")
+    return regressoes
+
+
+def main(argv=None):
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    argumentos.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS),
+                            help="comandos por programa (padrão: %(default)s)")
+    argumentos.add_argument("--perfis", nargs="+", choices=list(PERFIS), default=list(PERFIS))
+    argumentos.add_argument("--casos", nargs="+",
+                            help="prefixos de caso a executar (ex: parser tabela lexer/kel)")
+    argumentos.add_argument("--repeticoes", type=int, default=3)
+    argumentos.add_argument("--seed", type=int, default=0)
+    argumentos.add_argument("--salvar", metavar="ARQUIVO", help="grava os resultados em JSON")
+    argumentos.add_argument("--comparar", metavar="ARQUIVO",
+                            help="compara com resultados gravados por --salvar")
+    argumentos.add_argument("--tolerancia", type=float, default=0.10,
+                            help="queda de vazão tolerada na comparação (padrão: %(default)s)")
+    args = argumentos.parse_args(argv)
+
+    resultados = executar(args.tamanhos, args.perfis, args.repeticoes, args.seed, args.casos)
+    imprimir(resultados)
+    if args.salvar:
+        salvar(resultados, args.salvar, args.seed)
+    if args.comparar:
+        print()
+        if comparar(resultados, args.comparar, args.tolerancia):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Compilador de Bytecode
+Traduz a AST do programa para um vetor de inteiros executado por vm.py
+
+Formato: cada instrução é um opcode seguido de seus operandos inteiros
+(índice de constante, slot de variável ou endereço de desvio). Sem funções
+nem recursão na linguagem, toda variável declarada recebe um slot fixo num
+único quadro; os nomes são resolvidos aqui, em tempo de compilação, com as
+mesmas regras de escopo da análise semântica (KEL abre um escopo).
+
+Semântica dos comandos:
+    FUS id := EXPR      declara e inicializa o slot de id
+    assign id := EXPR   atribui ao slot de id
+    HIM . id := EXPR    atribui ao id declarado no módulo atual
+    LOS EXPR CMD        executa CMD se EXPR != 0
+    FOD CMD FAH EXPR    executa CMD e repete enquanto EXPR != 0
+    FAH CMD FAH EXPR    executa CMD EXPR vezes (EXPR avaliada uma vez, antes)
+    HON id / print id   lê / escreve id pela E/S da máquina
+    JUN EXPR            encerra o programa retornando EXPR
+"""
+
+from array import array
+
+import ast_nodes
+
+# Opcodes (os sem operando ocupam uma única posição)
+LOAD_CONST = 0      # k       empilha consts[k]
+LOAD = 1            # slot    empilha slots[slot]
+STORE = 2           # slot    desempilha em slots[slot]
+ADD = 3
+SUB = 4
+AND = 5
+OR = 6
+NOT = 7
+IN = 8
+JUMP = 9            # destino
+JUMP_IF_FALSE = 10  # destino desempilha e desvia se for 0
+JUMP_IF_TRUE = 11   # destino desempilha e desvia se for != 0
+FOR_ITER = 12       # slot    (seguido do destino) sai se slots[slot] <= 0, senão decrementa
+INPUT = 13          # slot    slots[slot] = io.read(nome)
+PRINT = 14          # slot    io.write(nome, slots[slot])
+RETURN = 15         #         encerra retornando o topo da pilha
+HALT = 16           #         encerra retornando None
+
+OPCODES = ("LOAD_CONST", "LOAD", "STORE", "ADD", "SUB", "AND", "OR", "NOT", "IN",
+           "JUMP", "JUMP_IF_FALSE", "JUMP_IF_TRUE", "FOR_ITER", "INPUT", "PRINT",
+           "RETURN", "HALT")
+# Quantidade de operandos de cada opcode
+OPERANDOS = (1, 1, 1, 0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 1, 1, 0, 0)
+
+OPERADORES = {"+": ADD, "-": SUB, "ANRK": AND, "AAN": OR, "KO": IN}
+
+
+class CompileError(Exception):
+    """Erro ao gerar bytecode (ex: variável não declarada)"""
+    def __init__(self, message, line):
+        self.message = message
+        self.line = line
+        super().__init__(f"Erro de compilação (linha {line}): {message}")
+
+
+class Program:
+    """Programa compilado: código, constantes e nomes dos slots"""
+    __slots__ = ("code", "consts", "slot_names")
+
+    def __init__(self, code, consts, slot_names):
+        self.code = code              # array('i') com opcodes e operandos
+        self.consts = consts          # Tupla de constantes
+        self.slot_names = slot_names  # Nome de cada slot (para E/S e depuração)
+
+    @property
+    def n_slots(self):
+        return len(self.slot_names)
+
+    def disassemble(self):
+        """Listagem legível do bytecode"""
+        linhas = []
+        code = self.code
+        pc = 0
+        while pc < len(code):
+            op = code[pc]
+            args = list(code[pc + 1:pc + 1 + OPERANDOS[op]])
+            texto = f"{pc:5} {OPCODES[op]:<14}"
+            if op == LOAD_CONST:
+                texto += f"{args[0]} ({self.consts[args[0]]!r})"
+            elif op in (LOAD, STORE, INPUT, PRINT, FOR_ITER):
+                texto += f"{args[0]} ({self.slot_names[args[0]]})"
+                if op == FOR_ITER:
+                    texto += f" -> {args[1]}"
+            elif args:
+                texto += str(args[0])
+            linhas.append(texto.rstrip())
+            pc += 1 + len(args)
+        return "\n".join(linhas)
+
+    def __repr__(self):
+        return f"Program({len(self.code)} palavras, {len(self.consts)} constantes, {self.n_slots} slots)"
+
+
+class BytecodeCompiler:
+    """Gera um Program a partir da AST (ParseContext.tree)"""
+
+    def __init__(self):
+        self.code = array('i')
+        self.consts = []
+        self.const_ids = {}
+        self.slot_names = []
+        self.visible = {}         # Nome -> pilha de slots visíveis
+        self.declared = [{}]      # Nome -> slot declarado, por escopo aberto
+
+    def compile(self, tree):
+        """Compila o programa inteiro e retorna o Program"""
+        self._command(tree)
+        self.code.append(HALT)
+        return Program(self.code, tuple(self.consts), tuple(self.slot_names))
+
+    # ------------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------------
+
+    def _emit(self, op, *args):
+        self.code.append(op)
+        self.code.extend(args)
+        return len(self.code) - 1          # Posição do último operando
+
+    def _patch(self, pos, target):
+        self.code[pos] = target
+
+    def _const(self, value):
+        k = self.const_ids.get(value)
+        if k is None:
+            k = self.const_ids[value] = len(self.consts)
+            self.consts.append(value)
+        return k
+
+    def _new_slot(self, name):
+        self.slot_names.append(name)
+        return len(self.slot_names) - 1
+
+    def _declare(self, name):
+        scope = self.declared[-1]
+        slot = scope.get(name)
+        if slot is not None:
+            return slot               # Redeclaração (já reportada): reaproveita o slot
+        slot = scope[name] = self._new_slot(name)
+        self.visible.setdefault(name, []).append(slot)
+        return slot
+
+    def _resolve(self, target):
+        if type(target) is ast_nodes.Member:
+            slot = self.declared[-1].get(target.name)   # HIM: só o módulo atual
+        else:
+            stack = self.visible.get(target.name)
+            slot = stack[-1] if stack else None
+        if slot is None:
+            raise CompileError(f"'{target}' não foi declarado", target.line)
+        return slot
+
+    # ------------------------------------------------------------------------
+    # Expressões (pós-ordem iterativa: cadeias longas não esgotam a pilha)
+    # ------------------------------------------------------------------------
+
+    def _expression(self, expr):
+        pending = [(expr, False)]
+        while pending:
+            node, visited = pending.pop()
+            kind = type(node)
+            if kind is ast_nodes.BinaryOp:
+                if visited:
+                    self._emit(OPERADORES[node.op])
+                else:
+                    pending.append((node, True))
+                    pending.append((node.right, False))
+                    pending.append((node.left, False))
+            elif kind is ast_nodes.Not:
+                if visited:
+                    self._emit(NOT)
+                else:
+                    pending.append((node, True))
+                    pending.append((node.operand, False))
+            elif kind is ast_nodes.Number:
+                self._emit(LOAD_CONST, self._const(node.value))
+            else:
+                self._emit(LOAD, self._resolve(node))
+
+    # ------------------------------------------------------------------------
+    # Comandos
+    # ------------------------------------------------------------------------
+
+    def _command(self, node):
+        kind = type(node)
+
+        if kind is ast_nodes.Sequence:
+            for cmd in node.commands:
+                self._command(cmd)
+
+        elif kind is ast_nodes.Declaration:
+            self._expression(node.value)        # O valor é avaliado antes de declarar
+            self._emit(STORE, self._declare(node.name))
+
+        elif kind is ast_nodes.Assignment:
+            self._expression(node.value)
+            self._emit(STORE, self._resolve(node.target))
+
+        elif kind is ast_nodes.If:
+            self._expression(node.condition)
+            skip = self._emit(JUMP_IF_FALSE, 0)
+            self._command(node.body)
+            self._patch(skip, len(self.code))
+
+        elif kind is ast_nodes.While:
+            start = len(self.code)
+            self._command(node.body)
+            self._expression(node.condition)
+            self._emit(JUMP_IF_TRUE, start)
+
+        elif kind is ast_nodes.For:
+            counter = self._new_slot("<contador>")
+            self._expression(node.condition)
+            self._emit(STORE, counter)
+            start = len(self.code)
+            exit_pos = self._emit(FOR_ITER, counter, 0)
+            self._command(node.body)
+            self._emit(JUMP, start)
+            self._patch(exit_pos, len(self.code))
+
+        elif kind is ast_nodes.InputOutput:
+            slot = self._resolve(ast_nodes.Variable(node.name, line=node.line))
+            self._emit(INPUT if node.op == "HON" else PRINT, slot)
+
+        elif kind is ast_nodes.Return:
+            self._expression(node.value)
+            self._emit(RETURN)
+
+        elif kind is ast_nodes.Module:
+            self.declared.append({})
+            self._command(node.body)
+            for name in self.declared.pop():
+                self.visible[name].pop()
+
+
+def compilar_bytecode(tree):
+    """Compila a AST do programa para um Program"""
+    return BytecodeCompiler().compile(tree)
@@ -0,0 +1,124 @@
+"""
+Diagnósticos
+Erros e avisos de todas as fases como registros estruturados
+
+Um Diagnostic guarda apenas o código, os argumentos da mensagem e a posição
+(linha, coluna e trecho [start, end) na fonte); o texto só é montado quando
+o diagnóstico é exibido (str() ou message), a partir do modelo do código em
+MENSAGENS. Criar um diagnóstico que ninguém lê (ex: avisos de variáveis não
+usadas num lote grande) custa só a alocação do objeto.
+
+Códigos por fase:
+    L   léxica                  S   sintática
+    M   semântica               G   geração de bytecode
+    X   execução                A   leitura de arquivos
+
+emitir_jsonl() grava os diagnósticos como JSON Lines, um objeto por linha,
+para ferramentas que não devem depender do texto das mensagens.
+"""
+
+import json
+import sys
+
+ERRO = "erro"
+AVISO = "aviso"
+
+# Código -> (severidade, modelo da mensagem). O modelo recebe os argumentos
+# posicionais do diagnóstico e os campos line e column; argumentos em tupla
+# são exibidos como lista ('a', 'b').
+MENSAGENS = {
+    "L001": (ERRO, "ERRO LÉXICO (Linha {line}, Coluna {column}): Caractere inválido '{0}'"),
+    "L002": (ERRO, "ERRO LÉXICO (Linha {line}, Coluna {column}): Comentário de bloco não fechado"),
+    "S001": (ERRO, "ERRO SINTATICO (Linha {line}): Token inesperado '{0}' (tipo: {1}); esperado: {2}"),
+    "S002": (ERRO, "ERRO SINTATICO (Linha {line}): GOTO({0}, {1}) não encontrado"),
+    "S003": (ERRO, "Erro em ação semântica: {0}"),
+    "S004": (ERRO, "ERRO FATAL: {0}"),
+    "M001": (ERRO, "Erro semântico (linha {line}): '{0}' já foi declarado em '{1}'"),
+    "M002": (ERRO, "Erro semântico (linha {line}): '{0}' não foi declarado"),
+    "M003": (AVISO, "Tentativa de sair do escopo global"),
+    "M004": (AVISO, "Aviso (linha {line}): variável '{0}' declarada mas não usada"),
+    "G001": (ERRO, "Erro de compilação (linha {line}): {0}"),
+    "X001": (ERRO, "Erro de execução (linha {line}): {0}"),
+    "X002": (ERRO, "Erro de execução (pc {1}): {0}"),
+    "A001": (ERRO, "ERRO DE LEITURA: {0}"),
+}
+
+
+class Diagnostic:
+    """Erro ou aviso com código, argumentos e posição; formatado sob demanda"""
+    __slots__ = ("code", "args", "line", "column", "start", "end")
+
+    def __init__(self, code, args=(), line=None, column=None, start=None, end=None):
+        self.code = code              # Chave em MENSAGENS (ex: 'M002')
+        self.args = args              # Argumentos da mensagem (tupla)
+        self.line = line              # Linha na fonte (None se desconhecida)
+        self.column = column          # Coluna na fonte, a partir de 1
+        self.start = start            # Posição do início do trecho na fonte
+        self.end = end                # Posição logo após o fim do trecho
+
+    @classmethod
+    def from_token(cls, code, token, *args):
+        """Diagnóstico apontando para o lexema de um Token"""
+        start = token.offset
+        end = None
+        if start is not None:
+            end = start if token.type == "$" else start + len(token.lexeme)
+        return cls(code, args, token.line, token.column or None, start, end)
+
+    @property
+    def severity(self):
+        """'erro' ou 'aviso'"""
+        return MENSAGENS[self.code][0]
+
+    @property
+    def message(self):
+        """Texto do diagnóstico (montado a cada acesso)"""
+        args = [", ".join(f"'{item}'" for item in arg) if type(arg) is tuple else arg
+                for arg in self.args]
+        return MENSAGENS[self.code][1].format(*args, line=self.line, column=self.column)
+
+    def __str__(self):
+        return self.message
+
+    def to_dict(self):
+        """Campos do diagnóstico e a mensagem formatada (serializável em JSON)"""
+        return {"severity": self.severity, "code": self.code, "message": self.message,
+                "line": self.line, "column": self.column, "start": self.start,
+                "end": self.end, "args": self.args}
+
+    def _key(self):
+        return (self.code, self.args, self.line, self.column, self.start, self.end)
+
+    def __eq__(self, other):
+        if type(other) is not Diagnostic:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __getstate__(self):
+        return self._key()
+
+    def __setstate__(self, estado):
+        for campo, valor in zip(self.__slots__, estado):
+            setattr(self, campo, valor)
+
+    def __repr__(self):
+        return f"Diagnostic({self.code}, L{self.line}, {self.args!r})"
+
+
+def emitir_jsonl(diagnostics, arquivo=None):
+    """
+    Grava os diagnósticos em JSON Lines (um objeto de to_dict() por linha)
+
+    Args:
+        diagnostics: Iterável de Diagnostic
+        arquivo: Arquivo de texto aberto para escrita (padrão: sys.stdout)
+    """
+    if arquivo is None:
+        arquivo = sys.stdout
+    dumps = json.dumps
+    for diagnostic in diagnostics:
+        arquivo.write(dumps(diagnostic.to_dict(), ensure_ascii=False, default=str))
+        arquivo.write("\n")
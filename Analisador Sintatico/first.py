@@ -1,13 +1,4 @@
-FIRST = {
-    "S'": {"LOS","FOD","FAH","JUN","KEL","FUS","HON","print","assign","HIM"},
-    "S": {"LOS","FOD","FAH","JUN","KEL","FUS","HON","print","assign","HIM"},
-    "CMD": {"LOS","FOD","FAH","JUN","KEL","FUS","HON","print","assign","HIM"},
-    "IO": {"HON","print"},
-    "LHS": {"assign","HIM"},
-    "EXPR": {"NUST","id","num","HIM","("},
-    "EXPR'": {"ε","+","-","ANRK","AAN","KO"},
-    "OP": {"+","-","ANRK","AAN","KO"},
-    "TERM": {"NUST","id","num","HIM","("},
-    "UNARY": {"NUST"},
-    "FACTOR": {"id","num","HIM","("}
-}
\ No newline at end of file
+"""Conjuntos FIRST, calculados por gerador_slr a partir de regrasSintáticas.txt"""
+from gerador_slr import carregar_gramatica
+
+FIRST = carregar_gramatica().FIRST
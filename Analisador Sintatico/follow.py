@@ -1,13 +1,4 @@
-FOLLOW = {
-    "S'": {"$"},
-    "S": {"$"},
-    "CMD": {";","$","FAH"},
-    "IO": {"id"},
-    "LHS": {":="},
-    "EXPR": {"LOS","FOD","FAH","JUN","KEL","FUS","HON","print","assign","HIM",";","$"," )"},
-    "EXPR'": {"LOS","FOD","FAH","JUN","KEL","FUS","HON","print","assign","HIM",";","$"," )"},
-    "OP": {"NUST","id","num","HIM","("},
-    "TERM": {"ε","+","-","ANRK","AAN","KO"},
-    "UNARY": {"ε","+","-","ANRK","AAN","KO"},
-    "FACTOR": {"ε","+","-","ANRK","AAN","KO"}
-}
+"""Conjuntos FOLLOW, calculados por gerador_slr a partir de regrasSintáticas.txt"""
+from gerador_slr import carregar_gramatica
+
+FOLLOW = carregar_gramatica().FOLLOW
@@ -0,0 +1,301 @@
+"""
+Gerador do Autômato LR(0) e das Tabelas SLR(1)
+Calcula closures, GOTO, FIRST e FOLLOW diretamente do texto da gramática
+
+Substitui as tabelas escritas à mão: ao estender a linguagem basta editar
+regrasSintáticas.txt e as tabelas são reconstruídas na próxima execução.
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+
+from tabelas import compilar_tabelas, ler_binario, salvar_binario, VERSAO_FORMATO
+
+_DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+GRAMATICA_PADRAO = os.path.join(_DIRETORIO, "regrasSintáticas.txt")
+CACHE_PADRAO = os.path.join(_DIRETORIO, "__pycache__")
+
+EPSILON = "ε"
+INICIO_AUMENTADO = "S'"
+
+
+class GrammarError(Exception):
+    """Exceção para gramáticas malformadas"""
+    pass
+
+
+def ler_producoes(texto):
+    """
+    Lê produções em BNF (A ::= x y | z, comentários /* */, ε para vazio)
+
+    Returns:
+        Lista de (lhs, rhs) com rhs como tupla (vazia para ε)
+    """
+    texto = re.sub(r"/\*.*?\*/", " ", texto, flags=re.S)
+    producoes = []
+    lhs = None
+
+    for linha in texto.splitlines():
+        linha = linha.strip()
+        if not linha:
+            continue
+
+        if "::=" in linha:
+            lhs, corpo = linha.split("::=", 1)
+            lhs = lhs.strip()
+        elif linha.startswith("|"):
+            if lhs is None:
+                raise GrammarError(f"Alternativa sem não-terminal: '{linha}'")
+            corpo = linha
+        else:
+            raise GrammarError(f"Linha inválida na gramática: '{linha}'")
+
+        for alternativa in corpo.split("|"):
+            simbolos = alternativa.split()
+            if not simbolos:
+                continue
+            producoes.append((lhs, tuple(s for s in simbolos if s != EPSILON)))
+
+    if not producoes:
+        raise GrammarError("Gramática vazia")
+
+    return producoes
+
+
+class AutomatoSLR:
+    """Autômato LR(0) canônico com conjuntos FIRST/FOLLOW e tabelas SLR(1)"""
+
+    def __init__(self, producoes):
+        inicio = producoes[0][0]
+        self.productions = [(INICIO_AUMENTADO, (inicio,))] + list(producoes)
+
+        self.nonterminals = []
+        for lhs, _ in self.productions:
+            if lhs not in self.nonterminals:
+                self.nonterminals.append(lhs)
+        nt_set = set(self.nonterminals)
+
+        self.terminals = sorted({s for _, rhs in self.productions for s in rhs if s not in nt_set} | {"$"})
+        self._t_bit = {t: 1 << i for i, t in enumerate(self.terminals)}
+
+        # Produções agrupadas pelo lado esquerdo
+        self._por_lhs = {nt: [] for nt in self.nonterminals}
+        for p, (lhs, _) in enumerate(self.productions):
+            self._por_lhs[lhs].append(p)
+
+        self._calcular_first()
+        self._calcular_follow()
+        self._construir_lr0()
+
+        self.FIRST = {nt: self._nomes(self._first[nt]) | ({EPSILON} if nt in self._nullable else set())
+                      for nt in self.nonterminals}
+        self.FOLLOW = {nt: self._nomes(self._follow[nt]) for nt in self.nonterminals}
+
+        reductions = {}
+        for state, itens in enumerate(self.states):
+            for p, dot in itens:
+                if dot == len(self.productions[p][1]) and p != 0:
+                    reductions.setdefault(state, []).append(p)
+
+        self.tables = compilar_tabelas(
+            self.productions, reductions, self.transitions, self.FOLLOW,
+            self.terminals, self.nonterminals,
+            accept_state=self.transitions[(0, inicio)]
+        )
+
+    def _nomes(self, bits):
+        """Converte um bitset de terminais em conjunto de nomes"""
+        return {t for t, b in self._t_bit.items() if bits & b}
+
+    # ------------------------------------------------------------------
+    # FIRST / FOLLOW (bitsets com ponto fixo por worklist)
+    # ------------------------------------------------------------------
+
+    def _first_seq(self, simbolos):
+        """FIRST de uma sequência: (bitset, anulável)"""
+        bits = 0
+        for s in simbolos:
+            if s in self._t_bit:
+                return bits | self._t_bit[s], False
+            bits |= self._first[s]
+            if s not in self._nullable:
+                return bits, False
+        return bits, True
+
+    def _calcular_first(self):
+        self._first = {nt: 0 for nt in self.nonterminals}
+        self._nullable = set()
+
+        # Produções que dependem de cada não-terminal no lado direito
+        dependentes = {nt: set() for nt in self.nonterminals}
+        for p, (_, rhs) in enumerate(self.productions):
+            for s in rhs:
+                if s in dependentes:
+                    dependentes[s].add(p)
+
+        pendentes = list(range(len(self.productions)))
+        na_fila = set(pendentes)
+        while pendentes:
+            p = pendentes.pop()
+            na_fila.discard(p)
+            lhs, rhs = self.productions[p]
+            bits, anulavel = self._first_seq(rhs)
+            mudou = False
+            if bits & ~self._first[lhs]:
+                self._first[lhs] |= bits
+                mudou = True
+            if anulavel and lhs not in self._nullable:
+                self._nullable.add(lhs)
+                mudou = True
+            if mudou:
+                for q in dependentes[lhs]:
+                    if q not in na_fila:
+                        na_fila.add(q)
+                        pendentes.append(q)
+
+    def _calcular_follow(self):
+        self._follow = {nt: 0 for nt in self.nonterminals}
+        self._follow[INICIO_AUMENTADO] = self._t_bit["$"]
+
+        # FOLLOW(lhs) ⊆ FOLLOW(B) quando B termina (a menos de anuláveis) a produção
+        arestas = {nt: set() for nt in self.nonterminals}
+        for lhs, rhs in self.productions:
+            for i, s in enumerate(rhs):
+                if s not in self._follow:
+                    continue
+                bits, anulavel = self._first_seq(rhs[i + 1:])
+                self._follow[s] |= bits
+                if anulavel and s != lhs:
+                    arestas[lhs].add(s)
+
+        pendentes = list(self.nonterminals)
+        while pendentes:
+            a = pendentes.pop()
+            for b in arestas[a]:
+                if self._follow[a] & ~self._follow[b]:
+                    self._follow[b] |= self._follow[a]
+                    pendentes.append(b)
+
+    # ------------------------------------------------------------------
+    # Coleção canônica LR(0)
+    # ------------------------------------------------------------------
+
+    def _closure(self, kernel):
+        itens = set(kernel)
+        pendentes = list(kernel)
+        while pendentes:
+            p, dot = pendentes.pop()
+            rhs = self.productions[p][1]
+            if dot < len(rhs) and rhs[dot] in self._por_lhs:
+                for q in self._por_lhs[rhs[dot]]:
+                    item = (q, 0)
+                    if item not in itens:
+                        itens.add(item)
+                        pendentes.append(item)
+        return frozenset(itens)
+
+    def _construir_lr0(self):
+        inicial = frozenset({(0, 0)})
+        self.kernels = [inicial]
+        self.states = [self._closure(inicial)]
+        self.transitions = {}
+        por_kernel = {inicial: 0}
+
+        state = 0
+        while state < len(self.states):
+            avancos = {}
+            for p, dot in self.states[state]:
+                rhs = self.productions[p][1]
+                if dot < len(rhs):
+                    avancos.setdefault(rhs[dot], set()).add((p, dot + 1))
+
+            for simbolo in sorted(avancos):
+                kernel = frozenset(avancos[simbolo])
+                destino = por_kernel.get(kernel)
+                if destino is None:
+                    destino = len(self.states)
+                    por_kernel[kernel] = destino
+                    self.kernels.append(kernel)
+                    self.states.append(self._closure(kernel))
+                self.transitions[(state, simbolo)] = destino
+            state += 1
+
+    def itens(self, state):
+        """Itens do estado no formato 'A -> α . β' (para depuração)"""
+        linhas = []
+        for p, dot in sorted(self.states[state]):
+            lhs, rhs = self.productions[p]
+            simbolos = list(rhs[:dot]) + ["."] + list(rhs[dot:])
+            linhas.append(f"{lhs} -> {' '.join(simbolos)}")
+        return linhas
+
+    def __repr__(self):
+        return f"AutomatoSLR({len(self.states)} estados, {len(self.productions)} produções)"
+
+
+@lru_cache(maxsize=None)
+def _gerar(texto):
+    return AutomatoSLR(ler_producoes(texto))
+
+
+def carregar_gramatica(caminho=GRAMATICA_PADRAO):
+    """
+    Gera (ou reaproveita do cache em memória) o autômato SLR(1) da gramática
+
+    Args:
+        caminho: Arquivo da gramática em BNF
+
+    Returns:
+        AutomatoSLR
+    """
+    with open(caminho, encoding="utf-8") as f:
+        return _gerar(f.read())
+
+
+def tabelas_em_cache(caminho=GRAMATICA_PADRAO, diretorio=CACHE_PADRAO):
+    """
+    Carrega as tabelas do cache binário, gerando-as apenas se a gramática mudou
+
+    O arquivo de cache é identificado pelo hash da gramática, então editar
+    regrasSintáticas.txt invalida o cache automaticamente.
+
+    Args:
+        caminho: Arquivo da gramática em BNF
+        diretorio: Diretório do cache (None desativa o cache em disco)
+
+    Returns:
+        ParseTables
+    """
+    with open(caminho, "rb") as f:
+        dados = f.read()
+
+    if diretorio is None:
+        return _gerar(dados.decode("utf-8")).tables
+
+    chave = hashlib.sha256(dados + bytes([VERSAO_FORMATO])).hexdigest()[:16]
+    arquivo = os.path.join(diretorio, f"tabelas-slr-{chave}.bin")
+
+    try:
+        return ler_binario(arquivo)
+    except (OSError, ValueError):
+        pass
+
+    tables = _gerar(dados.decode("utf-8")).tables
+    try:
+        os.makedirs(diretorio, exist_ok=True)
+        salvar_binario(tables, arquivo)
+    except OSError:
+        pass  # Sem permissão de escrita: segue com as tabelas em memória
+    return tables
+
+
+if __name__ == "__main__":
+    automato = carregar_gramatica()
+    print(automato)
+    print(automato.tables)
+    for state in range(len(automato.states)):
+        print(f"\nEstado {state}:")
+        for item in automato.itens(state):
+            print(f"  {item}")
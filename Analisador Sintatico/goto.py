@@ -1,191 +0,0 @@
-transitions = {
-    (0,"S"): 1,
-    (0,"CMD"): 2,
-    (0,"LOS"): 3,
-    (0,"FOD"): 4,
-    (0,"FAH"): 5,
-    (0,"IO"): 6,
-    (0,"JUN"): 7,
-    (0,"LHS"): 8,
-    (0,"KEL"): 9,
-    (0,"FUS"): 10,
-    (0,"HON"): 11,
-    (0,"print"): 12,
-    (0,"assign"): 13,
-    (0,"HIM"): 14,
-    (2, ";" ): 15,
-    (3, "EXPR"): 16,
-    (3, "TERM"): 17,
-    (3, "UNARY"): 18,
-    (3, "FACTOR"): 19,
-    (3, "NUST"): 20,
-    (3, "id"): 21,
-    (3, "num"): 22,
-    (3, "HIM"): 23,
-    (3, "("): 24,
-    (4, "CMD"): 25,
-    (4, "LOS"): 3,
-    (4, "FOD"): 4,
-    (4, "FAH"): 5,
-    (4, "IO"): 6,
-    (4, "JUN"): 7,
-    (4, "LHS"): 8,
-    (4, "KEL"): 9,
-    (4, "FUS"): 10,
-    (4, "HON"): 11,
-    (4, "print"): 12,
-    (4, "assign"): 13,
-    (4, "HIM"): 14,
-    (5, "CMD"): 26,
-    (5, "LOS"): 3,
-    (5, "FOD"): 4,
-    (5, "FAH"): 5,
-    (5, "IO"): 6,
-    (5, "JUN"): 7,
-    (5, "LHS"): 8,
-    (5, "KEL"): 9,
-    (5, "FUS"): 10,
-    (5, "HON"): 11,
-    (5, "print"): 12,
-    (5, "assign"): 13,
-    (5, "HIM"): 14,
-    (6, "id"): 27,
-    (7, "EXPR"): 28,
-    (7, "TERM"): 17,
-    (7, "UNARY"): 18,
-    (7, "FACTOR"): 19,
-    (7, "NUST"): 20,
-    (7, "id"): 21,
-    (7, "num"): 22,
-    (7, "HIM"): 23,
-    (7, "("): 24,
-    (8, ":="): 29,
-    (9, "id"): 30,
-    (10, "id"): 31,
-    (13, "id"): 32,
-    (14, "."): 33,
-    (15, "S"): 34,
-    (15, "CMD"): 2,
-    (15, "LOS"): 3,
-    (15, "FOD"): 4,
-    (15, "FAH"): 5,
-    (15, "IO"): 6,
-    (15, "JUN"): 7,
-    (15, "LHS"): 8,
-    (15, "KEL"): 9,
-    (15, "FUS"): 10,
-    (15, "HON"): 11,
-    (15, "print"): 12,
-    (15, "assign"): 13,
-    (15, "HIM"): 14,
-    (16, "CMD"): 35,
-    (16, "LOS"): 3,
-    (16, "FOD"): 4,
-    (16, "FAH"): 5,
-    (16, "IO"): 6,
-    (16, "JUN"): 7,
-    (16, "LHS"): 8,
-    (16, "KEL"): 9,
-    (16, "FUS"): 10,
-    (16, "HON"): 11,
-    (16, "print"): 12,
-    (16, "assign"): 13,
-    (16, "HIM"): 14,
-    (17, "EXPR'"): 36,
-    (17, "OP"): 37,
-    (17, "ε"): 38,
-    (17, "+"): 39,
-    (17, "-"): 40,
-    (17, "ANRK"): 41,
-    (17, "AAN"): 42,
-    (17, "KO"): 43,
-    (20, "TERM"): 44,
-    (20, "UNARY"): 18,
-    (20, "FACTOR"): 19,
-    (20, "NUST"): 20,
-    (20, "id"): 21,
-    (20, "num"): 22,
-    (20, "HIM"): 23,
-    (20, "("): 24,
-    (23, "."): 45,
-    (24, "EXPR"): 46,
-    (24, "TERM"): 17,
-    (24, "UNARY"): 18,
-    (24, "FACTOR"): 19,
-    (24, "NUST"): 20,
-    (24, "id"): 21,
-    (24, "num"): 22,
-    (24, "HIM"): 23,
-    (24, "("): 24,
-    (25, "FAH"): 47,
-    (26, "FAH"): 48,
-    (29, "EXPR"): 49,
-    (29, "TERM"): 17,
-    (29, "UNARY"): 18,
-    (29, "FACTOR"): 19,
-    (29, "NUST"): 20,
-    (29, "id"): 21,
-    (29, "num"): 22,
-    (29, "HIM"): 23,
-    (29, "("): 24,
-    (30, "CMD"): 50,
-    (30, "LOS"): 3,
-    (30, "FOD"): 4,
-    (30, "FAH"): 5,
-    (30, "IO"): 6,
-    (30, "JUN"): 7,
-    (30, "LHS"): 8,
-    (30, "KEL"): 9,
-    (30, "FUS"): 10,
-    (30, "HON"): 11,
-    (30, "print"): 12,
-    (30, "assign"): 13,
-    (30, "HIM"): 14,
-    (31, ":="): 51,
-    (33, "id"): 52,
-    (37, "TERM"): 53,
-    (37, "UNARY"): 18,
-    (37, "FACTOR"): 19,
-    (37, "NUST"): 20,
-    (37, "id"): 21,
-    (37, "num"): 22,
-    (37, "HIM"): 23,
-    (37, "("): 24,
-    (45, "id"): 54,
-    (46, ")"): 55,
-    (47, "EXPR"): 56,
-    (47, "TERM"): 17,
-    (47, "UNARY"): 18,
-    (47, "FACTOR"): 19,
-    (47, "NUST"): 20,
-    (47, "id"): 21,
-    (47, "num"): 22,
-    (47, "HIM"): 23,
-    (47, "("): 24,
-    (48, "EXPR"): 57,
-    (48, "TERM"): 17,
-    (48, "UNARY"): 18,
-    (48, "FACTOR"): 19,
-    (48, "NUST"): 20,
-    (48, "id"): 21,
-    (48, "num"): 22,
-    (48, "HIM"): 23,
-    (48, "("): 24,
-    (51, "EXPR"): 58,
-    (51, "TERM"): 17,
-    (51, "UNARY"): 18,
-    (51, "FACTOR"): 19,
-    (51, "NUST"): 20,
-    (51, "id"): 21,
-    (51, "num"): 22,
-    (51, "HIM"): 23,
-    (51, "("): 24,
-    (53, "EXPR'"): 59,
-    (53, "OP"): 37,
-    (53, "ε"): 38,
-    (53, "+"): 39,
-    (53, "-"): 40,
-    (53, "ANRK"): 41,
-    (53, "AAN"): 42,
-    (53, "KO"): 43,
-}
@@ -0,0 +1,184 @@
+"""
+Reanálise Incremental
+Recompila uma fonte editada reaproveitando os tokens e o estado do parser
+
+A cada ';' de S -> CMD ; S o parser salva um checkpoint (pilhas e marca
+da tabela de símbolos, ver ParseCheckpoints). Numa edição:
+
+    1. só as palavras a partir da primeira danificada são relexadas, até a
+       varredura voltar a coincidir com uma palavra antiga depois do trecho
+       editado (daí em diante os tokens antigos são reaproveitados);
+    2. o contexto volta ao último checkpoint anterior à primeira palavra
+       danificada e o parser SLR continua dali até o fim.
+
+O custo de uma edição é O(trecho editado + sufixo depois dela): o prefixo
+não é relexado nem reanalisado, mas o parser não para ao reencontrar o estado
+antigo e vai até o EOF, e quando o tamanho da fonte muda cada token do
+sufixo reaproveitado é recriado com linha/coluna/offset deslocados (a
+aceitação ainda reduz a cadeia S -> CMD ; S inteira, um passo por comando).
+Editar perto do fim de um arquivo grande é barato; perto do começo custa
+quase uma compilação completa, menos a relexação. A sessão não dobra
+constantes, pois o dobramento altera a AST no lugar e estragaria os nós
+guardados nos checkpoints.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+from parser_integrated import (SLRParserWithSemantics, ParseContext, ParseCheckpoints,
+                               Token, token_type_id)
+
+SEMICOLON = token_type_id(";")
+EOF = token_type_id("$")
+
+
+class SessaoIncremental:
+    """
+    Fonte, tokens e contexto de análise mantidos entre edições
+
+    Uso:
+        sessao = SessaoIncremental(PDALexerAdapter())
+        sessao.compile("FUS x := 1 ; JUN x")
+        sessao.edit(11, 11, " + 1")     # substitui source[11:11]
+        sessao.context.errors, sessao.context.tree
+    """
+
+    def __init__(self, lexer):
+        """
+        Args:
+            lexer: Analisador com iter_tokens_at(fonte, início, linha)
+                (ex: main.PDALexerAdapter)
+        """
+        self.lexer = lexer
+        self.parser = SLRParserWithSemantics(verbose=False, fold_constants=False)
+        self.source = ""
+        self.tokens = []          # Tokens da fonte atual, terminando no EOF
+        self.starts = []          # Posição de cada token na fonte (EOF: len(source))
+        self.semicolons = []      # Índices dos tokens ';' em self.tokens
+        self.context = None
+
+    def compile(self, source_code):
+        """Análise completa da fonte; retorna True se bem-sucedida"""
+        self.source = source_code
+        self.tokens = []
+        self.starts = []
+        self._relex(0, 0, 1)
+        return self._parse(-1)
+
+    def edit(self, start, end, text):
+        """
+        Substitui source[start:end] por text e reanalisa
+
+        Custa O(trecho editado + sufixo), ver o docstring do módulo.
+
+        Returns:
+            bool: True se a fonte editada compila sem erros
+        """
+        if not 0 <= start <= end <= len(self.source):
+            raise ValueError(f"edição fora da fonte: [{start}:{end}] em {len(self.source)} caracteres")
+
+        old_source = self.source
+        self.source = old_source[:start] + text + old_source[end:]
+        if self.context is None:
+            return self.compile(self.source)
+
+        # Primeiro token danificado: o primeiro que termina em start ou depois
+        # (uma palavra encostada na edição pode crescer ou se juntar a outra;
+        # o EOF fica fora da busca e sempre é relexado)
+        tokens = self.tokens
+        starts = self.starts
+        first = bisect_right(starts, start, 0, len(starts) - 1) - 1
+        if first < 0 or starts[first] + len(tokens[first].lexeme) < start:
+            first += 1
+
+        if first:
+            previous = tokens[first - 1]
+            resume = starts[first - 1] + len(previous.lexeme)
+            line = previous.line
+        else:
+            resume, line = 0, 1
+        self._relex(first, resume, line, len(text) - (end - start), start + len(text))
+
+        # Último checkpoint cujo ';' vem antes do primeiro token danificado (o
+        # k-ésimo checkpoint é o k-ésimo ';': a recuperação de erros sempre
+        # retoma num ';' em vez de descartá-lo)
+        index = min(bisect_left(self.semicolons, first), len(self.context.checkpoints)) - 1
+        return self._parse(index)
+
+    # ------------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------------
+
+    def _relex(self, first, resume, line, delta=0, new_end=0):
+        """
+        Relexa a partir de resume (token first em diante) e reaproveita o
+        sufixo antigo assim que uma palavra começa na mesma posição dele
+
+        new_end é o fim do trecho editado na fonte nova e delta a diferença
+        de tamanho entre a fonte nova e a antiga. O EOF nunca é reaproveitado:
+        sua coluna depende do que vem depois da última palavra.
+        """
+        old_tokens = self.tokens
+        old_starts = self.starts
+        old_eof = len(old_tokens) - 1
+        tokens = old_tokens[:first]
+        starts = old_starts[:first]
+
+        for position, token in self.lexer.iter_tokens_at(self.source, resume, line):
+            if position >= new_end and token.kind != EOF:
+                # Fora do trecho editado: procura a mesma palavra na fonte antiga
+                j = bisect_left(old_starts, position - delta, first, max(old_eof, first))
+                if j < old_eof and old_starts[j] == position - delta:
+                    self._reaproveitar(tokens, starts, token, j, delta)
+                    last = tokens[-1]
+                    position, token = next(self.lexer.iter_tokens_at(
+                        self.source, starts[-1] + len(last.lexeme), last.line))
+                    tokens.append(token)
+                    starts.append(position)
+                    break
+            tokens.append(token)
+            starts.append(position)
+
+        self.tokens = tokens
+        self.starts = starts
+        keep = bisect_left(self.semicolons, first)
+        self.semicolons[keep:] = [i for i in range(first, len(tokens))
+                                  if tokens[i].kind == SEMICOLON]
+
+    def _reaproveitar(self, tokens, starts, token, j, delta):
+        """
+        Acrescenta as palavras antigas de j em diante (sem o EOF), onde a
+        palavra nova token coincidiu com a antiga
+
+        Linhas mudam pela diferença de linha no ponto de sincronização,
+        posições por delta e colunas só na linha desse ponto.
+        """
+        old_tokens = self.tokens
+        n = len(old_tokens) - 1
+        synced = old_tokens[j]
+        shift = token.line - synced.line
+        column_shift = token.column - synced.column
+        if shift or delta or column_shift:
+            for old in islice(old_tokens, j, n):
+                column = old.column
+                if old.line == synced.line:
+                    column += column_shift
+                offset = old.offset
+                if offset is not None:
+                    offset += delta
+                tokens.append(Token(old.type, old.lexeme, old.line + shift, column,
+                                    old.value, offset))
+        else:
+            tokens.extend(islice(old_tokens, j, n))
+        starts.extend(s + delta for s in islice(self.starts, j, n))
+
+    def _parse(self, index):
+        """Retoma a análise do checkpoint index (-1: do início)"""
+        if index < 0:
+            self.context = ParseContext()
+            self.context.checkpoints = ParseCheckpoints()
+            remaining = self.tokens
+        else:
+            self.parser.restore_checkpoint(self.context, index)
+            remaining = islice(self.tokens, self.semicolons[index] + 1, None)
+        return self.parser.parse(remaining, self.context)
@@ -0,0 +1,176 @@
+"""
+Interpretador da AST
+Executa a árvore produzida pelo parser diretamente, sem gerar bytecode
+
+Cada referência a identificador (Variable, Member, Declaration e
+InputOutput) já chega resolvida pela análise semântica para o par
+(depth, slot) do seu Symbol: a profundidade do escopo e o índice do símbolo
+nele. Em execução há um quadro (lista) por escopo aberto, então ler ou
+escrever uma variável é frames[depth][slot], sem busca por nome.
+
+A semântica dos comandos é a mesma da máquina virtual (ver bytecode.py);
+a diferença é que cada execução de um módulo (KEL) ganha um quadro novo.
+Como na máquina, ler uma variável que ainda não recebeu valor (ex: declarada
+num LOS que não executou) dá None, e só operar com ele é erro de execução,
+informado com a linha do comando em que ocorreu.
+Útil para scripts curtos, em que compilar para bytecode não compensa.
+"""
+
+import ast_nodes
+from operacoes import OPERACOES
+from vm import ConsoleIO
+
+
+class InterpretError(Exception):
+    """Erro durante a interpretação (ex: variável não resolvida)"""
+    def __init__(self, message, line):
+        self.message = message
+        self.line = line
+        super().__init__(f"Erro de execução (linha {line}): {message}")
+
+
+class _Retorno(Exception):
+    """Desvia a execução de JUN até Interpretador.executar()"""
+    def __init__(self, value):
+        self.value = value
+
+
+class Interpretador:
+    """Percorre a AST executando os comandos sobre quadros de slots"""
+
+    def __init__(self, global_size, io=None):
+        self.io = ConsoleIO() if io is None else io
+        self.frames = [[None] * global_size]   # Um quadro por escopo aberto (global = 0)
+        self.comandos = {
+            ast_nodes.Sequence: self._sequencia,
+            ast_nodes.Declaration: self._declaracao,
+            ast_nodes.Assignment: self._atribuicao,
+            ast_nodes.If: self._se,
+            ast_nodes.While: self._enquanto,
+            ast_nodes.For: self._para,
+            ast_nodes.InputOutput: self._io,
+            ast_nodes.Return: self._retorno,
+            ast_nodes.Module: self._modulo,
+        }
+
+    def executar(self, tree):
+        """Executa o programa e retorna o valor de JUN (None sem JUN)"""
+        try:
+            self._comando(tree)
+        except _Retorno as r:
+            return r.value
+        return None
+
+    # ------------------------------------------------------------------------
+    # Slots
+    # ------------------------------------------------------------------------
+
+    def _ler(self, node):
+        if node.slot is None:
+            raise InterpretError(f"'{node.name}' não foi declarado", node.line)
+        return self.frames[node.depth][node.slot]
+
+    def _escrever(self, node, value):
+        if node.slot is None:
+            raise InterpretError(f"'{node.name}' não foi declarado", node.line)
+        self.frames[node.depth][node.slot] = value
+
+    # ------------------------------------------------------------------------
+    # Expressões (pós-ordem iterativa: cadeias longas não esgotam a pilha)
+    # ------------------------------------------------------------------------
+
+    def _avaliar(self, expr):
+        kind = type(expr)
+        if kind is ast_nodes.Number:
+            return expr.value
+        if kind is ast_nodes.Variable or kind is ast_nodes.Member:
+            return self._ler(expr)
+
+        values = []
+        pending = [(expr, False)]
+        while pending:
+            node, visited = pending.pop()
+            kind = type(node)
+            if kind is ast_nodes.BinaryOp:
+                if visited:
+                    right = values.pop()
+                    values[-1] = OPERACOES[node.op](values[-1], right)
+                else:
+                    pending.append((node, True))
+                    pending.append((node.right, False))
+                    pending.append((node.left, False))
+            elif kind is ast_nodes.Not:
+                if visited:
+                    values[-1] = int(not values[-1])
+                else:
+                    pending.append((node, True))
+                    pending.append((node.operand, False))
+            elif kind is ast_nodes.Number:
+                values.append(node.value)
+            else:
+                values.append(self._ler(node))
+        return values[0]
+
+    # ------------------------------------------------------------------------
+    # Comandos
+    # ------------------------------------------------------------------------
+
+    def _comando(self, node):
+        # O comando mais interno converte o erro, com a sua linha
+        try:
+            self.comandos[type(node)](node)
+        except (TypeError, EOFError, ValueError) as e:
+            raise InterpretError(str(e), node.line) from e
+
+    def _sequencia(self, node):
+        comando = self._comando
+        for cmd in node.commands:
+            comando(cmd)
+
+    def _declaracao(self, node):
+        self._escrever(node, self._avaliar(node.value))
+
+    def _atribuicao(self, node):
+        self._escrever(node.target, self._avaliar(node.value))
+
+    def _se(self, node):
+        if self._avaliar(node.condition):
+            self._comando(node.body)
+
+    def _enquanto(self, node):
+        while True:
+            self._comando(node.body)
+            if not self._avaliar(node.condition):
+                break
+
+    def _para(self, node):
+        for _ in range(self._avaliar(node.condition)):
+            self._comando(node.body)
+
+    def _io(self, node):
+        if node.op == "HON":
+            self._escrever(node, self.io.read(node.name))
+        else:
+            self.io.write(node.name, self._ler(node))
+
+    def _retorno(self, node):
+        raise _Retorno(self._avaliar(node.value))
+
+    def _modulo(self, node):
+        self.frames.append([None] * node.size)
+        try:
+            self._comando(node.body)
+        finally:
+            self.frames.pop()
+
+
+def interpretar(tree, symbol_table, io=None):
+    """
+    Interpreta a AST do programa e retorna o valor de JUN
+
+    Args:
+        tree: AST do programa (ParseContext.tree)
+        symbol_table: SymbolTable da mesma análise (dimensiona o quadro global)
+        io: Objeto de E/S para HON/print (padrão: vm.ConsoleIO)
+    """
+    return Interpretador(len(symbol_table.global_scope.symbols), io).executar(tree)
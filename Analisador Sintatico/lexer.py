@@ -10,6 +10,7 @@ Números: [0-9]+
 
 import re
 from enum import Enum
+from diagnosticos import Diagnostic
 from parser_integrated import Token
 
 class TokenType(Enum):
@@ -55,7 +56,7 @@ class TokenType(Enum):
 
 
 class LexicalError(Exception):
-    """Exceção para erros léxicos"""
+    """Exceção para erros léxicos (Lexer.errors guarda Diagnostics L001/L002)"""
     def __init__(self, message, line, column, char):
         self.message = message
         self.line = line
@@ -85,180 +86,161 @@ class Lexer:
         'KO': TokenType.KO,
     }
     
+    # Operadores e pontuação
+    OPERATORS = {
+        ':=': TokenType.ASSIGN_OP,
+        '+': TokenType.PLUS,
+        '-': TokenType.MINUS,
+        ';': TokenType.SEMICOLON,
+        '.': TokenType.DOT,
+        '(': TokenType.LPAREN,
+        ')': TokenType.RPAREN,
+    }
+    
+    # Expressão mestra: espaços sem quebra de linha seguidos de um único lexema
+    #   grupo 1: espaços com quebra de linha, grupo 2: comentário de linha,
+    #   grupo 3: comentário de bloco, grupo 4: número,
+    #   grupo 5: identificador/palavra-chave, grupo 6: operador
+    MASTER_PATTERN = re.compile(r"""
+        [ \t\r]*
+        (?:
+            (\n[ \t\n\r]*)
+          | (\#[^\n]*\n?)
+          | (/\*(?:.*?\*/|.*))
+          | (\d+)
+          | ([^\W\d]\w*)
+          | (:=|[+\-;.()])
+        )
+    """, re.VERBOSE | re.DOTALL)
+    BLANK_PATTERN = re.compile(r"[ \t\r]+")
+    
     def __init__(self, source_code):
         self.source = source_code
         self.position = 0
         self.line = 1
         self.column = 1
         self.tokens = []
-        self.errors = []
+        self.errors = []              # Erros léxicos (Diagnostic)
     
-    def current_char(self):
-        """Retorna o caractere atual"""
-        if self.position >= len(self.source):
-            return None
-        return self.source[self.position]
-    
-    def peek_char(self, offset=1):
-        """Olha caractere à frente sem avançar"""
-        pos = self.position + offset
-        if pos >= len(self.source):
-            return None
-        return self.source[pos]
-    
-    def advance(self):
-        """Avança para o próximo caractere"""
-        if self.position < len(self.source):
-            if self.source[self.position] == '\n':
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
-            self.position += 1
-    
-    def skip_whitespace(self):
-        """Pula espaços em branco"""
-        while self.current_char() and self.current_char() in ' \t\n\r':
-            self.advance()
+    def tokenize(self):
+        """Analisa o código fonte e gera lista de tokens"""
+        self.tokens = list(self.iter_tokens())
+        return self.tokens
     
-    def skip_comment(self):
-        """Pula comentários de linha (#) e bloco (/* */)"""
-        char = self.current_char()
-        
-        # Comentário de linha: # até o fim da linha
-        if char == '#':
-            while self.current_char() and self.current_char() != '\n':
-                self.advance()
-            self.advance()  # Pula o \n
-            return True
+    def iter_tokens(self):
+        """
+        Gera os tokens sob demanda, terminando com o token EOF ('$')
         
-        # Comentário de bloco: /* ... */
-        if char == '/' and self.peek_char() == '*':
-            self.advance()  # Pula /
-            self.advance()  # Pula *
-            
-            while self.current_char():
-                if self.current_char() == '*' and self.peek_char() == '/':
-                    self.advance()  # Pula *
-                    self.advance()  # Pula /
-                    return True
-                self.advance()
-            
-            # Comentário não fechado
-            self.errors.append(LexicalError(
-                "Comentário de bloco não fechado",
-                self.line, self.column, "/*"
-            ))
-            return True
+        Erros léxicos são acumulados em self.errors à medida que aparecem.
+        """
+        num_type = TokenType.NUM.value
+        lexemes = {}              # Lexemas repetidos compartilham a mesma string
         
-        return False
+        for token_type, text, start, line, column in self._scan():
+            if token_type is num_type:
+                yield Token(token_type, text, line, column, int(text), start)
+            elif text:
+                text = lexemes.setdefault(text, text)
+                yield Token(token_type, text, line, column, text, start)
+            else:
+                yield Token(token_type, "$", line, column, "$", start)
     
-    def read_number(self):
-        """Lê um número inteiro"""
-        start_line = self.line
-        start_col = self.column
-        num_str = ""
-        
-        while self.current_char() and self.current_char().isdigit():
-            num_str += self.current_char()
-            self.advance()
-        
-        value = int(num_str)
-        return Token(TokenType.NUM.value, num_str, start_line, start_col, value)
-    
-    def read_identifier_or_keyword(self):
-        """Lê identificador ou palavra-chave"""
-        start_line = self.line
-        start_col = self.column
-        text = ""
+    def tokenize_buffer(self):
+        """
+        Analisa o código fonte gerando uma fita colunar (TokenBuffer)
         
-        # Identificador: [a-zA-Z_][a-zA-Z0-9_]*
-        while self.current_char() and (self.current_char().isalnum() or self.current_char() == '_'):
-            text += self.current_char()
-            self.advance()
+        Os lexemas não são copiados: a fita guarda apenas posição e tamanho
+        de cada token na fonte original.
+        """
+        from token_buffer import TokenBuffer
         
-        # Verifica se é palavra reservada
-        token_type = self.KEYWORDS.get(text, TokenType.ID)
+        buffer = TokenBuffer(self.source)
+        append = buffer.append
+        for token_type, text, start, line, column in self._scan():
+            append(token_type, start, len(text), line, column)
+        return buffer
+    
+    def _scan(self):
+        """
+        Motor de varredura: gera (tipo, texto, início, linha, coluna) por token
         
-        return Token(token_type.value, text, start_line, start_col, text)
-    
-    def read_operator(self):
-        """Lê operadores"""
-        start_line = self.line
-        start_col = self.column
-        char = self.current_char()
-        
-        # Operador de atribuição :=
-        if char == ':' and self.peek_char() == '=':
-            self.advance()
-            self.advance()
-            return Token(TokenType.ASSIGN_OP.value, ":=", start_line, start_col, ":=")
-        
-        # Operadores simples
-        operators = {
-            '+': TokenType.PLUS,
-            '-': TokenType.MINUS,
-            ';': TokenType.SEMICOLON,
-            '.': TokenType.DOT,
-            '(': TokenType.LPAREN,
-            ')': TokenType.RPAREN,
-        }
+        Um único regex compilado reconhece cada lexema, que é fatiado da fonte
+        por índice; a linha avança pelas quebras de linha contidas em espaços
+        e comentários e a coluna é a distância ao início da linha.
+        O último item é o EOF, com texto vazio no fim da fonte.
+        """
+        self.errors = []
         
-        if char in operators:
-            token_type = operators[char]
-            self.advance()
-            return Token(token_type.value, char, start_line, start_col, char)
+        source = self.source
+        length = len(source)
+        match = self.MASTER_PATTERN.match
+        keyword_types = _KEYWORD_TYPES
+        operator_types = _OPERATOR_TYPES
+        id_type = TokenType.ID.value
+        num_type = TokenType.NUM.value
         
-        return None
-    
-    def tokenize(self):
-        """Analisa o código fonte e gera lista de tokens"""
-        self.tokens = []
-        self.errors = []
+        pos = 0
+        line = 1
+        line_start = 0            # Posição do primeiro caractere da linha atual
         
-        while self.position < len(self.source):
-            # Pula espaços e comentários
-            self.skip_whitespace()
+        while pos < length:
+            m = match(source, pos)
             
-            if not self.current_char():
-                break
-            
-            # Verifica comentários
-            if self.skip_comment():
+            if m is None:
+                blank = self.BLANK_PATTERN.match(source, pos)
+                if blank:
+                    pos = blank.end()
+                    continue
+                
+                # Caractere inválido
+                self.errors.append(Diagnostic(
+                    "L001", (source[pos],), line, pos - line_start + 1, pos, pos + 1
+                ))
+                pos += 1
                 continue
             
-            char = self.current_char()
-            start_line = self.line
-            start_col = self.column
+            kind = m.lastindex
+            start, end = m.span(kind)
             
-            # Números
-            if char.isdigit():
-                self.tokens.append(self.read_number())
+            if kind <= 3:
+                # Espaços e comentários: só atualizam a posição de linha
+                newlines = source.count('\n', start, end)
+                if newlines:
+                    line += newlines
+                    line_start = source.rindex('\n', start, end) + 1
+                if kind == 3 and not source.endswith('*/', start + 2, end):
+                    # Comentário não fechado
+                    self.errors.append(Diagnostic(
+                        "L002", (), line, end - line_start + 1, start, end
+                    ))
+                pos = end
                 continue
             
-            # Identificadores e palavras-chave
-            if char.isalpha() or char == '_':
-                self.tokens.append(self.read_identifier_or_keyword())
-                continue
+            text = source[start:end]
             
-            # Operadores
-            operator_token = self.read_operator()
-            if operator_token:
-                self.tokens.append(operator_token)
-                continue
+            if kind == 5:
+                token_type = keyword_types.get(text, id_type)
+                if token_type is id_type and text[0] > '\x7f' and not text[0].isalpha():
+                    # Caractere numérico Unicode não é início de identificador
+                    self.errors.append(Diagnostic(
+                        "L001", (text[0],), line, start - line_start + 1, start, start + 1
+                    ))
+                    pos = start + 1
+                    continue
+                yield token_type, text, start, line, start - line_start + 1
+            elif kind == 4:
+                yield num_type, text, start, line, start - line_start + 1
+            else:
+                yield operator_types[text], text, start, line, start - line_start + 1
             
-            # Caractere inválido
-            error = LexicalError(
-                f"Caractere inválido '{char}'",
-                start_line, start_col, char
-            )
-            self.errors.append(error)
-            self.advance()
+            pos = end
         
-        # Adiciona token EOF
-        self.tokens.append(Token(TokenType.EOF.value, "$", self.line, self.column, "$"))
+        self.position = pos
+        self.line = line
+        self.column = pos - line_start + 1
         
-        return self.tokens
+        # Token EOF
+        yield TokenType.EOF.value, "", pos, self.line, self.column
     
     def print_tokens(self):
         """Imprime lista de tokens formatada"""
@@ -293,6 +275,11 @@ class Lexer:
             print("="*80 + "\n")
 
 
+# Tipos de token já resolvidos para string (evita acessar Enum.value por lexema)
+_KEYWORD_TYPES = {text: token_type.value for text, token_type in Lexer.KEYWORDS.items()}
+_OPERATOR_TYPES = {text: token_type.value for text, token_type in Lexer.OPERATORS.items()}
+
+
 # ============================================================================
 # EXEMPLOS DE USO
 # ============================================================================
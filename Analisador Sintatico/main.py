@@ -3,15 +3,22 @@ Sistema Completo de Análise: PDA (Léxico) -> SLR(1) (Sintático + Semântico)
 Integra o autômato de pilha de Compiladores/ como analisador léxico
 """
 
-from SLR import closures
-from goto import transitions
-from terminais import terminals
-from nao_terminais import nonterminals
-from follow import FOLLOW
-from parser_integrated import SLRParserWithSemantics, Token
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from parser_integrated import SLRParserWithSemantics, Token, TABELAS, FOLLOW
+from diagnosticos import Diagnostic
+from tabelas import ERRO, SEM_GOTO
 from Compiladores.pda import AP
 from Compiladores.constants import EPSILON
 from Compiladores.delta import DeltaFinal
+from Compiladores.dfa import compilar_dfa, REJEITA
+from reporter import NullReporter, ConsoleReporter
+from bytecode import compilar_bytecode, CompileError
+from vm import executar, ExecutionError
+from interpretador import interpretar, InterpretError
+from incremental import SessaoIncremental
 
 
 class PDALexerAdapter:
@@ -52,7 +59,13 @@ class PDALexerAdapter:
         'ANRK': 'ANRK',
     }
     
-    def __init__(self):
+    # Palavra (sequência sem espaços nem '#') ou separador de linha '#'
+    PALAVRA = re.compile(r"[^\s#]+|#")
+    
+    def __init__(self, reporter=None):
+        # Relator dos eventos do PDA (silencioso por padrão)
+        self.reporter = reporter if reporter is not None else NullReporter()
+        
         # Configuração do PDA (copiada de Compiladores/main.py)
         Q = ['A1,B2,Z', 'Z', 'B7,B8,Z', 'B3,B6,Z',
              'B12,Z', 'B4,Z', 'B5,B9,Z', 'B10,B11,Z',
@@ -74,134 +87,138 @@ class PDALexerAdapter:
              'D10,Z', 'D4,Z', 'D6,Z', 'D7,Z', 'D8,Z', 'D2,Z', 'B1,Z']
         
         self.pda = AP(Sigma, gama, DeltaFinal, 'S', F)
+        
+        # DFA mínimo equivalente ao PDA, usado no reconhecimento das palavras
+        self.dfa = compilar_dfa(DeltaFinal, 'S', F, self.STATE_TO_TOKEN, Sigma)
     
     def tokenize(self, source_code):
         """
         Executa PDA e converte saída para tokens
         
+        Cada palavra processada e a tabela de símbolos do PDA são enviadas ao
+        relator; com um relator silencioso nada é coletado além dos tokens.
+        
         Args:
             source_code: String com código fonte (formato: "KO KEL # LOS")
         
         Returns:
             Lista de objetos Token
         """
-        tokens = []
-        linha_atual = 1
-        
-        print("==================================================================")
-        print("=          SAÍDA DO PDA (Compiladores/main.py)                  =")
-        print("==================================================================")
+        reporter = self.reporter
+        if reporter.silent:
+            return list(self.iter_tokens(source_code))
         
-        # Executar PDA original e capturar saída
-        print("\n Processando entrada no PDA...")
-        print(f"Entrada: {source_code}\n")
-        
-        # Separar por linhas (delimitadas por '#')
-        linhas = source_code.split('#')
+        tokens = []
+        reporter.pda_start(source_code)
         
-        pda_results = []  # Armazena resultados do PDA
+        pda_results = []  # (linha, palavra, estado final) de cada palavra
         
-        for linha_texto in linhas:
-            linha_texto = linha_texto.strip()
-            if not linha_texto:
-                linha_atual += 1
-                continue
-            
-            # Processar cada palavra da linha
-            palavras = linha_texto.split()
+        for palavra, linha_atual, estado_final, token in self._reconhecer(source_code):
+            tokens.append(token)
+            if palavra is None:
+                break  # EOF
             
-            for palavra in palavras:
-                palavra = palavra.strip()
-                if not palavra:
-                    continue
-                
-                # Simular reconhecimento pelo PDA caractere por caractere
-                estado_final = self._reconhecer_palavra(palavra)
-                
-                # Armazenar resultado do PDA
-                pda_result = {
-                    'palavra': palavra,
-                    'linha': linha_atual,
-                    'estado': estado_final,
-                    'aceito': estado_final in self.STATE_TO_TOKEN
-                }
-                pda_results.append(pda_result)
-                
-                # Mapear estado final para tipo de token
-                if estado_final in self.STATE_TO_TOKEN:
-                    token_type = self.STATE_TO_TOKEN[estado_final]
-                    token = Token(token_type, palavra, linha_atual, column=0, value=palavra)
-                    tokens.append(token)
-                    
-                    # Mostrar saída do PDA (similar ao original)
-                    print(f"[OK] Linha {linha_atual}: '{palavra}' -> Estado {estado_final} -> {token_type} (ACEITO)")
-                
-                elif estado_final == 'X':
-                    # Palavra rejeitada - pode ser ID, NUM ou erro
-                    token = self._classificar_palavra_desconhecida(palavra, linha_atual)
-                    tokens.append(token)
-                    print(f"  Linha {linha_atual}: '{palavra}' -> Não reconhecido pelo PDA -> {token.type}")
-                
-                else:
-                    # Estado não mapeado - tratar como ID
-                    print(f"[!] Linha {linha_atual}: '{palavra}' -> Estado '{estado_final}' não mapeado")
-                    token = Token("id", palavra, linha_atual, value=palavra)
-                    tokens.append(token)
-            
-            linha_atual += 1
-        
-        # Adicionar EOF
-        tokens.append(Token("$", "$", linha_atual, column=0, value="$"))
+            pda_results.append((linha_atual, palavra, estado_final))
+            reporter.pda_word(linha_atual, palavra, estado_final, token)
         
-        # Mostrar tabela de símbolos do PDA
-        print("\n" + "="*70)
-        print(" TABELA DE SÍMBOLOS DO PDA:")
-        print("="*70)
-        print(f"{'Linha':<8} {'Palavra':<15} {'Estado Final':<15} {'Status':<10}")
-        print("="*70)
+        reporter.pda_summary(pda_results, len(tokens))
         
-        for result in pda_results:
-            status = "[OK] ACEITO" if result['aceito'] else "[X] REJEITADO"
-            print(f"{result['linha']:<8} {result['palavra']:<15} {result['estado']:<15} {status:<10}")
+        return tokens
+    
+    def iter_tokens(self, source_code):
+        """
+        Gera os tokens sob demanda, sem impressões, terminando com EOF ('$')
         
-        print("="*70)
-        print(f"\n[OK] PDA processou {len(pda_results)} palavras")
-        print(f"[OK] Gerados {len(tokens)} tokens (incluindo EOF)\n")
+        Args:
+            source_code: String com código fonte (formato: "KO KEL # LOS")
+        """
+        for _, _, _, token in self._reconhecer(source_code):
+            yield token
+    
+    def iter_tokens_at(self, source_code, inicio=0, linha=1):
+        """
+        Gera (posição, token) a partir de inicio, terminando com EOF ('$')
         
-        return tokens
+        inicio deve estar fora de uma palavra (início da fonte, espaço ou
+        '#') e linha é a linha nesse ponto; a posição do EOF é len(source_code).
+        Usado pela reanálise incremental para relexar só o trecho editado.
+        """
+        for palavra, posicao, linha_atual, coluna in self._palavras(source_code, inicio, linha):
+            if palavra is None:
+                yield posicao, Token("$", "$", linha_atual, coluna, "$", posicao)
+            else:
+                yield posicao, self._token(palavra, linha_atual, coluna, posicao)
     
-    def _reconhecer_palavra(self, palavra):
+    def _palavras(self, source_code, inicio=0, linha=1):
         """
-        Reconhece palavra pelo PDA e retorna estado final
-        Simula a lógica de run() do AP sem impressões
+        Gera (palavra, posição, linha, coluna) das palavras a partir de inicio
+        
+        Uma única varredura indexa o início de cada palavra: linhas são
+        delimitadas por '#' e a coluna (a partir de 1) é a distância ao
+        caractere seguinte ao último '#'. O último item tem palavra None, a
+        posição do fim da fonte e a linha do EOF (seguinte à última linha).
         """
-        estado = 'S'  # Estado inicial
+        inicio_linha = source_code.rfind('#', 0, inicio) + 1
+        for m in self.PALAVRA.finditer(source_code, inicio):
+            palavra = m.group()
+            posicao = m.start()
+            if palavra == '#':
+                linha += 1
+                inicio_linha = posicao + 1
+            else:
+                yield palavra, posicao, linha, posicao - inicio_linha + 1
+        fim = len(source_code)
+        yield None, fim, linha + 1, fim - inicio_linha + 1
+    
+    def _token(self, palavra, linha, coluna=0, posicao=None):
+        """Token de uma palavra (DFA do PDA ou classificação de desconhecidas)"""
+        estado = self.dfa.executar(palavra)
+        if estado != REJEITA:
+            return Token(self.dfa.saidas[estado], palavra, linha, coluna, palavra, posicao)
+        return self._classificar_palavra_desconhecida(palavra, linha, coluna, posicao)
+    
+    def _reconhecer(self, source_code):
+        """
+        Percorre a entrada palavra a palavra (linhas delimitadas por '#')
         
-        for char in palavra:
-            if char not in self.pda._Sigma:
-                return 'X'  # Caractere inválido
+        Gera tuplas (palavra, linha, estado_final, token); a última tem
+        palavra None e o token EOF.
+        """
+        for palavra, posicao, linha_atual, coluna in self._palavras(source_code):
+            if palavra is None:
+                yield None, linha_atual, None, Token("$", "$", linha_atual, coluna, "$", posicao)
+                return
+            
+            # Reconhecimento pelo DFA compilado do PDA
+            estado = self.dfa.executar(palavra)
             
-            # Busca transição
-            transicao = self.pda._delta.get((estado, char, EPSILON))
-            if transicao:
-                estado = transicao[0]
+            # O estado final do DFA já carrega o tipo de token
+            if estado != REJEITA:
+                token = Token(self.dfa.saidas[estado], palavra, linha_atual, coluna, palavra, posicao)
+                yield palavra, linha_atual, self.dfa.nomes[estado], token
             else:
-                return 'X'  # Sem transição
-        
-        # Verifica se é estado final
-        if estado not in self.pda._F:
+                # Palavra rejeitada - pode ser ID, NUM ou erro
+                token = self._classificar_palavra_desconhecida(palavra, linha_atual, coluna, posicao)
+                yield palavra, linha_atual, 'X', token
+    
+    def _reconhecer_palavra(self, palavra):
+        """
+        Reconhece palavra pelo PDA e retorna estado final
+        Executa o DFA compilado de DeltaFinal (mesmo resultado de run() do AP)
+        """
+        estado = self.dfa.executar(palavra)
+        if estado == REJEITA:
             return 'X'
-        
-        return estado
+        return self.dfa.nomes[estado]
     
-    def _classificar_palavra_desconhecida(self, palavra, linha):
+    def _classificar_palavra_desconhecida(self, palavra, linha, coluna=0, posicao=None):
         """
         Classifica palavras não reconhecidas pelo PDA
         Pode ser ID, NUM, operadores, etc.
         """
         # Números
         if palavra.isdigit():
-            return Token("num", palavra, linha, value=int(palavra))
+            return Token("num", palavra, linha, coluna, int(palavra), posicao)
         
         # Operadores e pontuação
         operadores = {
@@ -215,7 +232,7 @@ class PDALexerAdapter:
         }
         
         if palavra in operadores:
-            return Token(palavra, palavra, linha, value=palavra)
+            return Token(palavra, palavra, linha, coluna, palavra, posicao)
         
         # Palavras-chave não cobertas pelo PDA
         keywords_extras = {
@@ -224,19 +241,29 @@ class PDALexerAdapter:
         }
         
         if palavra in keywords_extras:
-            return Token(keywords_extras[palavra], palavra, linha, value=palavra)
+            return Token(keywords_extras[palavra], palavra, linha, coluna, palavra, posicao)
         
         # Padrão: identificador
-        return Token("id", palavra, linha, value=palavra)
+        return Token("id", palavra, linha, coluna, palavra, posicao)
 
 
 class CompiladorCompleto:
     """Pipeline completo: PDA Léxico -> SLR Sintático -> Análise Semântica"""
     
-    def __init__(self, verbose=True):
-        self.lexer = PDALexerAdapter()
-        self.parser = SLRParserWithSemantics(verbose=verbose)
+    def __init__(self, verbose=True, reporter=None):
+        """
+        Args:
+            verbose: Mostra o passo a passo do parser e a fita de tokens
+            reporter: Relator de eventos; por padrão ConsoleReporter se
+                verbose, senão NullReporter (nenhuma escrita no console)
+        """
+        if reporter is None:
+            reporter = ConsoleReporter() if verbose else NullReporter()
+        self.reporter = reporter
+        self.lexer = PDALexerAdapter(reporter)
+        self.parser = SLRParserWithSemantics(verbose=verbose, reporter=reporter)
         self.verbose = verbose
+        self.sessao = None            # SessaoIncremental de compile_incremental/edit
     
     def compile(self, source_code):
         """
@@ -248,42 +275,217 @@ class CompiladorCompleto:
         Returns:
             bool: True se compilação bem-sucedida
         """
-        print("\n" + "="*80)
-        print("FASE 1: ANÁLISE LÉXICA (PDA)")
-        print("="*80)
-        print(f"Código fonte: {source_code}\n")
+        reporter = self.reporter
+        reporter.phase("FASE 1: ANÁLISE LÉXICA (PDA)", f"Código fonte: {source_code}")
         
         # Fase 1: Análise Léxica com PDA
         try:
             tokens = self.lexer.tokenize(source_code)
             
             if self.verbose:
-                print("\n==================================================================")
-                print("=              TOKENS GERADOS PARA O PARSER                      =")
-                print("==================================================================")
-                for i, token in enumerate(tokens, 1):
-                    print(f"{i:3}. {token}")
-                print("-" * 80)
+                reporter.tokens(tokens)
         
         except Exception as e:
-            print(f"\n[X] ERRO LÉXICO: {e}")
+            reporter.lexical_error(e)
             return False
         
         # Fase 2 & 3: Análise Sintática + Semântica
-        print("\n" + "="*80)
-        print("FASE 2 & 3: ANÁLISE SINTÁTICA E SEMÂNTICA (SLR)")
-        print("="*80 + "\n")
+        reporter.phase("FASE 2 & 3: ANÁLISE SINTÁTICA E SEMÂNTICA (SLR)")
         
         sucesso = self.parser.parse(tokens)
         
         # Relatório final
-        self.parser.print_report()
+        reporter.report(self.parser)
+        
+        return sucesso
+    
+    def compile_stream(self, source_code):
+        """
+        Compilação em fluxo, sem impressões do léxico
+        
+        O parser puxa os tokens do PDA à medida que precisa deles, então a
+        memória fica limitada à pilha do parser (com error_recovery=False no
+        parser, um erro sintático também interrompe a leitura da entrada).
+        
+        Returns:
+            bool: True se compilação bem-sucedida
+        """
+        return self.parser.parse(self.lexer.iter_tokens(source_code))
+    
+    def run(self, source_code, io=None):
+        """
+        Compila e executa o programa na máquina virtual
+        
+        Args:
+            source_code: String com código fonte
+            io: Objeto de E/S para HON/print (padrão: vm.ConsoleIO)
+        
+        Returns:
+            (sucesso, valor): valor é o resultado de JUN (None sem JUN ou se
+            a compilação ou a execução falhar; os erros ficam em
+            self.parser.errors)
+        """
+        self.parser.reset()
+        if not self.compile_stream(source_code):
+            return False, None
+        try:
+            program = compilar_bytecode(self.parser.context.tree)
+        except CompileError as e:
+            self.parser.errors.append(Diagnostic("G001", (e.message,), e.line))
+            return False, None
+        try:
+            return True, executar(program, io)
+        except ExecutionError as e:
+            self.parser.errors.append(Diagnostic("X002", (e.message, e.pc)))
+            return False, None
+    
+    def interpret(self, source_code, io=None):
+        """
+        Compila e executa o programa percorrendo a AST (sem gerar bytecode)
         
+        Mesmo contrato de run(); mais rápido para iniciar em scripts curtos.
+        Erros de execução (ex: variável não declarada) vão para
+        self.parser.errors e retornam (False, None).
+        """
+        self.parser.reset()
+        if not self.compile_stream(source_code):
+            return False, None
+        try:
+            value = interpretar(self.parser.context.tree, self.parser.symbol_table, io)
+        except InterpretError as e:
+            self.parser.errors.append(Diagnostic("X001", (e.message,), e.line))
+            return False, None
+        return True, value
+    
+    def compile_incremental(self, source_code):
+        """
+        Compila a fonte guardando o estado para reanálises com edit()
+        
+        Sem impressões e sem dobramento de constantes (ver incremental.py);
+        o resultado fica em self.parser.context, como em compile().
+        
+        Returns:
+            bool: True se compilação bem-sucedida
+        """
+        self.sessao = SessaoIncremental(self.lexer)
+        sucesso = self.sessao.compile(source_code)
+        self.parser.context = self.sessao.context
+        return sucesso
+    
+    def edit(self, start, end, text):
+        """
+        Substitui source[start:end] por text na fonte da última
+        compile_incremental e reanalisa só a partir do trecho editado
+        
+        Returns:
+            bool: True se a fonte editada compila sem erros
+        """
+        if self.sessao is None:
+            raise RuntimeError("edit() requer compile_incremental() antes")
+        sucesso = self.sessao.edit(start, end, text)
+        self.parser.context = self.sessao.context
         return sucesso
     
     def reset(self):
         """Reinicia compilador"""
         self.parser.reset()
+        self.sessao = None
+
+
+# ============================================================================
+# COMPILAÇÃO EM LOTE
+# ============================================================================
+
+class ResultadoCompilacao:
+    """Resultado de uma unidade de compilação (serializável entre processos)"""
+    __slots__ = ("unidade", "sucesso", "erros", "avisos", "simbolos")
+    
+    def __init__(self, unidade, sucesso, erros, avisos, simbolos):
+        self.unidade = unidade        # Caminho do arquivo ou índice da fonte na entrada
+        self.sucesso = sucesso        # True se compilação bem-sucedida
+        self.erros = erros            # Erros sintáticos + semânticos (Diagnostic)
+        self.avisos = avisos          # Avisos semânticos (Diagnostic)
+        self.simbolos = simbolos      # Cópia da tabela (ver SymbolTable.snapshot)
+    
+    def __getstate__(self):
+        return tuple(getattr(self, campo) for campo in self.__slots__)
+    
+    def __setstate__(self, estado):
+        for campo, valor in zip(self.__slots__, estado):
+            setattr(self, campo, valor)
+    
+    def __repr__(self):
+        status = "OK" if self.sucesso else f"{len(self.erros)} erro(s)"
+        return f"ResultadoCompilacao({self.unidade!r}, {status})"
+
+
+# Compilador do processo atual: criado uma vez por worker e reaproveitado
+_compilador_worker = None
+
+
+def _inicializar_worker():
+    """Carrega as tabelas e o DFA do PDA uma única vez por processo"""
+    global _compilador_worker
+    _compilador_worker = CompiladorCompleto(verbose=False, reporter=NullReporter())
+
+
+def _compilar_unidade(item):
+    """Compila uma unidade (unidade, caminho, fonte) no compilador do processo"""
+    unidade, caminho, source_code = item
+    if _compilador_worker is None:
+        _inicializar_worker()
+    compilador = _compilador_worker
+    compilador.reset()
+    
+    if caminho is not None:
+        try:
+            with open(caminho, encoding="utf-8") as arquivo:
+                source_code = arquivo.read()
+        except (OSError, UnicodeDecodeError) as e:
+            return ResultadoCompilacao(unidade, False, [Diagnostic("A001", (str(e),))], [], [])
+    
+    sucesso = compilador.compile(source_code)
+    
+    parser = compilador.parser
+    return ResultadoCompilacao(unidade, sucesso, list(parser.errors), list(parser.warnings),
+                               parser.symbol_table.snapshot())
+
+
+def compile_many(paths_or_sources, workers=None):
+    """
+    Compila várias unidades em paralelo num pool de processos
+    
+    Cada worker carrega as tabelas uma vez e reaproveita seu compilador entre
+    as unidades; nada é escrito no console. Itens os.PathLike ou strings que
+    nomeiam um arquivo existente são lidos do disco (no próprio worker); as
+    demais strings são tratadas como código fonte.
+    
+    Args:
+        paths_or_sources: Iterável de caminhos e/ou códigos fonte
+        workers: Número de processos (padrão: os.cpu_count()); com 1 ou
+            menos a compilação roda no processo atual
+    
+    Returns:
+        Lista de ResultadoCompilacao na mesma ordem da entrada
+    """
+    itens = []
+    for i, item in enumerate(paths_or_sources):
+        if isinstance(item, os.PathLike) or os.path.isfile(item):
+            caminho = os.fspath(item)
+            itens.append((caminho, caminho, None))
+        else:
+            itens.append((i, None, item))
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(itens))
+    
+    if workers <= 1:
+        return [_compilar_unidade(item) for item in itens]
+    
+    chunksize = max(1, len(itens) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker) as pool:
+        return list(pool.map(_compilar_unidade, itens, chunksize=chunksize))
 
 
 # ============================================================================
@@ -291,44 +493,18 @@ class CompiladorCompleto:
 # ============================================================================
 
 class SLRParser:
-    def __init__(self):
+    def __init__(self, reporter=None):
+        self.reporter = reporter if reporter is not None else ConsoleReporter()
         self.stack = [0]
         self.symbols = []
-        self.closures = closures
-        self.transitions = transitions
-        self.terminals = terminals
-        self.nonterminals = nonterminals
+        self.tables = TABELAS
+        self.terminals = TABELAS.terminals
+        self.nonterminals = TABELAS.nonterminals
         self.follow = FOLLOW
-        self.productions = self._extract_productions()
-    
-    def _extract_productions(self):
-        prods = {}
-        for state, closure in self.closures.items():
-            if isinstance(closure, set):
-                for item in closure:
-                    if len(item) == 2:
-                        lhs, rhs = item
-                        if len(rhs) > 0 and rhs[-1] == ".":
-                            symbols = [s for s in rhs[:-1] if s != "."]
-                            if not symbols:
-                                symbols = ["ε"]
-                            prods[state] = (lhs, symbols)
-            elif isinstance(closure, list):
-                for item in closure:
-                    if "->" in item and item.endswith("."):
-                        parts = item.split("->")
-                        lhs = parts[0].strip()
-                        rhs = parts[1].strip().rstrip(".")
-                        if rhs == "ε":
-                            symbols = ["ε"]
-                        else:
-                            symbols = rhs.split()
-                        prods[state] = (lhs, symbols)
-                        break
-        return prods
+        self.productions = [(lhs, list(rhs) or ["ε"]) for lhs, rhs in self.tables.productions]
     
     def parse(self, tokens):
-        print("=== Análise Sintática SLR(1) ===\n")
+        self.reporter.trace("=== Análise Sintática SLR(1) ===\n")
         token_index = 0
         current_token = tokens[token_index] if token_index < len(tokens) else ("$", "$")
         step = 1
@@ -337,15 +513,13 @@ class SLRParser:
             state = self.stack[-1]
             lookahead = current_token[0]
             
-            print(f"Passo {step}: Stack={self.stack}, Estado={state}, Lookahead={lookahead}")
+            self.reporter.trace(f"Passo {step}: Stack={self.stack}, Estado={state}, Lookahead={lookahead}")
             
-            if state == 1 and lookahead == "$":
-                print("\n[OK] ACEITO!\n")
-                return True
+            acao = self.tables.acao(state, lookahead)
             
-            if (state, lookahead) in self.transitions:
-                next_state = self.transitions[(state, lookahead)]
-                print(f"  SHIFT -> {next_state}\n")
+            if acao > 0:
+                next_state = acao - 1
+                self.reporter.trace(f"  SHIFT -> {next_state}\n")
                 self.stack.append(next_state)
                 self.symbols.append(lookahead)
                 token_index += 1
@@ -353,65 +527,30 @@ class SLRParser:
                 step += 1
                 continue
             
-            if (state, "ε") in self.transitions:
-                next_state = self.transitions[(state, "ε")]
-                print(f"  REDUCE EXPR' -> ε via estado {next_state}")
-                # Estado 38 é EXPR' -> ε., então devemos fazer GOTO de volta
-                # Não empilhamos ε, fazemos o GOTO diretamente
-                if next_state == 38:
-                    # Pop do estado ε e faz GOTO com EXPR'
-                    if (state, "EXPR'") in self.transitions:
-                        expr_state = self.transitions[(state, "EXPR'")]
-                        print(f"  GOTO({state}, EXPR') = {expr_state}\n")
-                        self.stack.append(expr_state)
-                        self.symbols.append("EXPR'")
-                        step += 1
-                        continue
-                else:
-                    self.stack.append(next_state)
-                    self.symbols.append("ε")
-                    step += 1
-                    continue
-            
-            found_goto = False
-            for nt in self.nonterminals:
-                if (state, nt) in self.transitions and nt == "EXPR'" and lookahead in self.follow.get("EXPR'", set()):
-                    print(f"  REDUCE EXPR' -> ε")
-                    next_state = self.transitions[(state, nt)]
-                    print(f"  GOTO({state}, {nt}) = {next_state}\n")
-                    self.stack.append(next_state)
-                    self.symbols.append(nt)
-                    step += 1
-                    found_goto = True
-                    break
-            
-            if found_goto:
-                continue
+            if acao == ERRO:
+                self.reporter.trace(f"\n[X] ERRO SINTÁTICO! Estado={state}, Lookahead={lookahead}\n")
+                return False
             
-            if state in self.productions:
-                lhs, rhs = self.productions[state]
-                if lookahead in self.follow.get(lhs, set()) or lookahead == "$":
-                    print(f"  REDUCE {lhs} -> {' '.join(rhs)}")
-                    if rhs != ["ε"]:
-                        for _ in range(len(rhs)):
-                            if self.stack:
-                                self.stack.pop()
-                            if self.symbols:
-                                self.symbols.pop()
-                    state_after = self.stack[-1] if self.stack else 0
-                    if (state_after, lhs) in self.transitions:
-                        goto_state = self.transitions[(state_after, lhs)]
-                        print(f"  GOTO({state_after}, {lhs}) = {goto_state}\n")
-                        self.stack.append(goto_state)
-                        self.symbols.append(lhs)
-                        step += 1
-                        continue
-                    else:
-                        print(f"\n[X] ERRO: GOTO({state_after}, {lhs}) não encontrado!\n")
-                        return False
+            prod = -acao - 1
+            if prod == 0:
+                self.reporter.trace("\n[OK] ACEITO!\n")
+                return True
             
-            print(f"\n[X] ERRO SINTÁTICO! Estado={state}, Lookahead={lookahead}\n")
-            return False
+            lhs, rhs = self.productions[prod]
+            self.reporter.trace(f"  REDUCE {lhs} -> {' '.join(rhs)}")
+            n = self.tables.prod_len[prod]
+            if n:
+                del self.stack[-n:]
+                del self.symbols[-n:]
+            state_after = self.stack[-1] if self.stack else 0
+            goto_state = self.tables.desvio(state_after, lhs)
+            if goto_state == SEM_GOTO:
+                self.reporter.trace(f"\n[X] ERRO: GOTO({state_after}, {lhs}) não encontrado!\n")
+                return False
+            self.reporter.trace(f"  GOTO({state_after}, {lhs}) = {goto_state}\n")
+            self.stack.append(goto_state)
+            self.symbols.append(lhs)
+            step += 1
     
     def reset(self):
         self.stack = [0]
@@ -430,7 +569,7 @@ def main():
     - Teste 5: Erro léxico (caractere inválido)
     - Teste 6: Erro sintático estrutural (parênteses)
     """
-    compilador = CompiladorCompleto(verbose=False)
+    compilador = CompiladorCompleto(verbose=False, reporter=ConsoleReporter())
     
     # ========================================================================
     # TESTE 1: PROGRAMA CORRETO (expressão complexa)
@@ -452,7 +591,9 @@ def main():
         print("      Sintaxe: CORRETA")
         print("      Semântica: CORRETA")
         print("      Variável 'resultado' declarada e inicializada")
-        print("      Valor calculado: 10 + 20 - 5 = 25")
+        # Valor dobrado em tempo de compilação (otimizador.dobrar_constantes)
+        simbolo = compilador.parser.symbol_table.global_scope.symbols["resultado"]
+        print(f"      Valor calculado: 10 + 20 - 5 = {simbolo.value}")
     else:
         print("[X] TESTE 1: ERRO NA COMPILAÇÃO (INESPERADO)")
     print("-"*80)
@@ -1 +1,4 @@
-nonterminals = {"S","S'","CMD","EXPR","EXPR'","TERM","UNARY","FACTOR","IO","LHS","OP"}
+"""Não-terminais da gramática, extraídos por gerador_slr de regrasSintáticas.txt"""
+from gerador_slr import carregar_gramatica
+
+nonterminals = set(carregar_gramatica().nonterminals)
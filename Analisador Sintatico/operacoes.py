@@ -0,0 +1,29 @@
+"""
+Operações da Linguagem
+Semântica dos operadores binários, compartilhada pelo otimizador, pela
+máquina virtual e pelo interpretador
+
+Valores inteiros; verdadeiro = 1, falso = 0. KO (pertence) depende de
+coleções em execução, então fica fora de DOBRAVEIS: o otimizador só avalia
+as operações de lá. A máquina virtual reproduz + - ANRK AAN nos próprios
+opcodes (ver vm.executar) e usa contem para KO.
+"""
+
+
+def contem(a, b):
+    """a KO b: pertinência quando b é uma coleção, igualdade para inteiros"""
+    if isinstance(b, int):
+        return int(a == b)
+    return int(a in b)
+
+
+# Operador -> função de dois inteiros, avaliáveis em tempo de compilação
+DOBRAVEIS = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "ANRK": lambda a, b: int(bool(a) and bool(b)),
+    "AAN": lambda a, b: int(bool(a) or bool(b)),
+}
+
+# Todos os operadores binários (execução)
+OPERACOES = dict(DOBRAVEIS, KO=contem)
@@ -0,0 +1,196 @@
+"""
+Dobramento de Constantes
+Avalia em tempo de compilação as expressões da AST cujos operandos são conhecidos
+
+Operações dobradas (valores inteiros; verdadeiro = 1, falso = 0):
+    a + b, a - b, a ANRK b (e), a AAN b (ou), NUST a (não)
+KO (pertence) depende de coleções em execução e nunca é dobrado.
+
+Uma variável é substituída pelo seu valor apenas se nunca for alterada depois
+da declaração (nenhum 'assign', 'HIM' ou 'HON' a atinge) e se a declaração
+não estiver no corpo de um LOS, FOD ou FAH: só então ela domina todos os
+usos e o resultado vale em qualquer caminho de execução, inclusive dentro de
+laços. Uma declaração condicional pode nem executar (ex: LOS 0), e a
+variável seguiria visível depois do corpo sem valor.
+"""
+
+import ast_nodes
+from operacoes import DOBRAVEIS as OPERACOES
+
+
+def dobrar_expressao(expr, constantes=None):
+    """
+    Dobra uma expressão e retorna a nova árvore (os nós originais não mudam)
+
+    Args:
+        expr: Nó de expressão (ast_nodes.Expression)
+        constantes: Função Variable -> valor inteiro conhecido ou None
+    """
+    # Pós-ordem iterativa: cadeias longas de BinaryOp não esgotam a pilha
+    resultados = []
+    pendentes = [(expr, False)]
+    while pendentes:
+        node, visitado = pendentes.pop()
+        tipo = type(node)
+
+        if tipo is ast_nodes.BinaryOp:
+            if not visitado:
+                pendentes.append((node, True))
+                pendentes.append((node.right, False))
+                pendentes.append((node.left, False))
+                continue
+            right = resultados.pop()
+            left = resultados.pop()
+            operacao = OPERACOES.get(node.op)
+            if (operacao is not None and type(left) is ast_nodes.Number
+                    and type(right) is ast_nodes.Number):
+                resultados.append(ast_nodes.Number(operacao(left.value, right.value), line=node.line))
+            elif left is node.left and right is node.right:
+                resultados.append(node)
+            else:
+                resultados.append(ast_nodes.BinaryOp(node.op, left, right, line=node.line))
+
+        elif tipo is ast_nodes.Not:
+            if not visitado:
+                pendentes.append((node, True))
+                pendentes.append((node.operand, False))
+                continue
+            operand = resultados.pop()
+            if type(operand) is ast_nodes.Number:
+                resultados.append(ast_nodes.Number(int(not operand.value), line=node.line))
+            elif operand is node.operand:
+                resultados.append(node)
+            else:
+                resultados.append(ast_nodes.Not(operand, line=node.line))
+
+        elif tipo is ast_nodes.Variable and constantes is not None:
+            valor = constantes(node)
+            resultados.append(node if valor is None else ast_nodes.Number(valor, line=node.line))
+
+        else:
+            resultados.append(node)
+
+    return resultados[0]
+
+
+class _Dobrador:
+    """
+    Percorre os comandos na ordem do programa espelhando os escopos da tabela
+
+    Cada módulo (KEL) usa o escopo que a análise semântica abriu para ele
+    (Module.scope), então cada nome resolve para o mesmo Symbol que ela
+    encontrou, mesmo quando a recuperação de erros descartou outros módulos
+    cujos escopos continuam na tabela. Um Module sem escopo (ex: vindo de
+    Arena.decode) tem o corpo percorrido sem dobrar declarações.
+    """
+
+    def __init__(self, symbol_table):
+        self.symbol_table = symbol_table
+        self.alterados = set()    # ids dos Symbol alterados após a declaração
+        self.constantes = {}      # id do Symbol -> valor inteiro dobrado
+        self.dobrar = False       # Primeira passada só coleta os alterados
+        self.corpos = 0           # Profundidade em corpos de LOS/FOD/FAH
+
+    def executar(self, tree):
+        for dobrar in (False, True):
+            self.dobrar = dobrar
+            self.escopo = self.symbol_table.global_scope
+            self.visiveis = {}    # Nome -> pilha de Symbol visíveis
+            self.declarados = [[]]  # Nomes declarados por nível (para desfazer)
+            self._comando(tree)
+
+    def _resolver(self, nome):
+        pilha = self.visiveis.get(nome)
+        return pilha[-1] if pilha else None
+
+    def _valor(self, variable):
+        symbol = self._resolver(variable.name)
+        return self.constantes.get(id(symbol)) if symbol is not None else None
+
+    def _expressao(self, expr):
+        if not self.dobrar:
+            return expr
+        return dobrar_expressao(expr, self._valor)
+
+    def _escrita(self, nome):
+        symbol = self._resolver(nome)
+        if symbol is not None:
+            self.alterados.add(id(symbol))
+        return symbol
+
+    def _corpo(self, body):
+        self.corpos += 1
+        self._comando(body)
+        self.corpos -= 1
+
+    def _comando(self, node):
+        tipo = type(node)
+
+        if tipo is ast_nodes.Sequence:
+            for cmd in node.commands:
+                self._comando(cmd)
+
+        elif tipo is ast_nodes.Declaration:
+            node.value = self._expressao(node.value)
+            symbol = self.escopo.symbols.get(node.name) if self.escopo is not None else None
+            if symbol is None:
+                return
+            if self._resolver(node.name) is symbol:
+                self.alterados.add(id(symbol))  # Redeclaração no mesmo escopo
+            else:
+                self.visiveis.setdefault(node.name, []).append(symbol)
+                self.declarados[-1].append(node.name)
+            if self.dobrar:
+                symbol.value = node.value
+                if (id(symbol) not in self.alterados and not self.corpos
+                        and type(node.value) is ast_nodes.Number):
+                    self.constantes[id(symbol)] = node.value.value
+
+        elif tipo is ast_nodes.Assignment:
+            node.value = self._expressao(node.value)
+            symbol = self._escrita(node.target.name)
+            if type(node.target) is ast_nodes.Variable and symbol is not None and self.dobrar:
+                symbol.value = node.value
+
+        elif tipo is ast_nodes.If:
+            node.condition = self._expressao(node.condition)
+            self._corpo(node.body)
+
+        elif tipo is ast_nodes.While or tipo is ast_nodes.For:
+            self._corpo(node.body)
+            node.condition = self._expressao(node.condition)
+
+        elif tipo is ast_nodes.InputOutput:
+            if node.op == "HON":
+                self._escrita(node.name)
+
+        elif tipo is ast_nodes.Return:
+            node.value = self._expressao(node.value)
+
+        elif tipo is ast_nodes.Module:
+            pai = self.escopo
+            self.escopo = node.scope
+            self.declarados.append([])
+
+            self._comando(node.body)
+
+            for nome in self.declarados.pop():
+                self.visiveis[nome].pop()
+            self.escopo = pai
+
+
+def dobrar_constantes(tree, symbol_table):
+    """
+    Dobra as expressões do programa e grava os valores em Symbol.value
+
+    A AST é alterada no lugar: cada expressão de Declaration, Assignment,
+    Return e das condições passa a ser sua forma dobrada, e Symbol.value
+    recebe a expressão dobrada da última atribuição (um ast_nodes.Number
+    quando o valor é conhecido).
+
+    Args:
+        tree: AST do programa (ParseContext.tree)
+        symbol_table: SymbolTable preenchida pela mesma análise
+    """
+    _Dobrador(symbol_table).executar(tree)
+    return tree
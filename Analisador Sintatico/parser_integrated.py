@@ -3,21 +3,105 @@ Parser SLR(1) Integrado com Análise Semântica
 Inclui: Tratamento de erros, Tabela de Símbolos, Atributos e Valores
 """
 
-from SLR import closures
-from goto import transitions
-from terminais import terminals
-from nao_terminais import nonterminals
-from follow import FOLLOW
+import threading
+from itertools import chain
+
+import ast_nodes
+from diagnosticos import Diagnostic
+from otimizador import dobrar_constantes
+from reporter import ConsoleReporter, NullReporter
 from symbol_table import SymbolTable
+from gerador_slr import tabelas_em_cache
+from tabelas import ERRO, SEM_GOTO
+
+# Tabelas ACTION/GOTO lidas do cache binário (geradas só quando a gramática muda)
+TABELAS = tabelas_em_cache()
+FOLLOW = TABELAS.follow_sets()
+
+# Produções indexadas pelo id usado na matriz ACTION ('epsilon' marca o lado direito vazio)
+PRODUCOES = tuple((lhs, rhs or ("epsilon",)) for lhs, rhs in TABELAS.productions)
+PRODUCAO_IDS = {producao: i for i, producao in enumerate(PRODUCOES)}
+
+# Ação semântica de cada produção (nome do método de SLRParserWithSemantics).
+# Produções ausentes usam _acao_padrao, que sintetiza o primeiro atributo.
+ACOES_SEMANTICAS = {
+    ("S", ("CMD", ";", "S")): "_acao_sequencia",
+    ("S", ("CMD",)): "_acao_sequencia_unica",
+    ("CMD", ("LOS", "EXPR", "CMD")): "_acao_se",
+    ("CMD", ("FOD", "CMD", "FAH", "EXPR")): "_acao_enquanto",
+    ("CMD", ("FAH", "CMD", "FAH", "EXPR")): "_acao_para",
+    ("CMD", ("FUS", "id", ":=", "EXPR")): "_acao_declaracao",
+    ("CMD", ("KEL", "id", "CMD")): "_acao_modulo",
+    ("CMD", ("LHS", ":=", "EXPR")): "_acao_atribuicao",
+    ("CMD", ("IO", "id")): "_acao_io",
+    ("CMD", ("JUN", "EXPR")): "_acao_retorno",
+    ("LHS", ("assign", "id")): "_acao_lhs_assign",
+    ("LHS", ("HIM", ".", "id")): "_acao_membro",
+    ("EXPR", ("TERM", "EXPR'")): "_acao_expr",
+    ("EXPR'", ("OP", "TERM", "EXPR'")): "_acao_expr_linha",
+    ("EXPR'", ("epsilon",)): "_acao_vazia",
+    ("OP", ("+",)): "_acao_operador",
+    ("OP", ("-",)): "_acao_operador",
+    ("OP", ("ANRK",)): "_acao_operador",
+    ("OP", ("AAN",)): "_acao_operador",
+    ("OP", ("KO",)): "_acao_operador",
+    ("UNARY", ("NUST", "TERM")): "_acao_unario",
+    ("FACTOR", ("id",)): "_acao_factor_id",
+    ("FACTOR", ("num",)): "_acao_factor_num",
+    ("FACTOR", ("HIM", ".", "id")): "_acao_membro",
+    ("FACTOR", ("(", "EXPR", ")")): "_acao_parenteses",
+}
+
+# Recuperação de erros em modo pânico: a pilha volta a um estado com GOTO em
+# CMD e a entrada é descartada até um token de FOLLOW(CMD) (';', 'FAH', '$')
+CMD_ID = TABELAS.nonterminal_ids["CMD"]
+SINCRONIZACAO = TABELAS.follow[CMD_ID]   # Bitset de ids de terminais
+# Terminais que iniciam um comando (esperados no estado 0), para a correção
+# em nível de frase que insere um ';' ausente
+INICIO_CMD = TABELAS.expected[0]
+
+# Vetor de despacho: nome da ação indexado pelo id da produção na matriz ACTION
+ACOES_POR_PRODUCAO = tuple(ACOES_SEMANTICAS.get(producao, "_acao_padrao") for producao in PRODUCOES)
+
+# Tipos de token internados como inteiros pequenos. Os terminais da gramática
+# ocupam os ids 0..n-1, que são as próprias colunas da matriz ACTION; tipos
+# fora da gramática recebem ids a partir de n e sempre resultam em erro.
+TOKEN_TYPES = list(TABELAS.terminals)
+TOKEN_TYPE_IDS = {token_type: i for i, token_type in enumerate(TOKEN_TYPES)}
+_TOKEN_TYPES_LOCK = threading.Lock()
+
+
+def token_type_id(token_type):
+    """Retorna o id inteiro do tipo de token, internando tipos novos"""
+    kind = TOKEN_TYPE_IDS.get(token_type)
+    if kind is None:
+        with _TOKEN_TYPES_LOCK:
+            kind = TOKEN_TYPE_IDS.get(token_type)
+            if kind is None:
+                # Publica o nome antes do id: leitores sem lock nunca veem um id sem nome
+                kind = len(TOKEN_TYPES)
+                TOKEN_TYPES.append(token_type)
+                TOKEN_TYPE_IDS[token_type] = kind
+    return kind
+
 
 class Token:
     """Token com atributos completos para análise semântica"""
-    def __init__(self, token_type, lexeme, line, column=0, value=None):
-        self.type = token_type      # Tipo do token (id, num, etc)
+    __slots__ = ("kind", "lexeme", "line", "column", "value", "offset")
+    
+    def __init__(self, token_type, lexeme, line, column=0, value=None, offset=None):
+        kind = TOKEN_TYPE_IDS.get(token_type)
+        self.kind = kind if kind is not None else token_type_id(token_type)  # Tipo internado
         self.lexeme = lexeme          # Texto literal (nome da variável, valor)
         self.line = line              # Linha no código fonte
         self.column = column          # Coluna no código fonte
         self.value = value            # Valor semântico (para num, strings)
+        self.offset = offset          # Posição do lexema na fonte (None se desconhecida)
+    
+    @property
+    def type(self):
+        """Tipo do token (id, num, etc)"""
+        return TOKEN_TYPES[self.kind]
     
     def __repr__(self):
         return f"Token({self.type}, '{self.lexeme}', L{self.line})"
@@ -33,399 +117,701 @@ class SemanticError(Exception):
         super().__init__(f"{error_type} ERROR (Line {line}): {message}")
 
 
-class SLRParserWithSemantics:
-    """Parser SLR(1) com análise semântica integrada"""
+class ParseCheckpoints:
+    """
+    Estados salvos nos SHIFTs de ';' de S -> CMD ; S (ver save_checkpoint)
+    
+    Como S é recursiva à direita, a pilha num ';' é prefixo da pilha em
+    qualquer ';' seguinte: as três pilhas são guardadas uma única vez, até
+    o último checkpoint, e cada checkpoint é só a altura delas mais as
+    marcas da tabela de símbolos e da lista de erros.
+    """
+    __slots__ = ("stack", "symbols", "attributes", "depths", "table_marks", "n_errors")
+    
+    def __init__(self):
+        self.stack = [0]              # Pilhas até o último checkpoint
+        self.symbols = []
+        self.attributes = []
+        self.depths = []              # Altura da pilha de símbolos em cada checkpoint
+        self.table_marks = []         # Marca de SymbolTable.checkpoint() em cada um
+        self.n_errors = []            # Quantidade de erros em cada um
+    
+    def __len__(self):
+        return len(self.depths)
+
+
+class ParseContext:
+    """Estado de uma análise: pilhas, tabela de símbolos, erros e avisos"""
+    __slots__ = ("stack", "symbols", "attributes", "symbol_table", "errors", "warnings", "tree",
+                 "checkpoints")
     
-    def __init__(self, verbose=True):
+    def __init__(self):
         self.stack = [0]
         self.symbols = []             # Pilha de símbolos sintáticos
         self.attributes = []          # Pilha de atributos semânticos
-        self.closures = closures
-        self.transitions = transitions
-        self.terminals = terminals
-        self.nonterminals = nonterminals
+        self.errors = []              # Erros sintáticos + semânticos (Diagnostic)
+        self.warnings = []            # Avisos (Diagnostic)
+        # A tabela registra direto nas listas do contexto: cada diagnóstico aparece uma vez
+        self.symbol_table = SymbolTable(self.errors, self.warnings)
+        self.tree = None              # AST do programa (ast_nodes.Sequence) após a aceitação
+        self.checkpoints = None       # ParseCheckpoints (None: não salva)
+    
+    def has_errors(self):
+        """Verifica se há erros"""
+        return len(self.errors) > 0
+
+
+class SLRParserWithSemantics:
+    """
+    Parser SLR(1) com análise semântica integrada
+    
+    A instância guarda apenas configuração e referências às tabelas imutáveis
+    compartilhadas (TABELAS, PRODUCOES); o estado de cada análise fica num
+    ParseContext. Passando um contexto próprio a parse(), a mesma instância
+    atende várias threads ao mesmo tempo sem cópias nem locks:
+    
+        ctx = ParseContext()
+        ok = parser.parse(tokens, ctx)
+    
+    Sem contexto, parse() usa self.context, recriado por reset().
+    """
+    
+    # Ações no meio da regra: (símbolo anterior, terminal empilhado) -> método
+    # chamado com (token, context) logo após o SHIFT do terminal
+    MID_RULE_ACTIONS = {("KEL", "id"): "enter_module"}
+    
+    def __init__(self, verbose=True, fold_constants=True, error_recovery=True, reporter=None):
+        """
+        Args:
+            verbose: Gera o passo a passo da análise (SHIFT/REDUCE/ações)
+            reporter: Destino do passo a passo (trace, ver reporter.py); padrão:
+                ConsoleReporter se verbose, senão NullReporter
+        """
+        if reporter is None:
+            reporter = ConsoleReporter() if verbose else NullReporter()
+        self.reporter = reporter
+        self.tables = TABELAS
+        self.terminals = TABELAS.terminals
+        self.nonterminals = TABELAS.nonterminals
         self.follow = FOLLOW
-        self.productions = self._extract_productions()
-        self.symbol_table = SymbolTable()
-        self.verbose = verbose
-        self.errors = []              # Lista de erros (sintáticos + semânticos)
-        self.warnings = []
-    
-    def _extract_productions(self):
-        """Extrai produções dos closures"""
-        prods = {}
-        for state, closure in self.closures.items():
-            if isinstance(closure, set):
-                for item in closure:
-                    if len(item) == 2:
-                        lhs, rhs = item
-                        if len(rhs) > 0 and rhs[-1] == ".":
-                            symbols = [s for s in rhs[:-1] if s != "."]
-                            if not symbols:
-                                symbols = ["epsilon"]
-                            prods[state] = (lhs, symbols)
-            elif isinstance(closure, list):
-                for item in closure:
-                    if "->" in item and item.endswith("."):
-                        parts = item.split("->")
-                        lhs = parts[0].strip()
-                        rhs = parts[1].strip().rstrip(".")
-                        if rhs == "epsilon":
-                            symbols = ["epsilon"]
-                        else:
-                            symbols = rhs.split()
-                        prods[state] = (lhs, symbols)
-                        break
-        return prods
-    
-    def semantic_action(self, production_lhs, production_rhs, attributes):
+        self.productions = PRODUCOES
+        # Ações semânticas ligadas à instância, indexadas pelo id da produção
+        self.actions = tuple(getattr(self, name) for name in ACOES_POR_PRODUCAO)
+        self.verbose = verbose and not reporter.silent  # Sem destino, nem monta as mensagens
+        self.fold_constants = fold_constants  # Dobra constantes da AST na aceitação
+        self.error_recovery = error_recovery  # Continua após erros sintáticos (modo pânico)
+        self.context = ParseContext()  # Contexto padrão (uso de uma thread só)
+    
+    # Estado do contexto padrão, mantido como atributos para compatibilidade
+    stack = property(lambda self: self.context.stack)
+    symbols = property(lambda self: self.context.symbols)
+    attributes = property(lambda self: self.context.attributes)
+    symbol_table = property(lambda self: self.context.symbol_table)
+    errors = property(lambda self: self.context.errors)
+    warnings = property(lambda self: self.context.warnings)
+    
+    def enter_module(self, module_token, context=None):
+        """
+        Ação no meio da regra CMD -> KEL id CMD, executada no SHIFT de 'id'
+        
+        Declara o módulo no escopo atual e abre o escopo dele antes do corpo,
+        para que as declarações do corpo fiquem dentro do módulo.
+        """
+        symbol_table = (self.context if context is None else context).symbol_table
+        
+        if self.verbose:
+            self.reporter.trace(f"[Semântico] Definindo módulo '{module_token.lexeme}' (linha {module_token.line})")
+        
+        symbol_table.declare(
+            module_token.lexeme,
+            symbol_type="module",
+            line=module_token.line,
+            token=module_token
+        )
+        symbol_table.enter_scope(module_token.lexeme)
+    
+    def save_checkpoint(self, semicolon_token, context):
+        """
+        Ação no SHIFT de ';' em S -> CMD ; S, ativa quando context.checkpoints
+        não é None
+        
+        Todo ';' da gramática separa comandos de nível superior, então aqui
+        só o escopo global está aberto e o estado pode ser retomado depois
+        por restore_checkpoint.
+        """
+        checkpoints = context.checkpoints
+        base = len(checkpoints.symbols)
+        checkpoints.stack.extend(context.stack[base + 1:])
+        checkpoints.symbols.extend(context.symbols[base:])
+        checkpoints.attributes.extend(context.attributes[base:])
+        checkpoints.depths.append(len(context.symbols))
+        checkpoints.table_marks.append(context.symbol_table.checkpoint())
+        checkpoints.n_errors.append(len(context.errors))
+    
+    def restore_checkpoint(self, context, index):
+        """
+        Volta o contexto ao estado do checkpoint index (descarta os seguintes)
+        
+        Depois disso, parse(tokens, context) continua a análise a partir do
+        token seguinte ao ';' do checkpoint.
+        """
+        checkpoints = context.checkpoints
+        depth = checkpoints.depths[index]
+        table_mark = checkpoints.table_marks[index]
+        n_errors = checkpoints.n_errors[index]
+        for saved in (checkpoints.depths, checkpoints.table_marks, checkpoints.n_errors):
+            del saved[index + 1:]
+        del checkpoints.stack[depth + 1:]
+        del checkpoints.symbols[depth:]
+        del checkpoints.attributes[depth:]
+        
+        context.stack = checkpoints.stack[:]
+        context.symbols = checkpoints.symbols[:]
+        context.attributes = checkpoints.attributes[:]
+        context.symbol_table.rollback(table_mark)
+        del context.errors[n_errors:]     # Erros sintáticos (a tabela já cortou os seus)
+        context.tree = None
+    
+    def semantic_action(self, production_lhs, production_rhs, attributes, context=None):
         """
         Executa ações semânticas durante redução
         
         Args:
             production_lhs: Lado esquerdo da produção
-            production_rhs: Lado direito da produção (símbolos)
+            production_rhs: Lado direito da produção (tupla de símbolos)
             attributes: Lista de atributos dos símbolos (na ordem da produção)
+            context: ParseContext da análise (padrão: self.context)
         
         Returns:
             Atributo sintetizado para o não-terminal da esquerda
         """
+        symbol_table = (self.context if context is None else context).symbol_table
+        prod = PRODUCAO_IDS.get((production_lhs, tuple(production_rhs)))
+        action = self.actions[prod] if prod is not None else self._acao_padrao
+        return action(attributes, symbol_table)
+    
+    # ------------------------------------------------------------------------
+    # Ações semânticas por produção: recebem (atributos, tabela de símbolos)
+    # e retornam o atributo sintetizado. Registradas em ACOES_SEMANTICAS.
+    # ------------------------------------------------------------------------
+    
+    def _acao_padrao(self, attributes, symbol_table):
+        """Padrão: retorna primeiro atributo ou None"""
+        return attributes[0] if attributes else None
+    
+    def _acao_sequencia(self, attributes, symbol_table):
+        """
+        S -> CMD ; S
         
-        # FUS id := EXPR - Declaração com atribuição
-        if production_lhs == "CMD" and len(production_rhs) == 4:
-            if production_rhs[0] == "FUS" and production_rhs[2] == ":=":
-                var_token = attributes[1]  # Token do 'id'
-                expr_value = attributes[3]  # Valor da expressão
-                
-                if self.verbose:
-                    print(f"[Semântico] Declarando '{var_token.lexeme}' = {expr_value} (linha {var_token.line})")
-                
-                # Declara na tabela de símbolos
-                self.symbol_table.declare(
-                    var_token.lexeme,
-                    symbol_type="variable",
-                    line=var_token.line,
-                    value=expr_value
-                )
-                
-                return {"type": "declaration", "name": var_token.lexeme, "value": expr_value}
+        A lista é acumulada de trás para frente (append em O(1)) e invertida
+        uma única vez na aceitação.
+        """
+        sequence = attributes[2]
+        sequence.commands.append(attributes[0])
+        sequence.line = attributes[0].line
+        return sequence
+    
+    def _acao_sequencia_unica(self, attributes, symbol_table):
+        """S -> CMD"""
+        return ast_nodes.Sequence([attributes[0]], line=attributes[0].line)
+    
+    def _acao_declaracao(self, attributes, symbol_table):
+        """CMD -> FUS id := EXPR (declaração com atribuição)"""
+        var_token = attributes[1]  # Token do 'id'
+        expr_value = attributes[3]  # Expressão (AST)
         
-        # LHS := EXPR - Atribuição
-        elif production_lhs == "CMD" and len(production_rhs) == 3:
-            if production_rhs[1] == ":=":
-                lhs_info = attributes[0]   # Informações do LHS
-                expr_value = attributes[2] # Valor da expressão
-                
-                if lhs_info and "name" in lhs_info:
-                    var_name = lhs_info["name"]
-                    var_line = lhs_info.get("line", 0)
-                    
-                    if self.verbose:
-                        print(f"[Semântico] Atribuindo '{var_name}' = {expr_value} (linha {var_line})")
-                    
-                    # Verifica se a variável foi declarada
-                    symbol = self.symbol_table.lookup(var_name, line=var_line)
-                    if symbol:
-                        symbol.value = expr_value  # Atualiza o valor
-                    
-                    return {"type": "assignment", "name": var_name, "value": expr_value}
-        
-        # LHS -> assign id
-        elif production_lhs == "LHS" and len(production_rhs) == 2:
-            if production_rhs[0] == "assign":
-                id_token = attributes[1]
-                return {"name": id_token.lexeme, "line": id_token.line}
-        
-        # LHS -> HIM . id (acesso a membro)
-        elif production_lhs == "LHS" and len(production_rhs) == 3:
-            if production_rhs[0] == "HIM":
-                id_token = attributes[2]
-                return {"name": f"HIM.{id_token.lexeme}", "line": id_token.line, "scoped": True}
-        
-        # KEL id CMD - Módulo
-        elif production_lhs == "CMD" and len(production_rhs) == 3:
-            if production_rhs[0] == "KEL":
-                module_token = attributes[1]
-                
-                if self.verbose:
-                    print(f"[Semântico] Definindo módulo '{module_token.lexeme}' (linha {module_token.line})")
-                
-                # Nota: enter_scope/exit_scope devem ser chamados durante o parsing
-                # Aqui apenas registramos o módulo
-                self.symbol_table.declare(
-                    module_token.lexeme,
-                    symbol_type="module",
-                    line=module_token.line
-                )
-                
-                return {"type": "module", "name": module_token.lexeme}
+        if self.verbose:
+            self.reporter.trace(f"[Semântico] Declarando '{var_token.lexeme}' = {expr_value} (linha {var_token.line})")
         
-        # IO id - Input/Output
-        elif production_lhs == "CMD" and len(production_rhs) == 2:
-            if production_rhs[0] == "IO":
-                id_token = attributes[1]
-                
-                if self.verbose:
-                    print(f"[Semântico] I/O com '{id_token.lexeme}' (linha {id_token.line})")
-                
-                # Verifica se foi declarado
-                self.symbol_table.lookup(id_token.lexeme, line=id_token.line)
-                
-                return {"type": "io", "name": id_token.lexeme}
+        # Declara na tabela de símbolos
+        symbol_table.declare(
+            var_token.lexeme,
+            symbol_type="variable",
+            line=var_token.line,
+            value=expr_value,
+            token=var_token
+        )
         
-        # JUN EXPR - Return
-        elif production_lhs == "CMD" and len(production_rhs) == 2:
-            if production_rhs[0] == "JUN":
-                expr_value = attributes[1]
-                
-                if self.verbose:
-                    print(f"[Semântico] Return {expr_value}")
-                
-                return {"type": "return", "value": expr_value}
+        # Redeclaração (já reportada) reaproveita o endereço do símbolo existente
+        symbol = symbol_table.current_scope.symbols[var_token.lexeme]
+        return ast_nodes.Declaration(var_token.lexeme, expr_value, line=attributes[0].line,
+                                     depth=symbol.depth, slot=symbol.slot)
+    
+    def _acao_modulo(self, attributes, symbol_table):
+        """
+        CMD -> KEL id CMD (módulo)
         
-        # FACTOR -> id (uso de variável)
-        elif production_lhs == "FACTOR" and len(production_rhs) == 1:
-            if production_rhs[0] == "id":
-                id_token = attributes[0]
-                
-                # Busca na tabela de símbolos
-                symbol = self.symbol_table.lookup(id_token.lexeme, line=id_token.line)
-                
-                if symbol:
-                    return symbol.value if symbol.value is not None else f"${id_token.lexeme}"
-                else:
-                    return f"${id_token.lexeme}"  # Placeholder
-        
-        # FACTOR -> num
-        elif production_lhs == "FACTOR" and len(production_rhs) == 1:
-            if production_rhs[0] == "num":
-                num_token = attributes[0]
-                return num_token.value if hasattr(num_token, 'value') else num_token.lexeme
-        
-        # EXPR -> TERM EXPR'
-        elif production_lhs == "EXPR" and len(production_rhs) == 2:
-            term_value = attributes[0]
-            expr_prime = attributes[1]
-            
-            if expr_prime and isinstance(expr_prime, dict) and "op" in expr_prime:
-                # Há operação: term op term'
-                return f"({term_value} {expr_prime['op']} {expr_prime['right']})"
-            else:
-                return term_value
-        
-        # EXPR' -> OP TERM EXPR'
-        elif production_lhs == "EXPR'" and len(production_rhs) == 3:
-            op = attributes[0]
-            term = attributes[1]
-            expr_prime = attributes[2]
-            
-            if expr_prime and isinstance(expr_prime, dict) and "op" in expr_prime:
-                return {"op": op, "right": f"({term} {expr_prime['op']} {expr_prime['right']})"}
-            else:
-                return {"op": op, "right": term}
+        O escopo foi aberto por enter_module no SHIFT de 'KEL id'; aqui, com o
+        corpo já reduzido, ele é fechado.
+        """
+        module_token = attributes[1]
+        scope = symbol_table.current_scope
+        symbol_table.exit_scope()
+        return ast_nodes.Module(module_token.lexeme, attributes[2], line=attributes[0].line,
+                                size=len(scope.symbols), scope=scope)
+    
+    def _acao_atribuicao(self, attributes, symbol_table):
+        """CMD -> LHS := EXPR (atribuição)"""
+        target = attributes[0]     # Variable ou Member
+        expr_value = attributes[2] # Expressão (AST)
         
-        # EXPR' -> epsilon
-        elif production_lhs == "EXPR'" and production_rhs == ["epsilon"]:
-            return None
+        if self.verbose:
+            self.reporter.trace(f"[Semântico] Atribuindo '{target}' = {expr_value} (linha {target.line})")
         
-        # OP -> operadores
-        elif production_lhs == "OP":
-            return attributes[0] if attributes else production_rhs[0]
+        # Verifica se a variável foi declarada (HIM . id é resolvido no módulo em execução)
+        if type(target) is ast_nodes.Variable:
+            symbol = symbol_table.lookup(target.name, line=target.line)
+            if symbol:
+                symbol_table.set_value(symbol, expr_value)  # Atualiza o valor
+                target.depth = symbol.depth
+                target.slot = symbol.slot
         
-        # TERM -> FACTOR
-        elif production_lhs == "TERM" and len(production_rhs) == 1:
-            return attributes[0]
+        return ast_nodes.Assignment(target, expr_value, line=target.line)
+    
+    def _acao_se(self, attributes, symbol_table):
+        """CMD -> LOS EXPR CMD (if)"""
+        return ast_nodes.If(attributes[1], attributes[2], line=attributes[0].line)
+    
+    def _acao_enquanto(self, attributes, symbol_table):
+        """CMD -> FOD CMD FAH EXPR (while)"""
+        return ast_nodes.While(attributes[1], attributes[3], line=attributes[0].line)
+    
+    def _acao_para(self, attributes, symbol_table):
+        """CMD -> FAH CMD FAH EXPR (for)"""
+        return ast_nodes.For(attributes[1], attributes[3], line=attributes[0].line)
+    
+    def _acao_lhs_assign(self, attributes, symbol_table):
+        """LHS -> assign id"""
+        id_token = attributes[1]
+        return ast_nodes.Variable(id_token.lexeme, line=id_token.line)
+    
+    def _acao_membro(self, attributes, symbol_table):
+        """LHS -> HIM . id e FACTOR -> HIM . id (acesso a membro)"""
+        id_token = attributes[2]
+        node = ast_nodes.Member(id_token.lexeme, line=id_token.line)
         
-        # TERM -> UNARY
-        elif production_lhs == "TERM" and production_rhs == ["UNARY"]:
-            return attributes[0]
+        # HIM . id só enxerga o módulo atual (sem erro se ainda não declarado)
+        symbol = symbol_table.current_scope.symbols.get(id_token.lexeme)
+        if symbol is not None:
+            node.depth = symbol.depth
+            node.slot = symbol.slot
+        return node
+    
+    def _acao_io(self, attributes, symbol_table):
+        """CMD -> IO id (input/output)"""
+        io_token = attributes[0]
+        id_token = attributes[1]
         
-        # UNARY -> NUST TERM
-        elif production_lhs == "UNARY" and len(production_rhs) == 2:
-            term_value = attributes[1]
-            return f"(NOT {term_value})"
+        if self.verbose:
+            self.reporter.trace(f"[Semântico] I/O com '{id_token.lexeme}' (linha {id_token.line})")
         
-        # Padrão: retorna primeiro atributo ou None
-        return attributes[0] if attributes else None
+        # Verifica se foi declarado
+        symbol = symbol_table.lookup(id_token.lexeme, line=id_token.line, token=id_token)
+        
+        node = ast_nodes.InputOutput(io_token.lexeme, id_token.lexeme, line=io_token.line)
+        if symbol is not None:
+            node.depth = symbol.depth
+            node.slot = symbol.slot
+        return node
+    
+    def _acao_retorno(self, attributes, symbol_table):
+        """CMD -> JUN EXPR (return)"""
+        expr_value = attributes[1]
+        
+        if self.verbose:
+            self.reporter.trace(f"[Semântico] Return {expr_value}")
+        
+        return ast_nodes.Return(expr_value, line=attributes[0].line)
+    
+    def _acao_factor_id(self, attributes, symbol_table):
+        """FACTOR -> id (uso de variável)"""
+        id_token = attributes[0]
+        
+        # Verifica a declaração, marca o símbolo como usado e guarda seu endereço
+        symbol = symbol_table.lookup(id_token.lexeme, line=id_token.line, token=id_token)
+        
+        node = ast_nodes.Variable(id_token.lexeme, line=id_token.line)
+        if symbol is not None:
+            node.depth = symbol.depth
+            node.slot = symbol.slot
+        return node
+    
+    def _acao_factor_num(self, attributes, symbol_table):
+        """FACTOR -> num"""
+        num_token = attributes[0]
+        value = num_token.value if num_token.value is not None else int(num_token.lexeme)
+        return ast_nodes.Number(value, line=num_token.line)
     
-    def parse(self, tokens):
+    def _acao_parenteses(self, attributes, symbol_table):
+        """FACTOR -> ( EXPR )"""
+        return attributes[1]
+    
+    def _acao_expr(self, attributes, symbol_table):
+        """
+        EXPR -> TERM EXPR'
+        
+        EXPR' chega como a cadeia (op, termo, resto); ela é dobrada aqui à
+        esquerda em tempo linear: a op b op c -> ((a op b) op c).
+        """
+        node = attributes[0]
+        chain = attributes[1]
+        while chain is not None:
+            op, term, chain = chain
+            node = ast_nodes.BinaryOp(op, node, term, line=node.line)
+        return node
+    
+    def _acao_expr_linha(self, attributes, symbol_table):
+        """EXPR' -> OP TERM EXPR' (elo da cadeia dobrada por _acao_expr)"""
+        return (attributes[0], attributes[1], attributes[2])
+    
+    def _acao_vazia(self, attributes, symbol_table):
+        """EXPR' -> epsilon"""
+        return None
+    
+    def _acao_operador(self, attributes, symbol_table):
+        """OP -> + | - | ANRK | AAN | KO (lexema do operador)"""
+        return attributes[0].lexeme
+    
+    def _acao_unario(self, attributes, symbol_table):
+        """UNARY -> NUST TERM"""
+        return ast_nodes.Not(attributes[1], line=attributes[0].line)
+    
+    def expected_tokens(self, context=None):
+        """
+        Terminais aceitos no estado do topo da pilha (ex: autocompletar)
+        
+        Consulta o bitset pré-calculado em ParseTables.expected, sem
+        percorrer a matriz ACTION.
+        """
+        if context is None:
+            context = self.context
+        return self.tables.esperados(context.stack[-1])
+    
+    def _desloca(self, stack, altura, kind, topo=None):
+        """
+        Simula as reduções sobre stack[:altura] (mais o estado topo, se
+        houver) e informa se o token do tipo kind chega a ser deslocado
+        
+        A pilha real não é alterada: os estados empilhados pelos GOTOs ficam
+        numa lista à parte e as remoções abaixo dela só baixam a altura.
+        Aceitação (S' -> S com '$') conta como deslocamento.
+        """
+        tables = self.tables
+        n_t = tables.n_terminals
+        if kind >= n_t:
+            return False
+        action = tables.action
+        goto = tables.goto
+        n_nt = tables.n_nonterminals
+        prod_lhs = tables.prod_lhs
+        prod_len = tables.prod_len
+        
+        extra = [] if topo is None else [topo]
+        while True:
+            acao = action[(extra[-1] if extra else stack[altura - 1]) * n_t + kind]
+            if acao > 0:
+                return True
+            if acao == ERRO:
+                return False
+            prod = -acao - 1
+            if prod == 0:
+                return True
+            n = prod_len[prod]
+            k = min(n, len(extra))
+            if k:
+                del extra[-k:]
+            altura -= n - k
+            extra.append(goto[(extra[-1] if extra else stack[altura - 1]) * n_nt + prod_lhs[prod]])
+    
+    def _recuperar(self, context, token, token_stream):
+        """
+        Recuperação em modo pânico após um erro sintático
+        
+        Descarta tokens até um de FOLLOW(CMD) (';', 'FAH' ou '$') que seja
+        deslocado logo após um CMD em algum estado da pilha com GOTO em CMD
+        (o mais ao topo); desempilha até esse estado e empilha um CMD vazio
+        (Sequence sem comandos) no lugar do comando com erro. O bitset
+        expected não basta para escolher o estado: no SLR ele aceita o token
+        por FOLLOW e pode rejeitá-lo depois das reduções (ver _desloca). Cada token é
+        descartado no máximo uma vez, então o trabalho extra é limitado pelo
+        tamanho da entrada mais a altura da pilha.
+        
+        Returns:
+            Token em que a análise continua, ou None se não houver onde retomar
+        """
+        tables = self.tables
+        goto = tables.goto
+        n_nt = tables.n_nonterminals
+        stack = context.stack
+        symbols = context.symbols
+        attributes = context.attributes
+        
+        # Estados da pilha com GOTO em CMD, do topo para a base. Todo ';' é de
+        # nível superior (S -> CMD ; S), então abaixo do último ';' só há
+        # estados equivalentes ao que vem logo após ele: a busca para ali e
+        # cada recuperação custa só a profundidade do comando atual.
+        candidatos = []
+        for i in range(len(stack) - 1, -1, -1):
+            destino = goto[stack[i] * n_nt + CMD_ID]
+            if destino != SEM_GOTO:
+                candidatos.append((i, destino))
+            if i == 0 or symbols[i - 1] == ";":
+                break
+        
+        while True:
+            kind = token.kind
+            if SINCRONIZACAO >> kind & 1:
+                for i, destino in candidatos:
+                    if not self._desloca(stack, i + 1, kind, destino):
+                        continue
+                    
+                    # Desempilha até o estado i, fechando módulos abertos no caminho
+                    while len(stack) > i + 1:
+                        if symbols[-1] == "id" and len(symbols) > 1 and symbols[-2] == "KEL":
+                            context.symbol_table.exit_scope()
+                        stack.pop()
+                        symbols.pop()
+                        attributes.pop()
+                    
+                    stack.append(destino)
+                    symbols.append("CMD")
+                    attributes.append(ast_nodes.Sequence([], line=token.line))
+                    if self.verbose:
+                        self.reporter.trace(f"  RECUPERAÇÃO: GOTO({stack[i]}, CMD) = {destino}, retomando em {token}\n")
+                    return token
+            
+            if token.type == "$":
+                return None
+            token = next(token_stream, None) or Token("$", "$", 0)
+    
+    def parse(self, tokens, context=None):
         """
         Parsing com análise semântica integrada
         
+        Cada passo é uma única consulta à matriz ACTION densa; REDUCE consulta
+        a matriz GOTO pelo id do não-terminal da produção.
+        
+        Os tokens são consumidos sob demanda, então um gerador (por exemplo
+        Lexer.iter_tokens) é lido apenas até onde o parsing avançou. O fim
+        do iterável equivale ao token '$'.
+        
+        Com error_recovery, cada erro sintático é registrado e a análise
+        continua, reunindo todos os erros numa só passada: primeiro tenta
+        uma correção em nível de frase (inserir um ';' ausente antes de um
+        comando ou descartar um token sobrando); senão, modo pânico até o
+        próximo ';' ou 'FAH' (ver _recuperar). Sem ela, o primeiro erro
+        encerra a análise sem varrer o restante da entrada.
+        
+        Com context.checkpoints ativo, cada ';' salva um checkpoint; um
+        contexto restaurado por restore_checkpoint continua a análise de onde
+        parou, recebendo só os tokens seguintes ao ';'.
+        
         Args:
-            tokens: Lista de objetos Token
+            tokens: Lista, iterador ou gerador de objetos Token, ou um
+                TokenBuffer (cujos Tokens são materializados um a um)
+            context: ParseContext onde a análise acontece (padrão: self.context)
         """
+        if context is None:
+            context = self.context
+        
         if self.verbose:
-            print("=== Analise Sintatica e Semantica SLR(1) ===\n")
+            self.reporter.trace("=== Analise Sintatica e Semantica SLR(1) ===\n")
+        
+        tables = self.tables
+        action = tables.action
+        goto = tables.goto
+        n_t = tables.n_terminals
+        n_nt = tables.n_nonterminals
+        expected = tables.expected
+        token_types = TOKEN_TYPES
+        prod_lhs = tables.prod_lhs
+        prod_len = tables.prod_len
         
-        token_index = 0
-        current_token = tokens[token_index] if token_index < len(tokens) else Token("$", "$", 0)
+        productions = self.productions
+        actions = self.actions
+        symbol_table = context.symbol_table
+        stack = context.stack
+        symbols = context.symbols
+        attributes = context.attributes
+        errors = context.errors
+        
+        # Ações no meio da regra indexadas pelo tipo do token empilhado
+        shift_hooks = {token_type_id(terminal): (previous, getattr(self, method))
+                       for (previous, terminal), method in self.MID_RULE_ACTIONS.items()}
+        if context.checkpoints is not None:
+            shift_hooks[token_type_id(";")] = ("CMD", self.save_checkpoint)
+        
+        token_stream = iter(tokens)
+        current_token = next(token_stream, None) or Token("$", "$", 0)
+        resumed = None                # Token em que a última recuperação retomou
+        inserted = None               # ';' inserido pela correção em nível de frase
+        semicolon = TOKEN_TYPE_IDS[";"]
         step = 1
         
         try:
             while True:
-                state = self.stack[-1]
-                lookahead = current_token.type
+                state = stack[-1]
+                kind = current_token.kind
                 
                 if self.verbose:
-                    print(f"Passo {step}: Stack={self.stack}, Estado={state}, Token={current_token}")
+                    self.reporter.trace(f"Passo {step}: Stack={stack}, Estado={state}, Token={current_token}")
                 
-                # Aceitação
-                if state == 1 and lookahead == "$":
-                    if self.verbose:
-                        print("\n[OK] ANALISE SINTATICA ACEITA!\n")
-                    
-                    # Finaliza análise semântica
-                    self.symbol_table.check_unused_symbols()
-                    self.warnings.extend(self.symbol_table.warnings)
-                    self.errors.extend(self.symbol_table.errors)
-                    
-                    return not self.has_errors()
+                acao = action[state * n_t + kind] if kind < n_t else ERRO
                 
                 # SHIFT
-                if (state, lookahead) in self.transitions:
-                    next_state = self.transitions[(state, lookahead)]
+                if acao > 0:
+                    next_state = acao - 1
                     if self.verbose:
-                        print(f"  SHIFT -> {next_state}\n")
+                        self.reporter.trace(f"  SHIFT -> {next_state}\n")
                     
-                    self.stack.append(next_state)
-                    self.symbols.append(lookahead)
-                    self.attributes.append(current_token)  # Atributo é o token
+                    stack.append(next_state)
+                    symbols.append(token_types[kind])
+                    attributes.append(current_token)  # Atributo é o token
+                    resumed = None
                     
-                    token_index += 1
-                    current_token = tokens[token_index] if token_index < len(tokens) else Token("$", "$", 0)
+                    hook = shift_hooks.get(kind)
+                    if (hook is not None and len(symbols) > 1 and symbols[-2] == hook[0]
+                            and current_token is not inserted):
+                        hook[1](current_token, context)
+                    
+                    current_token = next(token_stream, None) or Token("$", "$", 0)
                     step += 1
                     continue
                 
-                # Epsilon transition
-                if (state, "epsilon") in self.transitions:
-                    next_state = self.transitions[(state, "epsilon")]
-                    if next_state == 38:
-                        if (state, "EXPR'") in self.transitions:
-                            expr_state = self.transitions[(state, "EXPR'")]
-                            if self.verbose:
-                                print(f"  REDUCE EXPR' -> epsilon, GOTO({state}, EXPR') = {expr_state}\n")
-                            self.stack.append(expr_state)
-                            self.symbols.append("EXPR'")
-                            self.attributes.append(None)  # EXPR' -> epsilon não tem valor
+                # Erro sintatico
+                if acao == ERRO:
+                    errors.append(Diagnostic.from_token(
+                        "S001", current_token, current_token.lexeme, current_token.type,
+                        tuple(tables.esperados(state))))
+                    if not self.error_recovery:
+                        return False
+                    
+                    # As correções só valem se o token escolhido for mesmo
+                    # deslocado (_desloca simula as reduções); um novo erro no
+                    # token da retomada vai direto ao modo pânico, que nunca
+                    # descarta um ';' que possa deslocar
+                    if current_token is not resumed:
+                        # Correção em nível de frase: um ';' ausente entre dois comandos...
+                        if (INICIO_CMD >> kind & 1 and expected[state] >> semicolon & 1
+                                and self._desloca(stack, len(stack), semicolon)):
+                            token_stream = chain((current_token,), token_stream)
+                            current_token = resumed = inserted = Token(
+                                ";", ";", current_token.line, current_token.column)
                             step += 1
                             continue
+                        
+                        # ...ou um token sobrando (nunca ';', 'FAH' ou '$', que sincronizam)
+                        if not SINCRONIZACAO >> kind & 1:
+                            following = next(token_stream, None) or Token("$", "$", 0)
+                            if (expected[state] >> following.kind & 1
+                                    and self._desloca(stack, len(stack), following.kind)):
+                                current_token = resumed = following
+                                step += 1
+                                continue
+                            token_stream = chain((following,), token_stream)
+                    
+                    # Senão, modo pânico
+                    current_token = self._recuperar(context, current_token, token_stream)
+                    if current_token is None:
+                        return False
+                    resumed = current_token
+                    step += 1
+                    continue
                 
-                # GOTO para não-terminais com epsilon
-                found_goto = False
-                for nt in self.nonterminals:
-                    if (state, nt) in self.transitions and nt == "EXPR'" and lookahead in self.follow.get("EXPR'", set()):
-                        next_state = self.transitions[(state, nt)]
-                        if self.verbose:
-                            print(f"  REDUCE EXPR' -> epsilon, GOTO({state}, {nt}) = {next_state}\n")
-                        self.stack.append(next_state)
-                        self.symbols.append(nt)
-                        self.attributes.append(None)
-                        step += 1
-                        found_goto = True
-                        break
+                prod = -acao - 1
                 
-                if found_goto:
-                    continue
+                # Aceitação (REDUCE por S' -> S)
+                if prod == 0:
+                    if self.verbose:
+                        self.reporter.trace("\n[OK] ANALISE SINTATICA ACEITA!\n")
+                    
+                    # Finaliza análise semântica
+                    tree = attributes[-1]
+                    tree.commands.reverse()  # Acumulada de trás para frente (ver _acao_sequencia)
+                    context.tree = tree
+                    if self.fold_constants:
+                        dobrar_constantes(tree, symbol_table)
+                    
+                    symbol_table.check_unused_symbols()
+                    
+                    return not context.has_errors()
                 
                 # REDUCE
-                if state in self.productions:
-                    lhs, rhs = self.productions[state]
-                    
-                    if lookahead in self.follow.get(lhs, set()) or lookahead == "$":
-                        if self.verbose:
-                            print(f"  REDUCE {lhs} -> {' '.join(rhs)}")
-                        
-                        # Coleta atributos dos símbolos da produção
-                        prod_attributes = []
-                        if rhs != ["epsilon"]:
-                            prod_attributes = self.attributes[-len(rhs):] if len(rhs) > 0 else []
-                        
-                        # Ação semântica
-                        try:
-                            synthesized_attr = self.semantic_action(lhs, rhs, prod_attributes)
-                        except Exception as e:
-                            self.errors.append(f"Erro em ação semântica: {e}")
-                            synthesized_attr = None
-                        
-                        # Remove símbolos da pilha
-                        if rhs != ["epsilon"]:
-                            for _ in range(len(rhs)):
-                                if self.stack:
-                                    self.stack.pop()
-                                if self.symbols:
-                                    self.symbols.pop()
-                                if self.attributes:
-                                    self.attributes.pop()
-                        
-                        state_after = self.stack[-1] if self.stack else 0
-                        
-                        # GOTO
-                        if (state_after, lhs) in self.transitions:
-                            goto_state = self.transitions[(state_after, lhs)]
-                            if self.verbose:
-                                print(f"  GOTO({state_after}, {lhs}) = {goto_state}\n")
-                            
-                            self.stack.append(goto_state)
-                            self.symbols.append(lhs)
-                            self.attributes.append(synthesized_attr)
-                            
-                            step += 1
-                            continue
-                        else:
-                            error_msg = f"GOTO({state_after}, {lhs}) não encontrado"
-                            self.errors.append(f"ERRO SINTATICO (Linha {current_token.line}): {error_msg}")
-                            return False
+                lhs, rhs = productions[prod]
+                n = prod_len[prod]
+                if self.verbose:
+                    self.reporter.trace(f"  REDUCE {lhs} -> {' '.join(rhs)}")
                 
-                # Erro sintatico
-                error_msg = f"Token inesperado '{current_token.lexeme}' (tipo: {lookahead})"
-                self.errors.append(f"ERRO SINTATICO (Linha {current_token.line}): {error_msg}")
-                return False
+                # Coleta atributos dos símbolos da produção
+                prod_attributes = attributes[-n:] if n else []
+                
+                # Ação semântica
+                try:
+                    synthesized_attr = actions[prod](prod_attributes, symbol_table)
+                except Exception as e:
+                    errors.append(Diagnostic("S003", (str(e),)))
+                    synthesized_attr = None
+                
+                # Remove símbolos da pilha
+                if n:
+                    del stack[-n:]
+                    del symbols[-n:]
+                    del attributes[-n:]
+                
+                state_after = stack[-1] if stack else 0
+                
+                # GOTO
+                goto_state = goto[state_after * n_nt + prod_lhs[prod]]
+                if goto_state == SEM_GOTO:
+                    errors.append(Diagnostic.from_token("S002", current_token, state_after, lhs))
+                    return False
+                
+                if self.verbose:
+                    self.reporter.trace(f"  GOTO({state_after}, {lhs}) = {goto_state}\n")
+                
+                stack.append(goto_state)
+                symbols.append(lhs)
+                attributes.append(synthesized_attr)
+                step += 1
         
         except Exception as e:
-            self.errors.append(f"ERRO FATAL: {str(e)}")
+            errors.append(Diagnostic("S004", (str(e),)))
             return False
     
     def has_errors(self):
-        """Verifica se há erros"""
-        return len(self.errors) > 0 or self.symbol_table.has_errors()
+        """Verifica se há erros no contexto padrão"""
+        return self.context.has_errors()
     
-    def print_report(self):
-        """Imprime relatório completo de erros e avisos"""
+    def print_report(self, context=None):
+        """Imprime relatório completo de erros e avisos (padrão: self.context)"""
+        if context is None:
+            context = self.context
+        
         print("\n" + "="*70)
         print("RELATORIO DE ANALISE")
         print("="*70)
         
-        if self.errors or self.symbol_table.errors:
+        if context.errors:
             print("\n[X] ERROS ENCONTRADOS:")
-            for error in self.errors:
-                print(f"  - {error}")
-            for error in self.symbol_table.errors:
+            for error in context.errors:
                 print(f"  - {error}")
         else:
             print("\n[OK] Nenhum erro encontrado")
         
-        if self.warnings or self.symbol_table.warnings:
+        if context.warnings:
             print("\n[!] AVISOS:")
-            for warning in self.warnings:
-                print(f"  - {warning}")
-            for warning in self.symbol_table.warnings:
+            for warning in context.warnings:
                 print(f"  - {warning}")
         
         print("\n" + "="*70)
         print("TABELA DE SIMBOLOS")
         print("="*70)
-        self.symbol_table.print_table()
+        context.symbol_table.print_table()
         print("="*70 + "\n")
     
     def reset(self):
-        """Reinicia o parser"""
-        self.stack = [0]
-        self.symbols = []
-        self.attributes = []
-        self.symbol_table = SymbolTable()
-        self.errors = []
-        self.warnings = []
+        """Reinicia o parser (descarta o contexto padrão)"""
+        self.context = ParseContext()
 
 
 # ============================================================================
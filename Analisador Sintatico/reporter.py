@@ -0,0 +1,104 @@
+"""
+Relatores de Eventos do Compilador
+Recebem os eventos da compilação (fases, palavras do PDA, tokens, relatório)
+
+O compilador não escreve no console por conta própria: cada evento é
+repassado ao relator configurado. NullReporter descarta tudo (modo
+biblioteca/lote) e ConsoleReporter reproduz a saída textual do programa.
+"""
+
+
+class NullReporter:
+    """Relator que descarta todos os eventos (padrão em modo biblioteca)"""
+
+    silent = True                 # Permite pular a coleta de dados dos eventos
+
+    def phase(self, title, detail=None):
+        """Início de uma fase da compilação"""
+
+    def pda_start(self, source_code):
+        """Início do processamento da entrada no PDA"""
+
+    def pda_word(self, line, word, state, token):
+        """Palavra processada pelo PDA (state 'X' indica rejeição)"""
+
+    def pda_summary(self, results, n_tokens):
+        """
+        Fim do processamento no PDA
+
+        Args:
+            results: Lista de tuplas (linha, palavra, estado_final)
+            n_tokens: Total de tokens gerados (incluindo EOF)
+        """
+
+    def tokens(self, tokens):
+        """Fita de tokens entregue ao parser"""
+
+    def lexical_error(self, error):
+        """Erro que interrompeu a análise léxica"""
+
+    def trace(self, message):
+        """Linha do passo a passo do parser (modo verbose)"""
+
+    def report(self, parser):
+        """Relatório final de erros, avisos e tabela de símbolos"""
+
+
+class ConsoleReporter(NullReporter):
+    """Relator que imprime os eventos no console"""
+
+    silent = False
+
+    def phase(self, title, detail=None):
+        print("\n" + "="*80)
+        print(title)
+        print("="*80)
+        if detail is not None:
+            print(f"{detail}\n")
+        else:
+            print()
+
+    def pda_start(self, source_code):
+        print("==================================================================")
+        print("=          SAÍDA DO PDA (Compiladores/main.py)                  =")
+        print("==================================================================")
+        print("\n Processando entrada no PDA...")
+        print(f"Entrada: {source_code}\n")
+
+    def pda_word(self, line, word, state, token):
+        if state != 'X':
+            print(f"[OK] Linha {line}: '{word}' -> Estado {state} -> {token.type} (ACEITO)")
+        else:
+            print(f"  Linha {line}: '{word}' -> Não reconhecido pelo PDA -> {token.type}")
+
+    def pda_summary(self, results, n_tokens):
+        print("\n" + "="*70)
+        print(" TABELA DE SÍMBOLOS DO PDA:")
+        print("="*70)
+        print(f"{'Linha':<8} {'Palavra':<15} {'Estado Final':<15} {'Status':<10}")
+        print("="*70)
+
+        for line, word, state in results:
+            status = "[OK] ACEITO" if state != 'X' else "[X] REJEITADO"
+            print(f"{line:<8} {word:<15} {state:<15} {status:<10}")
+
+        print("="*70)
+        print(f"\n[OK] PDA processou {len(results)} palavras")
+        print(f"[OK] Gerados {n_tokens} tokens (incluindo EOF)\n")
+
+    def tokens(self, tokens):
+        print("\n==================================================================")
+        print("=              TOKENS GERADOS PARA O PARSER                      =")
+        print("==================================================================")
+        for i, token in enumerate(tokens, 1):
+            print(f"{i:3}. {token}")
+        print("-" * 80)
+
+    def lexical_error(self, error):
+        print(f"\n[X] ERRO LÉXICO: {error}")
+
+    def trace(self, message):
+        print(message)
+
+    def report(self, parser):
+        parser.print_report()
@@ -3,8 +3,12 @@ Tabela de Símbolos para o Analisador Semântico
 Gerencia identificadores, escopos e declarações da linguagem fantasy
 """
 
+from diagnosticos import Diagnostic
+
 class Symbol:
     """Representa um símbolo (identificador) na tabela"""
+    __slots__ = ("name", "symbol_type", "scope", "line", "value", "used", "depth", "slot")
+    
     def __init__(self, name, symbol_type, scope, line=None, value=None):
         self.name = name              # Nome do identificador
         self.symbol_type = symbol_type # Tipo: 'variable', 'module', 'parameter'
@@ -12,6 +16,8 @@ class Symbol:
         self.line = line              # Linha de declaração (para mensagens de erro)
         self.value = value            # Valor inicial (opcional)
         self.used = False             # Marca se foi usado (para avisos)
+        self.depth = None             # Profundidade do escopo (global = 0)
+        self.slot = None              # Índice do símbolo no escopo (ordem de declaração)
     
     def __repr__(self):
         return f"Symbol({self.name}, type={self.symbol_type}, scope={self.scope})"
@@ -22,6 +28,9 @@ class Scope:
     def __init__(self, name, parent=None):
         self.name = name              # Nome do escopo (ex: 'global', 'KEL_player')
         self.parent = parent          # Escopo pai (para aninhamento)
+        self.depth = 0 if parent is None else parent.depth + 1
+        # Caminho qualificado a partir do global (ex: 'player.inventory')
+        self.path = name if parent is None or parent.parent is None else f"{parent.path}.{name}"
         self.symbols = {}             # Dicionário de símbolos neste escopo
         self.children = []            # Escopos filhos
     
@@ -29,6 +38,8 @@ class Scope:
         """Define um novo símbolo neste escopo"""
         if symbol.name in self.symbols:
             return False  # Já existe
+        symbol.depth = self.depth
+        symbol.slot = len(self.symbols)
         self.symbols[symbol.name] = symbol
         return True
     
@@ -47,74 +58,170 @@ class Scope:
 
 
 class SymbolTable:
-    """Tabela de Símbolos com suporte a escopos aninhados"""
+    """
+    Tabela de Símbolos com suporte a escopos aninhados
+    
+    Além da árvore de escopos, mantém um mapa achatado nome -> pilha de
+    símbolos visíveis (tabela hash com escopos): o topo de cada pilha é a
+    declaração mais interna, então lookup() é O(1) independente do
+    aninhamento. Cada escopo aberto registra os nomes que empilhou num log
+    de desfazer, consumido por exit_scope().
     
-    def __init__(self):
+    checkpoint()/rollback() voltam a tabela a um ponto do escopo global
+    (reanálise incremental): a partir do primeiro checkpoint, as alterações
+    em símbolos já existentes (used, value) e nos índices de escopos são
+    anotadas num diário de desfazer.
+    """
+    
+    def __init__(self, errors=None, warnings=None):
+        """errors/warnings: listas onde registrar os diagnósticos (padrão: novas)"""
         self.global_scope = Scope("global")
         self.current_scope = self.global_scope
-        self.errors = []              # Lista de erros semânticos
-        self.warnings = []            # Lista de avisos
+        # Índices de escopos mantidos por enter_scope
+        self.scopes_by_name = {"global": self.global_scope}  # Primeiro escopo com o nome
+        self.scopes_by_path = {}      # Caminho qualificado -> escopo
+        self.visible = {}             # Nome -> pilha de símbolos visíveis (topo = mais interno)
+        self._undo_log = [[]]         # Nomes empilhados por escopo aberto (base = global)
+        self._journal = None          # Diário de desfazer (ativado por checkpoint())
+        self.errors = [] if errors is None else errors        # Erros semânticos (Diagnostic)
+        self.warnings = [] if warnings is None else warnings  # Avisos (Diagnostic)
     
     def enter_scope(self, scope_name):
         """Entra em um novo escopo (ex: ao entrar em KEL módulo)"""
         new_scope = Scope(scope_name, parent=self.current_scope)
         self.current_scope.children.append(new_scope)
         self.current_scope = new_scope
+        
+        # Escopos são criados em pré-ordem, então o primeiro registrado com
+        # um nome é o mesmo que uma busca em profundidade encontraria
+        journal = self._journal
+        for index, key in ((self.scopes_by_name, scope_name), (self.scopes_by_path, new_scope.path)):
+            if index.setdefault(key, new_scope) is new_scope and journal is not None:
+                journal.append((index.pop, key))
+        self._undo_log.append([])
         return new_scope
     
     def exit_scope(self):
         """Sai do escopo atual, voltando ao pai"""
         if self.current_scope.parent:
             self.current_scope = self.current_scope.parent
+            
+            # Desfaz as declarações do escopo que foi fechado
+            visible = self.visible
+            for name in self._undo_log.pop():
+                stack = visible[name]
+                stack.pop()
+                if not stack:
+                    del visible[name]
         else:
-            self.warnings.append("Tentativa de sair do escopo global")
+            self.warnings.append(Diagnostic("M003"))
     
-    def declare(self, name, symbol_type='variable', line=None, value=None):
-        """Declara um novo símbolo no escopo atual"""
+    def declare(self, name, symbol_type='variable', line=None, value=None, token=None):
+        """
+        Declara um novo símbolo no escopo atual
+        
+        token (opcional) é o Token do identificador, para que o erro de
+        redeclaração aponte o trecho exato na fonte.
+        """
         symbol = Symbol(name, symbol_type, self.current_scope.name, line, value)
         
         if not self.current_scope.define(symbol):
-            self.errors.append(
-                f"Erro semântico (linha {line}): '{name}' já foi declarado em '{self.current_scope.name}'"
-            )
+            scope_name = self.current_scope.name
+            if token is None:
+                self.errors.append(Diagnostic("M001", (name, scope_name), line))
+            else:
+                self.errors.append(Diagnostic.from_token("M001", token, name, scope_name))
             return False
         
+        stack = self.visible.get(name)
+        if stack is None:
+            self.visible[name] = [symbol]
+        else:
+            stack.append(symbol)
+        self._undo_log[-1].append(name)
         return True
     
-    def lookup(self, name, line=None, mark_used=True):
-        """Busca um símbolo na tabela (escopo atual e pais)"""
-        symbol = self.current_scope.lookup(name)
+    def lookup(self, name, line=None, mark_used=True, token=None):
+        """Busca um símbolo na tabela (escopo atual e pais); token como em declare()"""
+        stack = self.visible.get(name)
+        symbol = stack[-1] if stack else None
         
         if symbol is None:
-            self.errors.append(
-                f"Erro semântico (linha {line}): '{name}' não foi declarado"
-            )
+            if token is None:
+                self.errors.append(Diagnostic("M002", (name,), line))
+            else:
+                self.errors.append(Diagnostic.from_token("M002", token, name))
             return None
         
-        if mark_used:
+        if mark_used and not symbol.used:
             symbol.used = True
+            if self._journal is not None:
+                self._journal.append((setattr, symbol, "used", False))
         
         return symbol
     
+    def set_value(self, symbol, value):
+        """Atualiza o valor de um símbolo já declarado (ex: atribuição)"""
+        if self._journal is not None:
+            self._journal.append((setattr, symbol, "value", symbol.value))
+        symbol.value = value
+    
     def lookup_in_scope(self, name, scope_name):
-        """Busca um símbolo em um escopo específico (para HIM . id)"""
-        # Busca o escopo pelo nome
-        scope = self._find_scope(scope_name, self.global_scope)
+        """
+        Busca um símbolo em um escopo específico (para HIM . id)
+        
+        scope_name pode ser um nome simples ('player') ou um caminho
+        qualificado a partir do global ('player.inventory').
+        """
+        scope = self.find_scope(scope_name)
         if scope:
             return scope.lookup(name, recursive=False)
         return None
     
-    def _find_scope(self, scope_name, current):
-        """Busca recursivamente um escopo pelo nome"""
-        if current.name == scope_name:
-            return current
+    def find_scope(self, scope_name):
+        """Retorna o escopo pelo nome ou caminho qualificado (None se não existir)"""
+        if "." in scope_name:
+            return self.scopes_by_path.get(scope_name)
+        return self.scopes_by_name.get(scope_name)
+    
+    def checkpoint(self):
+        """
+        Marca o estado atual para rollback()
         
-        for child in current.children:
-            result = self._find_scope(scope_name, child)
-            if result:
-                return result
+        Só deve ser chamado com o escopo global aberto (ex: entre comandos
+        de nível superior); ativa o diário de desfazer na primeira chamada.
+        """
+        if self._journal is None:
+            self._journal = []
+        return (len(self._undo_log[0]), len(self.global_scope.children),
+                len(self.errors), len(self.warnings), len(self._journal))
+    
+    def rollback(self, mark):
+        """Desfaz tudo o que aconteceu desde checkpoint() (mark é o retorno dele)"""
+        n_names, n_children, n_errors, n_warnings, n_journal = mark
         
-        return None
+        # Fecha escopos deixados abertos (ex: análise interrompida num módulo)
+        while self.current_scope is not self.global_scope:
+            self.exit_scope()
+        
+        names = self._undo_log[0]
+        symbols = self.global_scope.symbols
+        visible = self.visible
+        for name in names[n_names:]:
+            del symbols[name]
+            stack = visible[name]
+            stack.pop()
+            if not stack:
+                del visible[name]
+        del names[n_names:]
+        del self.global_scope.children[n_children:]
+        
+        journal = self._journal
+        for undo, *args in reversed(journal[n_journal:]):
+            undo(*args)
+        del journal[n_journal:]
+        del self.errors[n_errors:]
+        del self.warnings[n_warnings:]
     
     def check_unused_symbols(self):
         """Verifica símbolos declarados mas não usados"""
@@ -124,9 +231,7 @@ class SymbolTable:
         """Verifica recursivamente símbolos não usados"""
         for name, symbol in scope.symbols.items():
             if not symbol.used and symbol.symbol_type == 'variable':
-                self.warnings.append(
-                    f"Aviso (linha {symbol.line}): variável '{name}' declarada mas não usada"
-                )
+                self.warnings.append(Diagnostic("M004", (name,), symbol.line))
         
         for child in scope.children:
             self._check_unused_in_scope(child)
@@ -144,6 +249,22 @@ class SymbolTable:
         for child in scope.children:
             self.print_table(child, indent + 1)
     
+    def snapshot(self, scope=None):
+        """
+        Cópia da tabela em tuplas simples (serializável entre processos)
+        
+        Returns:
+            Lista de (escopo, nome, tipo, linha, valor, usado), escopos em pré-ordem
+        """
+        if scope is None:
+            scope = self.global_scope
+        
+        rows = [(scope.name, name, symbol.symbol_type, symbol.line, symbol.value, symbol.used)
+                for name, symbol in scope.symbols.items()]
+        for child in scope.children:
+            rows.extend(self.snapshot(child))
+        return rows
+    
     def has_errors(self):
         """Retorna True se houver erros semânticos"""
         return len(self.errors) > 0
@@ -0,0 +1,357 @@
+"""
+Compilador de Tabelas SLR(1)
+Gera as matrizes ACTION/GOTO densas (indexadas por inteiros) usadas pelo parser
+
+Codificação da matriz ACTION (uma tupla plana de tamanho estados x terminais):
+    0           -> erro
+    n > 0       -> SHIFT para o estado n - 1
+    n < 0       -> REDUCE pela produção -n - 1 (produção 0 = S' -> S = aceitação)
+
+Matriz GOTO (estados x não-terminais): estado destino ou -1 se não existir
+
+Tokens esperados: para cada estado, bitset (int) dos terminais com ação
+diferente de erro, ou seja, os SHIFTs do autômato mais os REDUCEs por FOLLOW.
+Derivado da matriz ACTION na construção, não é serializado.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from types import MappingProxyType
+
+ERRO = 0
+SEM_GOTO = -1
+
+EPSILON_SIMBOLOS = ("ε", "epsilon")
+
+
+class ConflictError(Exception):
+    """Exceção para conflitos SHIFT/REDUCE ou REDUCE/REDUCE na construção da tabela"""
+    def __init__(self, conflicts, productions):
+        self.conflicts = conflicts
+        linhas = []
+        for state, terminal, atual, nova in conflicts:
+            tipo = "SHIFT/REDUCE" if atual > 0 else "REDUCE/REDUCE"
+            lhs, rhs = productions[-nova - 1]
+            linhas.append(f"estado {state}, '{terminal}': {tipo} ({lhs} -> {' '.join(rhs) or 'ε'})")
+        super().__init__("Gramática não é SLR(1): " + "; ".join(linhas))
+
+
+class ParseTables:
+    """
+    Tabelas ACTION/GOTO densas com terminais e não-terminais internados em inteiros
+
+    Imutáveis depois de construídas (tuplas e dicionários somente leitura), então
+    uma única instância pode ser compartilhada por parsers em várias threads.
+    """
+
+    __slots__ = ("terminals", "nonterminals", "terminal_ids", "nonterminal_ids", "productions",
+                 "prod_lhs", "prod_len", "action", "goto", "n_states", "n_terminals",
+                 "n_nonterminals", "follow", "expected")
+
+    def __init__(self, terminals, nonterminals, productions, action, goto, n_states, follow=None):
+        terminals = tuple(terminals)               # id -> nome do terminal
+        nonterminals = tuple(nonterminals)         # id -> nome do não-terminal
+        nonterminal_ids = {nt: i for i, nt in enumerate(nonterminals)}
+        productions = tuple((lhs, tuple(rhs)) for lhs, rhs in productions)  # id -> (lhs, rhs)
+        campos = {
+            "terminals": terminals,
+            "nonterminals": nonterminals,
+            "terminal_ids": MappingProxyType({t: i for i, t in enumerate(terminals)}),
+            "nonterminal_ids": MappingProxyType(nonterminal_ids),
+            "productions": productions,
+            "prod_lhs": tuple(nonterminal_ids[lhs] for lhs, _ in productions),
+            "prod_len": tuple(len(rhs) for _, rhs in productions),
+            "action": tuple(action),               # plana estados x terminais
+            "goto": tuple(goto),                   # plana estados x não-terminais
+            "n_states": n_states,
+            "n_terminals": len(terminals),
+            "n_nonterminals": len(nonterminals),
+            # FOLLOW de cada não-terminal como bitset de ids de terminais
+            "follow": tuple(follow) if follow is not None else (0,) * len(nonterminals),
+            # Terminais válidos em cada estado como bitset (ver esperados)
+            "expected": _esperados_por_estado(action, n_states, len(terminals)),
+        }
+        for campo, valor in campos.items():
+            object.__setattr__(self, campo, valor)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ParseTables é imutável")
+
+    def __delattr__(self, name):
+        raise AttributeError("ParseTables é imutável")
+
+    def acao(self, state, terminal):
+        """Consulta ACTION[state, terminal] pelo nome do terminal"""
+        col = self.terminal_ids.get(terminal)
+        if col is None:
+            return ERRO
+        return self.action[state * self.n_terminals + col]
+
+    def desvio(self, state, nonterminal):
+        """Consulta GOTO[state, nonterminal] pelo nome do não-terminal"""
+        return self.goto[state * self.n_nonterminals + self.nonterminal_ids[nonterminal]]
+
+    def esperados(self, state):
+        """Nomes dos terminais válidos no estado, na ordem dos ids"""
+        bits = self.expected[state]
+        return [t for i, t in enumerate(self.terminals) if bits >> i & 1]
+
+    def follow_sets(self):
+        """FOLLOW decodificado: não-terminal -> conjunto de nomes de terminais"""
+        return {nt: {t for i, t in enumerate(self.terminals) if bits >> i & 1}
+                for nt, bits in zip(self.nonterminals, self.follow)}
+
+    def __repr__(self):
+        return (f"ParseTables({self.n_states} estados, {self.n_terminals} terminais, "
+                f"{self.n_nonterminals} não-terminais, {len(self.productions)} produções)")
+
+
+def _esperados_por_estado(action, n_states, n_terminals):
+    """Bitset dos terminais com ação != erro, por estado"""
+    esperados = []
+    for state in range(n_states):
+        linha = action[state * n_terminals:(state + 1) * n_terminals]
+        esperados.append(sum(1 << t for t, acao in enumerate(linha) if acao != ERRO))
+    return tuple(esperados)
+
+
+def _normaliza_rhs(rhs):
+    """Remove marcadores de epsilon do lado direito de uma produção"""
+    return tuple(s for s in rhs if s not in EPSILON_SIMBOLOS)
+
+
+def compilar_tabelas(productions, reductions, transitions, follow, terminals, nonterminals,
+                     accept_state=1):
+    """
+    Compila as tabelas densas a partir do autômato LR(0) e dos conjuntos FOLLOW
+
+    Args:
+        productions: Lista de produções (lhs, rhs); a produção 0 deve ser S' -> S
+        reductions: Dicionário estado -> lista de ids de produções completas no estado
+        transitions: Dicionário (estado, símbolo) -> estado
+        follow: Dicionário não-terminal -> conjunto FOLLOW
+        terminals: Terminais da gramática
+        nonterminals: Não-terminais da gramática
+        accept_state: Estado que contém S' -> S .
+
+    Returns:
+        ParseTables
+
+    Raises:
+        ConflictError: Se a gramática não for SLR(1)
+    """
+    productions = [(lhs, _normaliza_rhs(rhs)) for lhs, rhs in productions]
+
+    terms = set(terminals)
+    nts = set(nonterminals)
+    for (_, symbol) in transitions:
+        if symbol not in nts and symbol not in EPSILON_SIMBOLOS:
+            terms.add(symbol)
+    terms.add("$")
+    terms = sorted(terms)
+    nts = sorted(nts | {lhs for lhs, _ in productions})
+
+    t_ids = {t: i for i, t in enumerate(terms)}
+    nt_ids = {nt: i for i, nt in enumerate(nts)}
+
+    states = {0, accept_state} | set(reductions)
+    for (state, _), target in transitions.items():
+        states.add(state)
+        states.add(target)
+    n_states = max(states) + 1
+    n_t = len(terms)
+    n_nt = len(nts)
+
+    action = [ERRO] * (n_states * n_t)
+    goto = [SEM_GOTO] * (n_states * n_nt)
+
+    # GOTO e SHIFT
+    for (state, symbol), target in transitions.items():
+        if symbol in nt_ids:
+            goto[state * n_nt + nt_ids[symbol]] = target
+        elif symbol in t_ids:
+            action[state * n_t + t_ids[symbol]] = target + 1
+
+    # REDUCE pelo FOLLOW do lado esquerdo
+    conflicts = []
+    for state, prod_ids in reductions.items():
+        for p in prod_ids:
+            lhs, _ = productions[p]
+            for t in follow.get(lhs, ()):
+                col = t_ids.get(t)
+                if col is None:
+                    continue
+                cell = state * n_t + col
+                if action[cell] != ERRO:
+                    conflicts.append((state, t, action[cell], -(p + 1)))
+                    continue
+                action[cell] = -(p + 1)
+
+    if conflicts:
+        raise ConflictError(conflicts, productions)
+
+    # Aceitação: S' -> S . com '$'
+    action[accept_state * n_t + t_ids["$"]] = -1
+
+    follow_bits = []
+    for nt in nts:
+        bits = 0
+        for t in follow.get(nt, ()):
+            if t in t_ids:
+                bits |= 1 << t_ids[t]
+        follow_bits.append(bits)
+
+    return ParseTables(terms, nts, productions, action, goto, n_states, follow_bits)
+
+
+# ============================================================================
+# SERIALIZAÇÃO BINÁRIA
+# ============================================================================
+#
+# Layout (little-endian):
+#   cabeçalho   MAGIC, versão, nº terminais, nº não-terminais, nº produções, nº estados
+#   nomes       uint32 tamanho + nomes em UTF-8 separados por '\0'
+#   produções   uint32 tamanho + int32[] (lhs, len, símbolos...); não-terminal j = n_t + j
+#   ACTION      int32[estados x terminais]
+#   GOTO        int32[estados x não-terminais]
+#   FOLLOW      bitset de (n_t + 7) // 8 bytes por não-terminal
+
+MAGIC = b"SLRT"
+VERSAO_FORMATO = 1
+_CABECALHO = struct.Struct("<4sHHHHI")
+_TAMANHO = struct.Struct("<I")
+
+
+def _int32(valores):
+    dados = array("i", valores)
+    if sys.byteorder == "big":
+        dados.byteswap()
+    return dados.tobytes()
+
+
+def _exigir(buf, inicio, tamanho):
+    """Garante que buf tenha tamanho bytes a partir de inicio"""
+    if inicio + tamanho > len(buf):
+        raise ValueError("Arquivo de tabelas truncado")
+
+
+def _ler_int32(buf, inicio, quantidade):
+    _exigir(buf, inicio, 4 * quantidade)
+    dados = array("i")
+    dados.frombytes(buf[inicio:inicio + 4 * quantidade])
+    if sys.byteorder == "big":
+        dados.byteswap()
+    return dados.tolist(), inicio + 4 * quantidade
+
+
+def serializar(tables):
+    """Codifica as tabelas no formato binário compacto"""
+    n_t = tables.n_terminals
+    nomes = "\0".join(tables.terminals + tables.nonterminals).encode("utf-8")
+
+    simbolo_id = dict(tables.terminal_ids)
+    for nt, j in tables.nonterminal_ids.items():
+        simbolo_id[nt] = n_t + j
+    prods = []
+    for lhs, rhs in tables.productions:
+        prods.append(tables.nonterminal_ids[lhs])
+        prods.append(len(rhs))
+        prods.extend(simbolo_id[s] for s in rhs)
+
+    n_bytes = (n_t + 7) // 8
+    partes = [
+        _CABECALHO.pack(MAGIC, VERSAO_FORMATO, n_t, tables.n_nonterminals,
+                        len(tables.productions), tables.n_states),
+        _TAMANHO.pack(len(nomes)), nomes,
+        _TAMANHO.pack(len(prods)), _int32(prods),
+        _int32(tables.action),
+        _int32(tables.goto),
+        b"".join(bits.to_bytes(n_bytes, "little") for bits in tables.follow),
+    ]
+    return b"".join(partes)
+
+
+def desserializar(buf):
+    """
+    Decodifica as tabelas a partir de bytes (ou memoryview) no formato binário
+
+    Cada seção é conferida contra o tamanho do buffer antes de ser lida, então
+    um arquivo truncado ou corrompido resulta sempre em ValueError.
+
+    Raises:
+        ValueError: Se o conteúdo não estiver no formato esperado
+    """
+    buf = memoryview(buf)
+    _exigir(buf, 0, _CABECALHO.size)
+    magic, versao, n_t, n_nt, n_prods, n_states = _CABECALHO.unpack_from(buf, 0)
+    if magic != MAGIC or versao != VERSAO_FORMATO:
+        raise ValueError("Formato de tabelas desconhecido")
+    pos = _CABECALHO.size
+
+    _exigir(buf, pos, _TAMANHO.size)
+    (tam,) = _TAMANHO.unpack_from(buf, pos)
+    pos += _TAMANHO.size
+    _exigir(buf, pos, tam)
+    nomes = bytes(buf[pos:pos + tam]).decode("utf-8").split("\0")
+    pos += tam
+    if len(nomes) != n_t + n_nt:
+        raise ValueError("Arquivo de tabelas com nomes inconsistentes")
+    terminals, nonterminals = nomes[:n_t], nomes[n_t:]
+    simbolos = terminals + nonterminals
+
+    _exigir(buf, pos, _TAMANHO.size)
+    (tam,) = _TAMANHO.unpack_from(buf, pos)
+    pos += _TAMANHO.size
+    prods, pos = _ler_int32(buf, pos, tam)
+    productions = []
+    i = 0
+    try:
+        if prods and min(prods) < 0:
+            raise IndexError(min(prods))
+        for _ in range(n_prods):
+            lhs, n = prods[i], prods[i + 1]
+            if i + 2 + n > len(prods):
+                raise IndexError(n)
+            productions.append((nonterminals[lhs], tuple(simbolos[s] for s in prods[i + 2:i + 2 + n])))
+            i += 2 + n
+    except IndexError:
+        raise ValueError("Arquivo de tabelas com produções inconsistentes") from None
+
+    action, pos = _ler_int32(buf, pos, n_states * n_t)
+    goto, pos = _ler_int32(buf, pos, n_states * n_nt)
+    # Alvos de SHIFT (n - 1), produções de REDUCE (-n - 1) e estados do GOTO
+    # precisam existir: senão o erro só apareceria no meio de uma análise
+    if action and not (-n_prods <= min(action) and max(action) <= n_states):
+        raise ValueError("Arquivo de tabelas com ACTION fora do intervalo")
+    if goto and not (SEM_GOTO <= min(goto) and max(goto) < n_states):
+        raise ValueError("Arquivo de tabelas com GOTO fora do intervalo")
+
+    n_bytes = (n_t + 7) // 8
+    _exigir(buf, pos, n_nt * n_bytes)
+    follow = []
+    for _ in range(n_nt):
+        bits = int.from_bytes(buf[pos:pos + n_bytes], "little")
+        if bits >> n_t:
+            raise ValueError("Arquivo de tabelas com FOLLOW fora do intervalo")
+        follow.append(bits)
+        pos += n_bytes
+    if pos != len(buf):
+        raise ValueError("Arquivo de tabelas com tamanho inesperado")
+
+    return ParseTables(terminals, nonterminals, productions, action, goto, n_states, follow)
+
+
+def salvar_binario(tables, caminho):
+    """Grava as tabelas em disco de forma atômica (arquivo temporário + rename)"""
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        f.write(serializar(tables))
+    os.replace(temporario, caminho)
+
+
+def ler_binario(caminho):
+    """Carrega as tabelas com uma única leitura do arquivo"""
+    with open(caminho, "rb") as f:
+        return desserializar(f.read())
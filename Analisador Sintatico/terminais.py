@@ -1,3 +1,4 @@
-terminals = {"LOS","FOD","FAH","JUN","KEL","FUS","HON","print","assign","HIM",
-             "id","num","NUST","+","-","ANRK","AAN","KO","(",")",":=",";","$"}
+"""Terminais da gramática, extraídos por gerador_slr de regrasSintáticas.txt"""
+from gerador_slr import carregar_gramatica
 
+terminals = set(carregar_gramatica().terminals)
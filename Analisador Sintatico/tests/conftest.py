@@ -0,0 +1,9 @@
+"""
+Configuração dos testes (pytest)
+Os módulos do analisador ficam na pasta acima desta, fora de um pacote
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,102 @@
+"""
+Programas aleatórios e execução para os testes
+Compartilhados pelos testes de dobramento, de execução e do compilador
+"""
+
+import random
+
+from bytecode import compilar_bytecode
+from interpretador import InterpretError, interpretar
+from lexer import Lexer
+from parser_integrated import SLRParserWithSemantics
+from vm import BufferIO, ExecutionError, executar
+
+
+class GeradorAleatorio:
+    """
+    Programas com declarações em corpos de LOS, FOD e FAH e, com modulos,
+    em módulos KEL (os nomes de um módulo só são usados dentro dele)
+    """
+
+    def __init__(self, semente, modulos=False):
+        self.random = random.Random(semente)
+        self.modulos = modulos
+        self.nomes = []
+        self.contador = 0
+
+    def programa(self):
+        self.nomes = []
+        self.contador = 0
+        comandos = [self.comando(0) for _ in range(self.random.randint(1, 6))]
+        comandos.append("JUN " + self.expressao())
+        return " ; ".join(comandos)
+
+    def comando(self, nivel):
+        r = self.random
+        escolha = r.randrange((8 if self.modulos else 7) if nivel < 2 else 3)
+        if escolha == 0 or not self.nomes:
+            self.contador += 1
+            nome = f"v{self.contador}"
+            valor = self.expressao()
+            self.nomes.append(nome)
+            return f"FUS {nome} := {valor}"
+        if escolha == 1:
+            return f"assign {r.choice(self.nomes)} := {self.expressao()}"
+        if escolha == 2:
+            return f"print {r.choice(self.nomes)}"
+        if escolha == 3:
+            return f"LOS {self.expressao()} {self.comando(nivel + 1)}"
+        if escolha == 4:
+            return f"FOD {self.comando(nivel + 1)} FAH 0"
+        if escolha == 5:
+            return f"FAH {self.comando(nivel + 1)} FAH {r.randint(0, 3)}"
+        if escolha == 6:
+            return f"JUN {self.expressao()}"
+        self.contador += 1
+        visiveis = len(self.nomes)
+        corpo = self.comando(nivel + 1)
+        del self.nomes[visiveis:]
+        return f"KEL m{self.contador} {corpo}"
+
+    def expressao(self):
+        r = self.random
+        termos = [self.termo() for _ in range(r.randint(1, 3))]
+        partes = [termos[0]]
+        for termo in termos[1:]:
+            partes += [r.choice(["+", "-", "ANRK", "AAN"]), termo]
+        return " ".join(partes)
+
+    def termo(self):
+        r = self.random
+        if self.nomes and r.random() < 0.5:
+            termo = r.choice(self.nomes)
+        else:
+            termo = str(r.randint(0, 5))
+        return "NUST " + termo if r.random() < 0.1 else termo
+
+
+class SaidaQuebrada(BufferIO):
+    """E/S cujas escritas sempre falham (erros de execução em print)"""
+
+    def write(self, name, value):
+        raise ValueError(f"saída fechada para '{name}'")
+
+
+def na_vm(parser, io):
+    return executar(compilar_bytecode(parser.context.tree), io)
+
+
+def no_interpretador(parser, io):
+    return interpretar(parser.context.tree, parser.symbol_table, io)
+
+
+def resultado(fonte, dobrar, motor):
+    """(valor de JUN ou 'erro', saídas de print) da execução da fonte"""
+    parser = SLRParserWithSemantics(verbose=False, fold_constants=dobrar)
+    assert parser.parse(Lexer(fonte).iter_tokens()), parser.errors
+    io = BufferIO()
+    try:
+        valor = motor(parser, io)
+    except (ExecutionError, InterpretError):
+        valor = "erro"
+    return valor, io.outputs
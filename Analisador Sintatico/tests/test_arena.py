@@ -0,0 +1,61 @@
+"""
+Testes da codificação compacta da AST (Arena)
+"""
+
+import time
+
+from ast_nodes import Arena, BinaryOp, Number, Return, Sequence
+from lexer import Lexer
+from parser_integrated import SLRParserWithSemantics
+from programas import GeradorAleatorio
+
+
+def arvore(fonte):
+    parser = SLRParserWithSemantics(verbose=False, fold_constants=False)
+    assert parser.parse(Lexer(fonte).iter_tokens())
+    return parser.context.tree
+
+
+def subarvores(tree):
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        yield node
+        pending.extend(node.children())
+
+
+def test_ida_e_volta_de_programas():
+    gerador = GeradorAleatorio(0, modulos=True)
+    for _ in range(50):
+        tree = arvore(gerador.programa())
+        arena = Arena()
+        raiz = arena.encode(tree)
+        assert arena.decode(raiz) == tree
+        # Pós-ordem: o índice de cada nó é a posição dele na codificação
+        nos = {i: arena.decode(i) for i in range(len(arena))}
+        assert sorted(map(repr, nos.values())) == sorted(map(repr, subarvores(tree)))
+
+
+def test_literais_fora_de_64_bits():
+    valores = [2 ** 63 - 1, 2 ** 63, -2 ** 63, -2 ** 63 - 1, 10 ** 40, -10 ** 40, 0]
+    tree = Sequence([Return(Number(v, line=1), line=1) for v in valores], line=1)
+    arena = Arena()
+    assert arena.decode(arena.encode(tree)) == tree
+    assert len(arena.integers) == 5
+
+
+def test_decode_so_visita_a_subarvore():
+    folhas = 10000
+    tree = Number(0, line=1)
+    for i in range(folhas):
+        tree = BinaryOp("+", tree, Number(i, line=1), line=1)
+    arena = Arena()
+    for _ in range(10):
+        arena.encode(tree)
+    ultimo = arena.encode(Number(7, line=2))
+
+    inicio = time.perf_counter()
+    for _ in range(1000):
+        assert arena.decode(ultimo) == Number(7, line=2)
+    # Decodificar a folha não pode custar o tamanho da arena (~200 mil nós)
+    assert time.perf_counter() - inicio < 1.0
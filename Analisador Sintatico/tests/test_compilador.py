@@ -0,0 +1,44 @@
+"""
+Testes do pipeline completo (CompiladorCompleto)
+Chamadas repetidas não podem herdar o estado da análise anterior
+"""
+
+from main import CompiladorCompleto, SLRParser, compile_many
+from programas import SaidaQuebrada
+from reporter import NullReporter
+from vm import BufferIO
+
+
+def test_run_repetido_analisa_do_zero():
+    compilador = CompiladorCompleto(verbose=False)
+    assert compilador.run("FUS x := 1 ; JUN x + 1", BufferIO()) == (True, 2)
+    assert compilador.run("FUS x := 1 ; JUN x + 2", BufferIO()) == (True, 3)
+    assert compilador.parser.errors == []
+
+
+def test_run_erro_de_execucao_vira_diagnostico():
+    compilador = CompiladorCompleto(verbose=False)
+    assert compilador.run("FUS x := 1 ; print x ; JUN x", SaidaQuebrada()) == (False, None)
+    assert [erro.code for erro in compilador.parser.errors] == ["X002"]
+    assert compilador.run("FUS x := 1 ; JUN x", BufferIO()) == (True, 1)
+
+
+def test_diagnosticos_semanticos_aparecem_uma_vez(capsys):
+    resultado, = compile_many(["FUS x := y ; JUN 0"], workers=1)
+    assert [erro.code for erro in resultado.erros] == ["M002"]
+    assert [aviso.code for aviso in resultado.avisos] == ["M004"]
+    
+    compilador = CompiladorCompleto(verbose=False)
+    compilador.compile("FUS x := y ; JUN 0")
+    capsys.readouterr()
+    compilador.parser.print_report()
+    relatorio = capsys.readouterr().out
+    assert relatorio.count("'y' não foi declarado") == 1
+    assert relatorio.count("'x' declarada mas não usada") == 1
+
+
+def test_passo_a_passo_verbose_vai_para_o_relator(capsys):
+    compilador = CompiladorCompleto(verbose=True, reporter=NullReporter())
+    assert compilador.compile("FUS x := 1 ; FUS y := x + ; JUN x") is False
+    SLRParser(NullReporter()).parse([("FUS", "FUS"), ("id", "x")])
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,55 @@
+"""
+Testes do dobramento de constantes
+Um programa dobrado deve executar exatamente como o original
+"""
+
+import pytest
+
+from lexer import Lexer
+from parser_integrated import SLRParserWithSemantics
+from programas import GeradorAleatorio, na_vm, no_interpretador, resultado
+
+
+@pytest.mark.parametrize("motor", [na_vm, no_interpretador])
+@pytest.mark.parametrize("fonte", [
+    "LOS 0 FUS v1 := 4 + 2 AAN 0 ; JUN v1",
+    "FAH FOD FUS v1 := 2 FAH 0 FAH 0 ; FUS v2 := 1 ANRK 2 ; JUN 5 - v2 ANRK v1 - 5",
+    "FUS x := 1 ; FAH assign x := x + 1 FAH 3 ; JUN x",
+    "FUS x := 2 ; FUS y := x + 3 ; print y ; JUN y - x",
+])
+def test_dobrado_executa_como_original(fonte, motor):
+    assert resultado(fonte, True, motor) == resultado(fonte, False, motor)
+
+
+def test_declaracao_no_topo_e_dobrada():
+    parser = SLRParserWithSemantics(verbose=False)
+    assert parser.parse(Lexer("FUS x := 2 ; FUS y := x + 3 ; JUN y").iter_tokens())
+    retorno = parser.context.tree.commands[-1]
+    assert retorno.value.value == 5
+
+
+def test_declaracao_condicional_nao_e_propagada():
+    parser = SLRParserWithSemantics(verbose=False)
+    assert parser.parse(Lexer("LOS 0 FUS x := 2 ; JUN x").iter_tokens())
+    retorno = parser.context.tree.commands[-1]
+    assert retorno.value.name == "x"
+
+
+@pytest.mark.parametrize("motor", [na_vm, no_interpretador])
+@pytest.mark.parametrize("semente", range(3))
+def test_programas_aleatorios(semente, motor):
+    gerador = GeradorAleatorio(semente)
+    for _ in range(200):
+        fonte = gerador.programa()
+        assert resultado(fonte, True, motor) == resultado(fonte, False, motor), fonte
+
+
+def test_modulo_apos_modulo_descartado_pela_recuperacao():
+    # A recuperação descarta 'KEL m1', mas o escopo de m1 continua na tabela:
+    # a declaração de m2 não pode ser dobrada no símbolo b de m1
+    parser = SLRParserWithSemantics(verbose=False)
+    fonte = "FOD KEL m1 FUS b := 1 FAH ) ; KEL m2 FUS b := 2 + 3 ; JUN 0"
+    assert not parser.parse(Lexer(fonte).iter_tokens())
+    escopos = parser.symbol_table.scopes_by_path
+    assert escopos["m1"].symbols["b"].value.value == 1
+    assert escopos["m2"].symbols["b"].value.value == 5
@@ -0,0 +1,53 @@
+"""
+Testes de execução
+A máquina virtual e o interpretador da AST devem ter a mesma semântica
+"""
+
+import pytest
+
+from interpretador import InterpretError, interpretar
+from lexer import Lexer
+from main import CompiladorCompleto
+from parser_integrated import SLRParserWithSemantics
+from programas import GeradorAleatorio, SaidaQuebrada, na_vm, no_interpretador, resultado
+from vm import BufferIO
+
+
+@pytest.mark.parametrize("fonte", [
+    "LOS 0 FUS v1 := 4 ; JUN v1",
+    "LOS 0 FUS v1 := 4 ; print v1 ; JUN 0",
+    "LOS 0 FUS v1 := 4 ; JUN v1 + 1",
+    "FUS x := 3 ; FAH assign x := x - 1 FAH x ; JUN x",
+    "FUS x := 1 ; KEL m FUS y := x + 1 ; JUN x",
+])
+def test_vm_e_interpretador_equivalentes(fonte):
+    assert resultado(fonte, False, na_vm) == resultado(fonte, False, no_interpretador)
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_programas_aleatorios(semente):
+    gerador = GeradorAleatorio(semente, modulos=True)
+    for _ in range(200):
+        fonte = gerador.programa()
+        assert resultado(fonte, False, na_vm) == resultado(fonte, False, no_interpretador), fonte
+
+
+@pytest.mark.parametrize("fonte, io, linha", [
+    ("FUS x := 1 ;\nLOS 0 FUS y := 2 ;\nJUN x + y", BufferIO(), 3),
+    ("FUS x := 1 ;\nFAH print x FAH 2 ;\nJUN x", SaidaQuebrada(), 2),
+])
+def test_erro_de_execucao_traz_a_linha_do_comando(fonte, io, linha):
+    parser = SLRParserWithSemantics(verbose=False)
+    assert parser.parse(Lexer(fonte).iter_tokens())
+    with pytest.raises(InterpretError) as erro:
+        interpretar(parser.context.tree, parser.symbol_table, io)
+    assert erro.value.line == linha
+
+
+def test_interpret_repetido_analisa_do_zero():
+    compilador = CompiladorCompleto(verbose=False)
+    assert compilador.interpret("FUS x := 1 ; JUN x + 1", BufferIO()) == (True, 2)
+    assert compilador.interpret("FUS x := 1 ; JUN x + 2", BufferIO()) == (True, 3)
+    assert compilador.interpret("FUS x := 1 ; print x ; JUN x", SaidaQuebrada()) == (False, None)
+    erro, = compilador.parser.errors
+    assert (erro.code, erro.line) == ("X001", 1)
@@ -0,0 +1,70 @@
+"""
+Testes da reanálise incremental
+Depois de cada edição, a sessão deve estar como numa compilação completa
+"""
+
+import random
+
+import pytest
+
+from incremental import SessaoIncremental
+from main import PDALexerAdapter
+from parser_integrated import SLRParserWithSemantics, ParseContext
+
+PALAVRAS = ["FUS", "x", "y", "z", ":=", "1", "2", "+", "-", ";", "KEL", "m", "assign",
+            "print", "JUN", "HIM", ".", "(", ")", "#", "NUST", "LOS", "FOD", "FAH", "HON",
+            "ANRK"]
+COMANDOS = ["FUS x := 1", "FUS y := x + 2", "assign x := y", "print x", "JUN x",
+            "KEL m FUS z := x", "FUS z := 3 #", "LOS x assign y := 1"]
+
+LEXER = PDALexerAdapter()
+
+
+def completa(fonte):
+    parser = SLRParserWithSemantics(verbose=False, fold_constants=False)
+    context = ParseContext()
+    return parser.parse(LEXER.iter_tokens(fonte), context), context
+
+
+def estado(ok, context):
+    return ok, context.errors, context.warnings, context.tree, context.symbol_table.snapshot()
+
+
+def tokens(lista):
+    return [(t.type, t.lexeme, t.line, t.column, t.offset) for t in lista]
+
+
+def fontes(gerador, quantidade):
+    for n in range(quantidade):
+        if n % 2:
+            yield " ; ".join(gerador.choice(COMANDOS) for _ in range(gerador.randint(1, 8)))
+        else:
+            yield " ".join(gerador.choice(PALAVRAS + [";"] * 3)
+                           for _ in range(gerador.randint(1, 25)))
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_edicoes_equivalem_a_compilacao_completa(semente):
+    gerador = random.Random(semente)
+    for fonte in fontes(gerador, 600):
+        sessao = SessaoIncremental(LEXER)
+        assert estado(sessao.compile(fonte), sessao.context) == estado(*completa(fonte))
+        for _ in range(6):
+            inicio = gerador.randint(0, len(sessao.source))
+            fim = gerador.randint(inicio, min(len(sessao.source),
+                                              inicio + gerador.choice([0, 0, 1, 3, 8])))
+            texto = gerador.choice(["", " ", gerador.choice(PALAVRAS),
+                                    f" {gerador.choice(PALAVRAS)} ",
+                                    " ; " + gerador.choice(COMANDOS), "#", "x"])
+            ok = sessao.edit(inicio, fim, texto)
+            assert estado(ok, sessao.context) == estado(*completa(sessao.source)), sessao.source
+            assert tokens(sessao.tokens) == tokens(LEXER.iter_tokens(sessao.source))
+            # O k-ésimo checkpoint é o do k-ésimo ';' (ver SessaoIncremental.edit)
+            assert len(sessao.context.checkpoints) == len(sessao.semicolons), sessao.source
+
+
+def test_edicao_fora_da_fonte():
+    sessao = SessaoIncremental(LEXER)
+    sessao.compile("FUS x := 1")
+    with pytest.raises(ValueError):
+        sessao.edit(5, 100, "")
@@ -0,0 +1,73 @@
+"""
+Testes da recuperação de erros sintáticos
+Cada ';' da entrada deve gerar exatamente um checkpoint, com ou sem erros
+"""
+
+import random
+
+import pytest
+
+from lexer import Lexer
+from main import PDALexerAdapter
+from parser_integrated import SLRParserWithSemantics, ParseContext, ParseCheckpoints
+
+PALAVRAS = ["FUS", "x", "y", ":=", "1", "2", "+", "-", ";", ";", "KEL", "m", "assign",
+            "print", "JUN", "HIM", ".", "(", ")", "#", "NUST", "LOS", "FOD", "FAH",
+            "HON", "ANRK", "AAN"]
+
+
+def tokens_lexer(fonte):
+    return Lexer(fonte).iter_tokens()
+
+
+def tokens_pda(fonte):
+    return PDALexerAdapter().iter_tokens(fonte)
+
+
+def analisar(fonte, tokens=tokens_lexer):
+    """Análise completa com checkpoints; retorna (sucesso, contexto)"""
+    parser = SLRParserWithSemantics(verbose=False, fold_constants=False)
+    context = ParseContext()
+    context.checkpoints = ParseCheckpoints()
+    ok = parser.parse(tokens(fonte), context)
+    return ok, context
+
+
+def pontos_e_virgulas(fonte, tokens=tokens_lexer):
+    return sum(token.type == ";" for token in tokens(fonte))
+
+
+def fontes_aleatorias(semente, quantidade, tamanho=12):
+    gerador = random.Random(semente)
+    for _ in range(quantidade):
+        yield " ".join(gerador.choice(PALAVRAS) for _ in range(gerador.randint(1, tamanho)))
+
+
+@pytest.mark.parametrize("fonte", [
+    "FOD LOS 1 FUS x := ) ; JUN 1 ; JUN 2",
+    "FUS x := 1 FUS y := 2 ; JUN x ; JUN y",
+    "FUS x := ( 1 ; print x ; JUN x",
+    "LOS x FUS y := ; FAH ; JUN 0",
+    "; ; ;",
+])
+def test_um_checkpoint_por_ponto_e_virgula(fonte):
+    ok, context = analisar(fonte)
+    assert not ok
+    assert len(context.checkpoints) == pontos_e_virgulas(fonte)
+
+
+@pytest.mark.parametrize("tokens", [tokens_lexer, tokens_pda])
+@pytest.mark.parametrize("semente", range(4))
+def test_recuperacao_nunca_descarta_ponto_e_virgula(semente, tokens):
+    for fonte in fontes_aleatorias(semente, 300):
+        ok, context = analisar(fonte, tokens)
+        assert len(context.checkpoints) == pontos_e_virgulas(fonte, tokens), fonte
+        if not ok:
+            assert context.errors, fonte
+
+
+def test_retomada_reporta_o_token_rejeitado():
+    ok, context = analisar("FOD LOS 1 FUS x := ) ; JUN 1 ; JUN 2")
+    assert not ok
+    assert [erro.code for erro in context.errors] == ["S001"]
+    assert context.errors[0].args[0] == ")"
@@ -0,0 +1,78 @@
+"""
+Testes da serialização das tabelas SLR(1)
+O formato binário deve reproduzir as tabelas e rejeitar arquivos danificados
+"""
+
+import pytest
+
+from gerador_slr import carregar_gramatica, tabelas_em_cache
+from parser_integrated import TABELAS
+from tabelas import _CABECALHO, _TAMANHO, desserializar, serializar
+
+CAMPOS = ("terminals", "nonterminals", "productions", "action", "goto", "follow",
+          "expected")
+
+
+@pytest.fixture(scope="module")
+def dados():
+    return serializar(carregar_gramatica().tables)
+
+
+def test_ida_e_volta(dados):
+    tables = carregar_gramatica().tables
+    lidas = desserializar(dados)
+    for campo in CAMPOS:
+        assert tuple(getattr(lidas, campo)) == tuple(getattr(tables, campo)), campo
+    assert lidas.n_states == tables.n_states
+    assert serializar(lidas) == dados
+
+
+def test_tabelas_do_parser_vem_do_cache(dados):
+    assert serializar(TABELAS) == dados
+
+
+def test_arquivo_truncado_levanta_value_error(dados):
+    for tamanho in range(len(dados)):
+        with pytest.raises(ValueError):
+            desserializar(dados[:tamanho])
+
+
+def test_arquivo_com_sobra_levanta_value_error(dados):
+    with pytest.raises(ValueError):
+        desserializar(dados + b"\0")
+
+
+def inicio_action(dados):
+    """Posição da seção ACTION no formato binário"""
+    pos = _CABECALHO.size
+    for _ in range(2):
+        (tam,) = _TAMANHO.unpack_from(dados, pos)
+        pos += _TAMANHO.size + (tam if pos == _CABECALHO.size else 4 * tam)
+    return pos
+
+
+@pytest.mark.parametrize("entrada", [0, 1, 100])
+def test_byte_trocado_na_action_levanta_value_error(dados, entrada):
+    # Byte mais significativo (little-endian) de uma entrada int32
+    pos = inicio_action(dados) + 4 * entrada + 3
+    danificado = bytearray(dados)
+    danificado[pos] ^= 0x40
+    with pytest.raises(ValueError, match="ACTION"):
+        desserializar(bytes(danificado))
+
+
+def test_byte_trocado_no_goto_levanta_value_error(dados):
+    tables = carregar_gramatica().tables
+    pos = inicio_action(dados) + 4 * len(tables.action) + 3
+    danificado = bytearray(dados)
+    danificado[pos] ^= 0x40
+    with pytest.raises(ValueError, match="GOTO"):
+        desserializar(bytes(danificado))
+
+
+def test_cache_truncado_e_regenerado(tmp_path, dados):
+    tables = tabelas_em_cache(diretorio=str(tmp_path))
+    arquivo, = tmp_path.iterdir()
+    arquivo.write_bytes(arquivo.read_bytes()[:20])
+    assert serializar(tabelas_em_cache(diretorio=str(tmp_path))) == serializar(tables) == dados
+    assert arquivo.read_bytes() == dados
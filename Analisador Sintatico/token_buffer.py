@@ -0,0 +1,70 @@
+"""
+Fita de Tokens Colunar
+Armazena tokens em colunas paralelas de array('i') que referenciam a fonte original
+
+Cada token ocupa 20 bytes (tipo, início, tamanho, linha, coluna) em vez de
+um objeto Token; lexemas e objetos Token só são criados quando acessados.
+"""
+
+from array import array
+
+from parser_integrated import Token, TOKEN_TYPES, token_type_id
+
+
+class TokenBuffer:
+    """Fita de tokens em colunas paralelas (struct-of-arrays)"""
+
+    def __init__(self, source):
+        self.source = source          # Fonte original (str)
+        self.kinds = array('i')       # Tipo do token internado (ver token_type_id)
+        self.starts = array('i')      # Posição inicial do lexema na fonte
+        self.lengths = array('i')     # Tamanho do lexema (0 para tokens sintéticos, ex: '$')
+        self.lines = array('i')       # Linha no código fonte
+        self.columns = array('i')     # Coluna no código fonte
+
+    def append(self, token_type, start, length, line, column=0):
+        """Acrescenta um token à fita"""
+        kind = token_type if isinstance(token_type, int) else token_type_id(token_type)
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.lengths.append(length)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def type(self, i):
+        """Nome do tipo do i-ésimo token"""
+        return TOKEN_TYPES[self.kinds[i]]
+
+    def lexeme(self, i):
+        """Lexema do i-ésimo token (fatiado da fonte sob demanda)"""
+        length = self.lengths[i]
+        if not length:
+            return TOKEN_TYPES[self.kinds[i]]
+        start = self.starts[i]
+        return self.source[start:start + length]
+
+    def __getitem__(self, i):
+        """Materializa o i-ésimo token como objeto Token"""
+        if i < 0:
+            i += len(self.kinds)
+        lexeme = self.lexeme(i)
+        kind = self.kinds[i]
+        value = int(lexeme) if TOKEN_TYPES[kind] == "num" else lexeme
+        return Token(TOKEN_TYPES[kind], lexeme, self.lines[i], self.columns[i], value,
+                     self.starts[i])
+
+    def __iter__(self):
+        """Gera os tokens um a um; cada Token vive só enquanto for referenciado"""
+        for i in range(len(self.kinds)):
+            yield self[i]
+
+    def nbytes(self):
+        """Memória ocupada pelas colunas (sem contar a fonte)"""
+        return sum(col.itemsize * len(col) for col in
+                   (self.kinds, self.starts, self.lengths, self.lines, self.columns))
+
+    def __repr__(self):
+        return f"TokenBuffer({len(self)} tokens, {self.nbytes()} bytes)"
@@ -0,0 +1,140 @@
+"""
+Máquina Virtual de Pilha
+Executa o bytecode gerado por bytecode.py
+
+A E/S (HON / print) passa por um objeto plugável com read(nome) e
+write(nome, valor): ConsoleIO usa input()/print(), BufferIO lê de uma lista
+de entradas e acumula as saídas em memória (execução em lote, testes).
+"""
+
+from bytecode import (LOAD_CONST, LOAD, STORE, ADD, SUB, AND, OR, NOT, IN,
+                      JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, FOR_ITER, INPUT, PRINT,
+                      RETURN, HALT)
+from operacoes import contem
+
+
+class ExecutionError(Exception):
+    """Erro durante a execução do programa"""
+    def __init__(self, message, pc):
+        self.message = message
+        self.pc = pc
+        super().__init__(f"Erro de execução (pc {pc}): {message}")
+
+
+class ConsoleIO:
+    """E/S pelo console"""
+
+    def read(self, name):
+        return int(input(f"{name}? "))
+
+    def write(self, name, value):
+        print(f"{name} = {value}")
+
+
+class BufferIO:
+    """E/S em memória: entradas de uma lista, saídas acumuladas em outputs"""
+
+    def __init__(self, inputs=()):
+        self.inputs = iter(inputs)
+        self.outputs = []             # (nome, valor) na ordem de escrita
+
+    def read(self, name):
+        try:
+            return next(self.inputs)
+        except StopIteration:
+            raise EOFError(f"sem entrada para '{name}'") from None
+
+    def write(self, name, value):
+        self.outputs.append((name, value))
+
+
+def executar(program, io=None):
+    """
+    Executa um Program e retorna o valor de JUN (None se terminar sem JUN)
+
+    Args:
+        program: bytecode.Program
+        io: Objeto de E/S (padrão: ConsoleIO)
+    """
+    if io is None:
+        io = ConsoleIO()
+    read = io.read
+    write = io.write
+
+    code = program.code.tolist()      # Indexar lista é mais rápido que array
+    consts = program.consts
+    names = program.slot_names
+    slots = [None] * len(names)
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    pc = 0
+
+    try:
+        # Laço de despacho: opcodes mais frequentes primeiro (ADD, SUB, AND e
+        # OR repetem operacoes.DOBRAVEIS sem a chamada de função)
+        while True:
+            op = code[pc]
+            if op == LOAD:
+                push(slots[code[pc + 1]])
+                pc += 2
+            elif op == LOAD_CONST:
+                push(consts[code[pc + 1]])
+                pc += 2
+            elif op == STORE:
+                slots[code[pc + 1]] = pop()
+                pc += 2
+            elif op == ADD:
+                b = pop()
+                stack[-1] += b
+                pc += 1
+            elif op == SUB:
+                b = pop()
+                stack[-1] -= b
+                pc += 1
+            elif op == JUMP_IF_FALSE:
+                pc = code[pc + 1] if not pop() else pc + 2
+            elif op == JUMP_IF_TRUE:
+                pc = code[pc + 1] if pop() else pc + 2
+            elif op == JUMP:
+                pc = code[pc + 1]
+            elif op == FOR_ITER:
+                slot = code[pc + 1]
+                if slots[slot] <= 0:
+                    pc = code[pc + 2]
+                else:
+                    slots[slot] -= 1
+                    pc += 3
+            elif op == AND:
+                b = pop()
+                stack[-1] = int(bool(stack[-1]) and bool(b))
+                pc += 1
+            elif op == OR:
+                b = pop()
+                stack[-1] = int(bool(stack[-1]) or bool(b))
+                pc += 1
+            elif op == NOT:
+                stack[-1] = int(not stack[-1])
+                pc += 1
+            elif op == IN:
+                b = pop()
+                stack[-1] = contem(stack[-1], b)
+                pc += 1
+            elif op == INPUT:
+                slot = code[pc + 1]
+                slots[slot] = read(names[slot])
+                pc += 2
+            elif op == PRINT:
+                slot = code[pc + 1]
+                write(names[slot], slots[slot])
+                pc += 2
+            elif op == RETURN:
+                return pop()
+            elif op == HALT:
+                return None
+            else:
+                raise ExecutionError(f"opcode inválido {op}", pc)
+    except ExecutionError:
+        raise
+    except (TypeError, IndexError, EOFError, ValueError) as e:
+        raise ExecutionError(str(e), pc) from e